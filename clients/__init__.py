@@ -1,6 +1,9 @@
-from .authentication.authentication_client import AuthenticationClient
-from .courses.courses_client import CoursesClient
-from .exercises.exercises_client import ExercisesClient
-from .files.files_client import FilesClient
-from .users.public_users_client import PublicUsersClient
-from .users.private_users_client import PrivateUsersClient
+from .authentication.authentication_client import (
+    AsyncAuthenticationClient,
+    AuthenticationClient,
+)
+from .courses.courses_client import AsyncCoursesClient, CoursesClient
+from .exercises.exercises_client import AsyncExercisesClient, ExercisesClient
+from .files.files_client import AsyncFilesClient, FilesClient
+from .users.public_users_client import AsyncPublicUsersClient, PublicUsersClient
+from .users.private_users_client import AsyncPrivateUsersClient, PrivateUsersClient
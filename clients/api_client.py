@@ -1,7 +1,33 @@
-from typing import Any
+from typing import Any, Self
 
-import allure
-from httpx import Client, Response, QueryParams, URL
+from httpx import AsyncClient, Client, Response, QueryParams, URL
+
+from clients.api_latency import endpoint_latencies
+from clients.api_response import ApiResponse
+from clients.created_entities import track_entity_changes
+from clients.schema_validation import validate_response_schema
+from tools.allure.steps import step
+
+
+def handle_response(response: Response, owner: Any = None) -> ApiResponse:
+    """
+    Функция записывает задержку ответа, оборачивает его в ApiResponse,
+    обновляет реестр созданных сущностей для удаления и проверяет ответ
+    по JSON-схеме эндпоинта.
+
+    Args:
+        response (Response): Прочитанный ответ сервера.
+        owner (Any): Данные пользователя клиента, от имени которого
+            удаляется созданная сущность.
+
+    Returns:
+        ApiResponse: Ответ с однократным разбором тела.
+    """
+    endpoint_latencies.record(response)
+    api_response = ApiResponse(response)
+    track_entity_changes(api_response, owner)
+    validate_response_schema(api_response)
+    return api_response
 
 
 class ApiClient:
@@ -15,8 +41,16 @@ class ApiClient:
         """
         self.client = client
 
-    @allure.step("Отправляем GET-запрос на {url}")
-    def get(self, url: URL | str, params: QueryParams | None = None) -> Response:
+    @property
+    def user(self) -> Any:
+        """
+        Объект-свойство с данными пользователя, от имени которого клиент
+        выполняет запросы, или None для публичного клиента.
+        """
+        return getattr(self.client.auth, "user", None)
+
+    @step("Отправляем GET-запрос на {url}")
+    def get(self, url: URL | str, params: QueryParams | None = None) -> ApiResponse:
         """Отправляет HTTP GET-запрос на указанный URL.
 
         Args:
@@ -24,18 +58,117 @@ class ApiClient:
             params (QueryParams | None, optional): Параметры запроса. Defaults to None.
 
         Returns:
-            Response: Ответ сервера в виде объекта Response.
+            ApiResponse: Ответ сервера с однократным разбором тела.
         """
-        return self.client.get(url=url, params=params)
+        response = self.client.get(url=url, params=params)
+        return handle_response(response)
 
-    @allure.step("Отправляем POST-запрос на {url}")
+    @step("Отправляем POST-запрос на {url}")
     def post(
         self,
         url: URL | str,
         json: Any | None = None,
         data: Any | None = None,
         files: Any | None = None,
-    ) -> Response:
+    ) -> ApiResponse:
+        """Отправляет HTTP POST-запрос на указанный URL.
+
+        Args:
+            url (URL | str): Адрес, по которому выполняется запрос.
+            json: Any | None: Данные в формате JSON.
+            data: RequestData | None: Форматированные данные формы (например, application/x-www-form-urlencoded).
+            files: RequestFile | None: Файлы для загрузки на сервер.
+        Returns:
+            ApiResponse: Ответ сервера с однократным разбором тела.
+        """
+        response = self.client.post(url=url, json=json, data=data, files=files)
+        return handle_response(response, self.user)
+
+    @step("Отправляем PATCH-запрос на {url}")
+    def patch(self, url: URL | str, json: Any | None = None) -> ApiResponse:
+        """Отправляет HTTP PATCH-запрос на указанный URL.
+
+        Args:
+            url (URL | str): Адрес, по которому выполняется запрос.
+            json: Данные для обновления в формате JSON.
+
+        Returns:
+            ApiResponse: Ответ сервера с однократным разбором тела.
+        """
+        response = self.client.patch(url=url, json=json)
+        return handle_response(response)
+
+    @step("Отправляем DELETE-запрос на {url}")
+    def delete(self, url: URL | str) -> ApiResponse:
+        """Отправляет HTTP DELETE-запрос на указанный URL.
+
+        Args:
+            url (URL | str): Адрес, по которому выполняется запрос.
+
+        Returns:
+            ApiResponse: Ответ сервера с однократным разбором тела.
+        """
+        response = self.client.delete(url=url)
+        return handle_response(response)
+
+
+class AsyncApiClient:
+    """Асинхронный клиент для взаимодействия с внешним API через HTTP-запросы.
+
+    Повторяет интерфейс ApiClient, но работает поверх httpx.AsyncClient, что
+    позволяет выполнять независимые запросы конкурентно через asyncio.gather.
+    """
+
+    def __init__(self, client: AsyncClient):
+        """Инициализирует объект AsyncApiClient.
+
+        Args:
+            client (AsyncClient): Асинхронный HTTP-клиент для отправки запросов.
+        """
+        self.client = client
+
+    @property
+    def user(self) -> Any:
+        """
+        Объект-свойство с данными пользователя, от имени которого клиент
+        выполняет запросы, или None для публичного клиента.
+        """
+        return getattr(self.client.auth, "user", None)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Закрывает HTTP-клиент и освобождает его соединения."""
+        await self.client.aclose()
+
+    @step("Отправляем GET-запрос на {url}")
+    async def get(
+        self, url: URL | str, params: QueryParams | None = None
+    ) -> ApiResponse:
+        """Отправляет HTTP GET-запрос на указанный URL.
+
+        Args:
+            url (URL | str): Адрес, по которому выполняется запрос.
+            params (QueryParams | None, optional): Параметры запроса. Defaults to None.
+
+        Returns:
+            ApiResponse: Ответ сервера с однократным разбором тела.
+        """
+        response = await self.client.get(url=url, params=params)
+        return handle_response(response)
+
+    @step("Отправляем POST-запрос на {url}")
+    async def post(
+        self,
+        url: URL | str,
+        json: Any | None = None,
+        data: Any | None = None,
+        files: Any | None = None,
+    ) -> ApiResponse:
         """Отправляет HTTP POST-запрос на указанный URL.
 
         Args:
@@ -44,12 +177,13 @@ class ApiClient:
             data: RequestData | None: Форматированные данные формы (например, application/x-www-form-urlencoded).
             files: RequestFile | None: Файлы для загрузки на сервер.
         Returns:
-            Response: Ответ сервера в виде объекта Response.
+            ApiResponse: Ответ сервера с однократным разбором тела.
         """
-        return self.client.post(url=url, json=json, data=data, files=files)
+        response = await self.client.post(url=url, json=json, data=data, files=files)
+        return handle_response(response, self.user)
 
-    @allure.step("Отправляем PATCH-запрос на {url}")
-    def patch(self, url: URL | str, json: Any | None = None) -> Response:
+    @step("Отправляем PATCH-запрос на {url}")
+    async def patch(self, url: URL | str, json: Any | None = None) -> ApiResponse:
         """Отправляет HTTP PATCH-запрос на указанный URL.
 
         Args:
@@ -57,18 +191,20 @@ class ApiClient:
             json: Данные для обновления в формате JSON.
 
         Returns:
-            Response: Ответ сервера в виде объекта Response.
+            ApiResponse: Ответ сервера с однократным разбором тела.
         """
-        return self.client.patch(url=url, json=json)
+        response = await self.client.patch(url=url, json=json)
+        return handle_response(response)
 
-    @allure.step("Отправляем DELETE-запрос на {url}")
-    def delete(self, url: URL | str) -> Response:
+    @step("Отправляем DELETE-запрос на {url}")
+    async def delete(self, url: URL | str) -> ApiResponse:
         """Отправляет HTTP DELETE-запрос на указанный URL.
 
         Args:
             url (URL | str): Адрес, по которому выполняется запрос.
 
         Returns:
-            Response: Ответ сервера в виде объекта Response.
+            ApiResponse: Ответ сервера с однократным разбором тела.
         """
-        return self.client.delete(url=url)
+        response = await self.client.delete(url=url)
+        return handle_response(response)
@@ -1,3 +1,107 @@
+import functools
+import inspect
+from contextvars import ContextVar
+from typing import Awaitable, Callable
+
+from httpx import Response
 from swagger_coverage_tool import SwaggerCoverageTracker
+from swagger_coverage_tool.src.tracker.models import EndpointCoverage
+
+_route_template: ContextVar[str | None] = ContextVar("route_template", default=None)
+
+
+def get_route_template() -> str | None:
+    """
+    Функция возвращает шаблон маршрута swagger для текущего вызова клиента.
+
+    Шаблон выставляется методами, обёрнутыми tracker.track_coverage_httpx,
+    на время их выполнения. Вне таких методов возвращается None.
+
+    Returns:
+        str | None: Шаблон маршрута (например, "/api/v1/courses/{course_id}").
+    """
+    return _route_template.get()
+
+
+class CoverageTracker(SwaggerCoverageTracker):
+    """
+    Трекер покрытия swagger, умеющий оборачивать асинхронные методы клиентов.
+
+    Attrs:
+        enabled (bool): Сохранять ли покрытие. Отключается для служебных
+            прогонов, например наполнения сервера данными (tools.seed).
+    """
+
+    enabled: bool = True
+
+    def build_endpoint_coverage_for_httpx(
+        self, endpoint: str, response: Response
+    ) -> EndpointCoverage | None:
+        """
+        Собирает покрытие эндпоинта по ответу httpx, если трекер включён.
+
+        Args:
+            endpoint (str): Шаблон маршрута из swagger.
+            response (Response): Ответ сервера.
+
+        Returns:
+            EndpointCoverage | None: Покрытие эндпоинта или None, если трекер
+                отключён и покрытие сохранять не нужно.
+        """
+        if not self.enabled:
+            return None
+
+        return super().build_endpoint_coverage_for_httpx(endpoint, response)
+
+    def track_coverage_httpx(self, endpoint: str):
+        """
+        Декоратор, фиксирующий покрытие эндпоинта по ответу httpx.
+
+        Для синхронных функций используется реализация SwaggerCoverageTracker,
+        для корутин покрытие сохраняется после получения ответа. На время вызова
+        шаблон маршрута доступен через get_route_template.
+
+        Args:
+            endpoint (str): Шаблон маршрута из swagger (например, "/api/v1/courses/{course_id}").
+        """
+        sync_wrapper = super().track_coverage_httpx(endpoint)
+
+        def wrapper(func: Callable[..., Awaitable[Response]]):
+            signature = inspect.signature(func)
+
+            if not inspect.iscoroutinefunction(func):
+                tracked = sync_wrapper(func)
+
+                @functools.wraps(func)
+                def sync_inner(*args, **kwargs) -> Response:
+                    token = _route_template.set(endpoint)
+                    try:
+                        return tracked(*args, **kwargs)
+                    finally:
+                        _route_template.reset(token)
+
+                sync_inner.__signature__ = signature
+                return sync_inner
+
+            @functools.wraps(func)
+            async def inner(*args, **kwargs) -> Response:
+                token = _route_template.set(endpoint)
+                try:
+                    response = await func(*args, **kwargs)
+                finally:
+                    _route_template.reset(token)
+
+                if coverage := self.build_endpoint_coverage_for_httpx(
+                    endpoint, response
+                ):
+                    self.storage.save(coverage)
+
+                return response
+
+            inner.__signature__ = signature
+            return inner
+
+        return wrapper
+
 
-tracker = SwaggerCoverageTracker(service="api-course")
+tracker = CoverageTracker(service="api-course")
@@ -0,0 +1,154 @@
+import csv
+import json
+import threading
+from pathlib import Path
+from typing import Any, Self
+
+from httpx import Response
+
+from clients.api_coverage import get_route_template
+from config import settings
+from tools.histogram import LatencyHistogram
+
+PERCENTILES = (50, 95, 99)
+
+
+class EndpointLatencies:
+    """
+    Гистограммы задержек вызовов ApiClient по HTTP-методу и шаблону маршрута.
+
+    Задержка берётся из response.elapsed, то есть от отправки запроса до
+    чтения ответа, без учёта фикстур и проверок теста. Вызовы вне методов
+    с track_coverage_httpx группируются по пути запроса.
+    """
+
+    def __init__(self, accuracy: float):
+        """
+        Args:
+            accuracy (float): Относительная погрешность перцентилей гистограмм.
+        """
+        self.accuracy = accuracy
+        self._lock = threading.Lock()
+        self._histograms: dict[tuple[str, str], LatencyHistogram] = {}
+
+    def __len__(self) -> int:
+        return len(self._histograms)
+
+    def record(self, response: Response) -> None:
+        """
+        Записывает задержку ответа в гистограмму его маршрута.
+
+        Args:
+            response (Response): Прочитанный ответ сервера.
+        """
+        key = (
+            response.request.method,
+            get_route_template() or response.request.url.path,
+        )
+        with self._lock:
+            if key not in self._histograms:
+                self._histograms[key] = LatencyHistogram(self.accuracy)
+            self._histograms[key].record(response.elapsed.total_seconds())
+
+    def merge(self, other: Self) -> None:
+        """
+        Добавляет гистограммы другого набора (например, другого воркера).
+
+        Args:
+            other (EndpointLatencies): Набор гистограмм с той же точностью.
+        """
+        with self._lock:
+            for key, histogram in other._histograms.items():
+                if key not in self._histograms:
+                    self._histograms[key] = LatencyHistogram(self.accuracy)
+                self._histograms[key].merge(histogram)
+
+    def summary(self) -> list[dict[str, Any]]:
+        """
+        Возвращает перцентили задержек по маршрутам в миллисекундах.
+
+        Returns:
+            list[dict[str, Any]]: Строки сводки, отсортированные по маршруту и методу.
+        """
+        with self._lock:
+            histograms = sorted(
+                self._histograms.items(), key=lambda item: (item[0][1], item[0][0])
+            )
+
+        return [
+            {
+                "method": method,
+                "route": route,
+                "count": histogram.count,
+                "mean_ms": round(histogram.mean * 1000, 2),
+                **{
+                    f"p{percent}_ms": round(histogram.percentile(percent) * 1000, 2)
+                    for percent in PERCENTILES
+                },
+                "max_ms": round(histogram.max * 1000, 2),
+            }
+            for (method, route), histogram in histograms
+        ]
+
+    def dump(self, path: Path) -> None:
+        """
+        Сохраняет гистограммы в JSON-файл.
+
+        Args:
+            path (Path): Путь к файлу.
+        """
+        with self._lock:
+            data = [
+                {"method": method, "route": route, "histogram": histogram.to_dict()}
+                for (method, route), histogram in self._histograms.items()
+            ]
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path, accuracy: float) -> Self:
+        """
+        Загружает гистограммы, сохранённые через dump.
+
+        Args:
+            path (Path): Путь к файлу.
+            accuracy (float): Точность гистограмм.
+
+        Returns:
+            EndpointLatencies: Набор загруженных гистограмм.
+        """
+        latencies = cls(accuracy)
+        for item in json.loads(path.read_text(encoding="utf-8")):
+            key = (item["method"], item["route"])
+            latencies._histograms[key] = LatencyHistogram.from_dict(item["histogram"])
+        return latencies
+
+    def write_summary(self, json_path: Path, csv_path: Path) -> None:
+        """
+        Записывает сводку перцентилей в JSON и CSV.
+
+        Args:
+            json_path (Path): Путь к JSON-файлу сводки.
+            csv_path (Path): Путь к CSV-файлу сводки.
+        """
+        summary = self.summary()
+        json_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+
+        with csv_path.open("w", newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(
+                file,
+                fieldnames=[
+                    "method",
+                    "route",
+                    "count",
+                    "mean_ms",
+                    *(f"p{percent}_ms" for percent in PERCENTILES),
+                    "max_ms",
+                ],
+            )
+            writer.writeheader()
+            writer.writerows(summary)
+
+
+endpoint_latencies = EndpointLatencies(accuracy=settings.LATENCY_REPORT.ACCURACY)
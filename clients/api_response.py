@@ -0,0 +1,84 @@
+import json
+from typing import Any, TypeVar
+
+from httpx import Response
+from pydantic import BaseModel
+
+from config import settings
+from tools.type_adapters import validate_json
+
+T = TypeVar("T", bound=BaseModel)
+
+_NOT_PARSED = object()
+
+
+class ApiResponse:
+    """
+    Ответ API с однократным разбором тела.
+
+    Тело разбирается лениво из response.content (без декодирования в str)
+    при первом обращении к json() или model(), после чего JSON-объект и
+    провалидированные модели кешируются. Проверка по JSON-схеме и валидация
+    pydantic-моделью используют один и тот же разобранный объект.
+
+    При settings.PARSING.STRICT модель валидируется строго, напрямую из байтов
+    закешированным TypeAdapter, без промежуточного JSON-объекта.
+
+    Остальные атрибуты (status_code, headers, request, text и т.д.)
+    делегируются исходному httpx.Response.
+
+    Attrs:
+        response (Response): Исходный ответ httpx.
+    """
+
+    __slots__ = ("response", "_json", "_models")
+
+    def __init__(self, response: Response):
+        """
+        Args:
+            response (Response): Прочитанный ответ сервера.
+        """
+        self.response = response
+        self._json: Any = _NOT_PARSED
+        self._models: dict[type[BaseModel], BaseModel] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.response, name)
+
+    def __repr__(self) -> str:
+        return f"<ApiResponse [{self.response.status_code}]>"
+
+    def json(self) -> Any:
+        """
+        Возвращает тело ответа, разобранное как JSON. Разбор выполняется один раз.
+
+        Returns:
+            Any: JSON-объект тела ответа.
+        """
+        if self._json is _NOT_PARSED:
+            self._json = json.loads(self.response.content)
+
+        return self._json
+
+    def model(self, model_class: type[T]) -> T:
+        """
+        Возвращает тело ответа, провалидированное моделью. Результат кешируется
+        по классу модели.
+
+        Args:
+            model_class (type[T]): Класс pydantic-модели ответа.
+
+        Returns:
+            T: Экземпляр модели.
+
+        Raises:
+            ValidationError: Если тело ответа не соответствует модели.
+        """
+        if model_class not in self._models:
+            if settings.PARSING.STRICT:
+                model = validate_json(self.response.content, model_class, strict=True)
+            else:
+                model = model_class.model_validate(self.json())
+            self._models[model_class] = model
+
+        return self._models[model_class]
@@ -1,8 +1,9 @@
-import allure
-from httpx import Response
-
-from clients.api_client import ApiClient
-from clients.public_http_builder import get_public_http_client
+from clients.api_client import ApiClient, AsyncApiClient
+from clients.api_response import ApiResponse
+from clients.public_http_builder import (
+    get_async_public_http_client,
+    get_public_http_client,
+)
 
 from clients.authentication.authentication_schema import (
     LoginRequestSchema,
@@ -10,38 +11,39 @@ from clients.authentication.authentication_schema import (
     RefreshRequestSchema,
 )
 from clients.api_coverage import tracker
+from tools.allure.steps import step
 from tools.routes.api_routes import APIRoutes
 
 
 class AuthenticationClient(ApiClient):
     """Клиент для взаимодействия с эндпоинтами аутентификации API."""
 
-    @allure.step("Проходим аутентификацию")
+    @step("Проходим аутентификацию")
     @tracker.track_coverage_httpx(f"{APIRoutes.AUTHENTICATION.base_url}/login")
-    def login_api(self, request: LoginRequestSchema) -> Response:
+    def login_api(self, request: LoginRequestSchema) -> ApiResponse:
         """Отправляет запрос на аутентификацию пользователя.
 
         Args:
             request (LoginRequestSchema): Данные для входа в систему (логин/пароль и т.д.).
 
         Returns:
-            Response: Ответ сервера после выполнения запроса на аутентификацию.
+            ApiResponse: Ответ сервера после выполнения запроса на аутентификацию.
         """
         return self.post(
             f"{APIRoutes.AUTHENTICATION.base_url}/login",
             json=request.model_dump(by_alias=True),
         )
 
-    @allure.step("Обновляем токен")
+    @step("Обновляем токен")
     @tracker.track_coverage_httpx(f"{APIRoutes.AUTHENTICATION.base_url}/refresh")
-    def refresh_api(self, request: RefreshRequestSchema) -> Response:
+    def refresh_api(self, request: RefreshRequestSchema) -> ApiResponse:
         """Обновляет токен доступа пользователя.
 
         Args:
             request (RefreshRequestSchema): Данные для обновления токена (refresh token и т.д.).
 
         Returns:
-            Response: Ответ сервера с новым токеном доступа.
+            ApiResponse: Ответ сервера с новым токеном доступа.
         """
         return self.post(
             f"{APIRoutes.AUTHENTICATION.base_url}/refresh",
@@ -60,7 +62,57 @@ class AuthenticationClient(ApiClient):
                 информацию о результате аутентификации и токенах.
         """
         response = self.login_api(request)
-        return LoginResponseSchema.model_validate_json(response.text)
+        return response.model(LoginResponseSchema)
+
+
+class AsyncAuthenticationClient(AsyncApiClient):
+    """Асинхронный клиент для взаимодействия с эндпоинтами аутентификации API."""
+
+    @step("Проходим аутентификацию")
+    @tracker.track_coverage_httpx(f"{APIRoutes.AUTHENTICATION.base_url}/login")
+    async def login_api(self, request: LoginRequestSchema) -> ApiResponse:
+        """Отправляет запрос на аутентификацию пользователя.
+
+        Args:
+            request (LoginRequestSchema): Данные для входа в систему (логин/пароль и т.д.).
+
+        Returns:
+            ApiResponse: Ответ сервера после выполнения запроса на аутентификацию.
+        """
+        return await self.post(
+            f"{APIRoutes.AUTHENTICATION.base_url}/login",
+            json=request.model_dump(by_alias=True),
+        )
+
+    @step("Обновляем токен")
+    @tracker.track_coverage_httpx(f"{APIRoutes.AUTHENTICATION.base_url}/refresh")
+    async def refresh_api(self, request: RefreshRequestSchema) -> ApiResponse:
+        """Обновляет токен доступа пользователя.
+
+        Args:
+            request (RefreshRequestSchema): Данные для обновления токена (refresh token и т.д.).
+
+        Returns:
+            ApiResponse: Ответ сервера с новым токеном доступа.
+        """
+        return await self.post(
+            f"{APIRoutes.AUTHENTICATION.base_url}/refresh",
+            json=request.model_dump(by_alias=True),
+        )
+
+    async def login(self, request: LoginRequestSchema) -> LoginResponseSchema:
+        """Выполняет аутентификацию пользователя и возвращает обработанный JSON-ответ.
+
+        Args:
+            request (LoginRequestSchema): Учетные данные для входа в систему
+                (email и пароль пользователя).
+
+        Returns:
+            LoginResponseSchema: Сериализованный JSON-ответ сервера, содержащий
+                информацию о результате аутентификации и токенах.
+        """
+        response = await self.login_api(request)
+        return response.model(LoginResponseSchema)
 
 
 def get_authentication_client() -> AuthenticationClient:
@@ -71,3 +123,14 @@ def get_authentication_client() -> AuthenticationClient:
         AuthenticationClient: Экземпляр AuthenticationClient с настроенным HTTP-клиентом.
     """
     return AuthenticationClient(client=get_public_http_client())
+
+
+def get_async_authentication_client() -> AsyncAuthenticationClient:
+    """
+    Функция создаёт экземпляр AsyncAuthenticationClient с уже настроенным HTTP-клиентом.
+
+    Returns:
+        AsyncAuthenticationClient: Экземпляр AsyncAuthenticationClient
+            с настроенным асинхронным HTTP-клиентом.
+    """
+    return AsyncAuthenticationClient(client=get_async_public_http_client())
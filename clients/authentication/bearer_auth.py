@@ -0,0 +1,131 @@
+import asyncio
+import threading
+from http import HTTPStatus
+from typing import AsyncGenerator, Generator
+
+from httpx import Auth, Request, Response
+
+from clients.api_response import ApiResponse
+from clients.authentication.authentication_client import (
+    get_async_authentication_client,
+    get_authentication_client,
+)
+from clients.authentication.authentication_schema import (
+    AuthenticationUserSchema,
+    LoginResponseSchema,
+    RefreshRequestSchema,
+    TokenSchema,
+)
+from clients.authentication.token_store import get_token_store
+from tools.logger import get_logger
+
+
+logger = get_logger("BEARER_AUTH")
+
+
+class BearerAuth(Auth):
+    """
+    Авторизация запросов bearer-токеном конкретного пользователя.
+
+    Заголовок Authorization выставляется на каждый запрос, поэтому клиенты
+    разных пользователей могут работать поверх одного пула соединений.
+
+    Если сервер ответил 401, токен один раз обновляется через
+    /authentication/refresh и запрос повторяется с новым токеном.
+    Обновление выполняется под блокировкой: конкурентные запросы, получившие
+    401 на один и тот же токен, дожидаются одного общего обновления.
+
+    Attrs:
+        user (AuthenticationUserSchema): Пользователь, которому принадлежит токен.
+        access_token (str): Токен доступа пользователя.
+        refresh_token (str | None): Токен обновления пользователя.
+    """
+
+    def __init__(
+        self,
+        user: AuthenticationUserSchema,
+        access_token: str,
+        refresh_token: str | None = None,
+    ):
+        self.user = user
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+
+        self._sync_lock = threading.Lock()
+        self._async_lock = asyncio.Lock()
+
+    def sync_auth_flow(self, request: Request) -> Generator[Request, Response, None]:
+        access_token = self._authorize(request)
+        response = yield request
+
+        if not self._is_token_rejected(response):
+            return
+
+        with self._sync_lock:
+            if self.access_token == access_token:
+                self._update_token(self._refresh())
+
+        if self.access_token != access_token:
+            self._authorize(request)
+            yield request
+
+    async def async_auth_flow(
+        self, request: Request
+    ) -> AsyncGenerator[Request, Response]:
+        access_token = self._authorize(request)
+        response = yield request
+
+        if not self._is_token_rejected(response):
+            return
+
+        async with self._async_lock:
+            if self.access_token == access_token:
+                self._update_token(await self._async_refresh())
+
+        if self.access_token != access_token:
+            self._authorize(request)
+            yield request
+
+    def _authorize(self, request: Request) -> str:
+        access_token = self.access_token
+        request.headers["Authorization"] = f"Bearer {access_token}"
+        return access_token
+
+    def _is_token_rejected(self, response: Response) -> bool:
+        return (
+            response.status_code == HTTPStatus.UNAUTHORIZED
+            and self.refresh_token is not None
+        )
+
+    def _refresh(self) -> TokenSchema | None:
+        logger.info(f"Обновляем токен пользователя {self.user.email}")
+        request = RefreshRequestSchema(refresh_token=self.refresh_token)
+        response = get_authentication_client().refresh_api(request)
+        return self._parse_refresh_response(response)
+
+    async def _async_refresh(self) -> TokenSchema | None:
+        logger.info(f"Обновляем токен пользователя {self.user.email}")
+        request = RefreshRequestSchema(refresh_token=self.refresh_token)
+        async with get_async_authentication_client() as authentication_client:
+            response = await authentication_client.refresh_api(request)
+        return self._parse_refresh_response(response)
+
+    def _parse_refresh_response(self, response: ApiResponse) -> TokenSchema | None:
+        if response.status_code != HTTPStatus.OK:
+            logger.warning(
+                f"Не удалось обновить токен пользователя {self.user.email}: "
+                f"{response.status_code} {response.text}"
+            )
+            return None
+
+        return response.model(LoginResponseSchema).token
+
+    def _update_token(self, token: TokenSchema | None) -> None:
+        if token is None:
+            return
+
+        self.access_token = token.access_token
+        self.refresh_token = token.refresh_token
+
+        if token_store := get_token_store():
+            token_store.put(self.user.email, token)
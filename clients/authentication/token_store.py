@@ -0,0 +1,164 @@
+import base64
+import json
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+from clients.authentication.authentication_schema import TokenSchema
+from config import settings
+from tools.file_lock import file_lock
+from tools.logger import get_logger
+
+
+logger = get_logger("TOKEN_STORE")
+
+
+class StoredTokenSchema(BaseModel):
+    """
+    Описание структуры токенов пользователя в файловом хранилище.
+
+    Attrs:
+        access_token (str): Токен доступа.
+        refresh_token (str): Токен обновления.
+        access_expires_at (float): Время истечения токена доступа (unix time).
+        refresh_expires_at (float): Время истечения токена обновления (unix time).
+    """
+
+    access_token: str
+    refresh_token: str
+    access_expires_at: float
+    refresh_expires_at: float
+
+
+class TokenStore:
+    """
+    Файловое хранилище токенов, общее для всех xdist-воркеров на хосте.
+
+    Токены хранятся в JSON-файле по email пользователя. Запись выполняется
+    под межпроцессной блокировкой и атомарной заменой файла, поэтому чтение
+    не требует блокировки.
+    """
+
+    def __init__(self, path: Path, expiry_margin: float, default_ttl: float):
+        """
+        Args:
+            path (Path): Путь к JSON-файлу хранилища.
+            expiry_margin (float): Запас в секундах, при котором токен
+                считается уже истёкшим.
+            default_ttl (float): Время жизни токена, если его не удалось
+                определить из JWT.
+        """
+        self.path = path
+        self.lock_path = path.with_suffix(path.suffix + ".lock")
+        self.expiry_margin = expiry_margin
+        self.default_ttl = default_ttl
+
+    def get(self, email: str) -> StoredTokenSchema | None:
+        """
+        Возвращает действующие токены пользователя.
+
+        Args:
+            email (str): Email пользователя.
+
+        Returns:
+            StoredTokenSchema | None: Токены, если токен доступа ещё действует.
+        """
+        entry = self._read().get(email)
+        if entry is None:
+            return None
+
+        try:
+            token = StoredTokenSchema.model_validate(entry)
+        except ValidationError:
+            return None
+
+        if token.access_expires_at - self.expiry_margin <= time.time():
+            return None
+
+        return token
+
+    def put(self, email: str, token: TokenSchema) -> StoredTokenSchema:
+        """
+        Сохраняет токены пользователя.
+
+        Args:
+            email (str): Email пользователя.
+            token (TokenSchema): Токены из ответа login/refresh.
+
+        Returns:
+            StoredTokenSchema: Сохранённая запись.
+        """
+        now = time.time()
+        stored = StoredTokenSchema(
+            access_token=token.access_token,
+            refresh_token=token.refresh_token,
+            access_expires_at=get_jwt_expiry(token.access_token)
+            or now + self.default_ttl,
+            refresh_expires_at=get_jwt_expiry(token.refresh_token)
+            or now + self.default_ttl,
+        )
+
+        with file_lock(self.lock_path):
+            entries = {
+                key: value
+                for key, value in self._read().items()
+                if value.get("refresh_expires_at", 0) > now
+            }
+            entries[email] = stored.model_dump()
+            self._write(entries)
+
+        return stored
+
+    def _read(self) -> dict[str, dict]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write(self, entries: dict[str, dict]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(f"{self.path.suffix}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(entries), encoding="utf-8")
+        os.replace(temp_path, self.path)
+
+
+def get_jwt_expiry(token: str) -> float | None:
+    """
+    Функция извлекает время истечения (claim exp) из JWT без проверки подписи.
+
+    Args:
+        token (str): JWT-токен.
+
+    Returns:
+        float | None: Время истечения токена или None, если его не удалось определить.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_token_store() -> TokenStore | None:
+    """
+    Функция возвращает хранилище токенов процесса.
+
+    Returns:
+        TokenStore | None: Хранилище токенов или None, если оно отключено
+            в settings.TOKEN_STORE.
+    """
+    if not settings.TOKEN_STORE.ENABLED:
+        return None
+
+    logger.info(f"Используем хранилище токенов: {settings.TOKEN_STORE.FILE}")
+    return TokenStore(
+        path=settings.TOKEN_STORE.FILE,
+        expiry_margin=settings.TOKEN_STORE.EXPIRY_MARGIN,
+        default_ttl=settings.TOKEN_STORE.DEFAULT_TTL,
+    )
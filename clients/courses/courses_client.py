@@ -1,8 +1,9 @@
-import allure
-from httpx import Response
-
-from clients.api_client import ApiClient
-from clients.private_http_builder import get_private_http_client
+from clients.api_client import ApiClient, AsyncApiClient
+from clients.api_response import ApiResponse
+from clients.private_http_builder import (
+    get_async_private_http_client,
+    get_private_http_client,
+)
 from clients.api_coverage import tracker
 from clients.authentication.authentication_schema import AuthenticationUserSchema
 from clients.courses.courses_schema import (
@@ -11,60 +12,61 @@ from clients.courses.courses_schema import (
     CourseResponseSchema,
     UpdateCourseRequestSchema,
 )
+from tools.allure.steps import step
 from tools.routes.api_routes import APIRoutes
 
 
 class CoursesClient(ApiClient):
     """Клиент для взаимодействия с эндпоинтами API управления курсами."""
 
-    @allure.step("Получаем список курсов")
+    @step("Получаем список курсов")
     @tracker.track_coverage_httpx(APIRoutes.COURSES.base_url)
-    def get_courses_api(self, params: GetCoursesQuerySchema) -> Response:
+    def get_courses_api(self, params: GetCoursesQuerySchema) -> ApiResponse:
         """Получает список курсов с возможностью фильтрации и сортировки.
 
         Args:
             params (GetCoursesQuerySchema): Параметры запроса для фильтрации.
 
         Returns:
-            Response: Ответ сервера со списком курсов.
+            ApiResponse: Ответ сервера со списком курсов.
         """
         return self.get(
             APIRoutes.COURSES.base_url, params=params.model_dump(by_alias=True)
         )
 
-    @allure.step("Получаем информацию о курсе по course_id")
+    @step("Получаем информацию о курсе по course_id")
     @tracker.track_coverage_httpx(f"{APIRoutes.COURSES.base_url}/{{course_id}}")
-    def get_course_api(self, course_id: str) -> Response:
+    def get_course_api(self, course_id: str) -> ApiResponse:
         """Получает информацию о конкретном курсе по его идентификатору.
 
         Args:
             course_id (str): Уникальный идентификатор курса.
 
         Returns:
-            Response: Ответ сервера с данными о запрошенном курсе.
+            ApiResponse: Ответ сервера с данными о запрошенном курсе.
         """
         return self.get(APIRoutes.COURSES.with_id(course_id))
 
-    @allure.step("Создаем курс")
+    @step("Создаем курс")
     @tracker.track_coverage_httpx(APIRoutes.COURSES.base_url)
-    def create_course_api(self, request: CreateCourseRequestSchema) -> Response:
+    def create_course_api(self, request: CreateCourseRequestSchema) -> ApiResponse:
         """Создает новый курс на сервере.
 
         Args:
             request (CreateCourseRequestSchema): Данные для создания курса.
 
         Returns:
-            Response: Ответ сервера после создания курса.
+            ApiResponse: Ответ сервера после создания курса.
         """
         return self.post(
             APIRoutes.COURSES.base_url, json=request.model_dump(by_alias=True)
         )
 
-    @allure.step("Обновляем курс по course_id")
+    @step("Обновляем курс по course_id")
     @tracker.track_coverage_httpx(f"{APIRoutes.COURSES.base_url}/{{course_id}}")
     def update_course_api(
         self, course_id: str, request: UpdateCourseRequestSchema
-    ) -> Response:
+    ) -> ApiResponse:
         """Обновляет информацию о курсе по его идентификатору.
 
         Args:
@@ -73,22 +75,22 @@ class CoursesClient(ApiClient):
                 Только указанные поля будут изменены.
 
         Returns:
-            Response: Ответ сервера после обновления данных курса.
+            ApiResponse: Ответ сервера после обновления данных курса.
         """
         return self.patch(
             APIRoutes.COURSES.with_id(course_id), json=request.model_dump(by_alias=True)
         )
 
-    @allure.step("Удаляем курс по course_id")
+    @step("Удаляем курс по course_id")
     @tracker.track_coverage_httpx(f"{APIRoutes.COURSES.base_url}/{{course_id}}")
-    def delete_course_api(self, course_id: str) -> Response:
+    def delete_course_api(self, course_id: str) -> ApiResponse:
         """Удаляет курс с сервера по его идентификатору.
 
         Args:
             course_id (str): Уникальный идентификатор курса.
 
         Returns:
-            Response: Ответ сервера подтверждающий удаление курса.
+            ApiResponse: Ответ сервера подтверждающий удаление курса.
         """
         return self.delete(APIRoutes.COURSES.with_id(course_id))
 
@@ -104,7 +106,104 @@ class CoursesClient(ApiClient):
 
         """
         response = self.create_course_api(request)
-        return CourseResponseSchema.model_validate_json(response.text)
+        return response.model(CourseResponseSchema)
+
+
+class AsyncCoursesClient(AsyncApiClient):
+    """Асинхронный клиент для взаимодействия с эндпоинтами API управления курсами."""
+
+    @step("Получаем список курсов")
+    @tracker.track_coverage_httpx(APIRoutes.COURSES.base_url)
+    async def get_courses_api(self, params: GetCoursesQuerySchema) -> ApiResponse:
+        """Получает список курсов с возможностью фильтрации и сортировки.
+
+        Args:
+            params (GetCoursesQuerySchema): Параметры запроса для фильтрации.
+
+        Returns:
+            ApiResponse: Ответ сервера со списком курсов.
+        """
+        return await self.get(
+            APIRoutes.COURSES.base_url, params=params.model_dump(by_alias=True)
+        )
+
+    @step("Получаем информацию о курсе по course_id")
+    @tracker.track_coverage_httpx(f"{APIRoutes.COURSES.base_url}/{{course_id}}")
+    async def get_course_api(self, course_id: str) -> ApiResponse:
+        """Получает информацию о конкретном курсе по его идентификатору.
+
+        Args:
+            course_id (str): Уникальный идентификатор курса.
+
+        Returns:
+            ApiResponse: Ответ сервера с данными о запрошенном курсе.
+        """
+        return await self.get(APIRoutes.COURSES.with_id(course_id))
+
+    @step("Создаем курс")
+    @tracker.track_coverage_httpx(APIRoutes.COURSES.base_url)
+    async def create_course_api(
+        self, request: CreateCourseRequestSchema
+    ) -> ApiResponse:
+        """Создает новый курс на сервере.
+
+        Args:
+            request (CreateCourseRequestSchema): Данные для создания курса.
+
+        Returns:
+            ApiResponse: Ответ сервера после создания курса.
+        """
+        return await self.post(
+            APIRoutes.COURSES.base_url, json=request.model_dump(by_alias=True)
+        )
+
+    @step("Обновляем курс по course_id")
+    @tracker.track_coverage_httpx(f"{APIRoutes.COURSES.base_url}/{{course_id}}")
+    async def update_course_api(
+        self, course_id: str, request: UpdateCourseRequestSchema
+    ) -> ApiResponse:
+        """Обновляет информацию о курсе по его идентификатору.
+
+        Args:
+            course_id (str): Уникальный идентификатор курса.
+            request (UpdateCourseRequestSchema): Данные для обновления курса.
+                Только указанные поля будут изменены.
+
+        Returns:
+            ApiResponse: Ответ сервера после обновления данных курса.
+        """
+        return await self.patch(
+            APIRoutes.COURSES.with_id(course_id), json=request.model_dump(by_alias=True)
+        )
+
+    @step("Удаляем курс по course_id")
+    @tracker.track_coverage_httpx(f"{APIRoutes.COURSES.base_url}/{{course_id}}")
+    async def delete_course_api(self, course_id: str) -> ApiResponse:
+        """Удаляет курс с сервера по его идентификатору.
+
+        Args:
+            course_id (str): Уникальный идентификатор курса.
+
+        Returns:
+            ApiResponse: Ответ сервера подтверждающий удаление курса.
+        """
+        return await self.delete(APIRoutes.COURSES.with_id(course_id))
+
+    async def create_course(
+        self, request: CreateCourseRequestSchema
+    ) -> CourseResponseSchema:
+        """
+        Создает новый курс на сервере.
+
+        Args:
+            request (CreateCourseRequestSchema): Данные для создания курса.
+
+        Returns:
+            CourseResponseSchema: Ответ сервера после создания курса.
+
+        """
+        response = await self.create_course_api(request)
+        return response.model(CourseResponseSchema)
 
 
 def get_courses_client(user: AuthenticationUserSchema) -> CoursesClient:
@@ -115,3 +214,16 @@ def get_courses_client(user: AuthenticationUserSchema) -> CoursesClient:
         CoursesClient: Экземпляр CoursesClient с авторизованным HTTP-клиентом.
     """
     return CoursesClient(client=get_private_http_client(user))
+
+
+async def get_async_courses_client(
+    user: AuthenticationUserSchema,
+) -> AsyncCoursesClient:
+    """
+    Функция создаёт экземпляр AsyncCoursesClient с уже настроенным HTTP-клиентом.
+
+    Returns:
+        AsyncCoursesClient: Экземпляр AsyncCoursesClient с авторизованным
+            асинхронным HTTP-клиентом.
+    """
+    return AsyncCoursesClient(client=await get_async_private_http_client(user))
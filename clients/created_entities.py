@@ -0,0 +1,113 @@
+import json
+from http import HTTPStatus
+from typing import Any
+
+from clients.api_coverage import get_route_template
+from clients.api_response import ApiResponse
+from clients.authentication.authentication_schema import AuthenticationUserSchema
+from clients.response_schemas import COURSE, EXERCISE, FILE, USER
+from tools.cleanup_registry import cleanup_registry
+from tools.routes.api_routes import APIRoutes
+
+# Маршруты создания сущностей: шаблон маршрута POST-запроса ->
+# (тип сущности, ключ объекта сущности в теле ответа).
+CREATE_ROUTES = {
+    APIRoutes.USERS.base_url: ("users", "user"),
+    APIRoutes.FILES.base_url: ("files", "file"),
+    APIRoutes.COURSES.base_url: ("courses", "course"),
+    APIRoutes.EXERCISES.base_url: ("exercises", "exercise"),
+}
+
+# Маршруты сущностей с идентификатором: шаблон маршрута -> тип сущности.
+RESOURCE_KINDS = {
+    USER: "users",
+    FILE: "files",
+    COURSE: "courses",
+    EXERCISE: "exercises",
+}
+
+
+def track_entity_changes(response: ApiResponse, owner: Any) -> None:
+    """
+    Функция обновляет cleanup_registry по успешному ответу ApiClient.
+
+    Созданная POST-запросом сущность записывается, удалённая DELETE-запросом
+    исключается из удаления, а после изменения email пользователя
+    PATCH-запросом данные для входа обновляются у всех сущностей, которые
+    удаляются от его имени.
+
+    Args:
+        response (ApiResponse): Ответ сервера.
+        owner (Any): Данные пользователя клиента, выполнившего запрос.
+    """
+    if not cleanup_registry.enabled or response.status_code not in (
+        HTTPStatus.OK,
+        HTTPStatus.NO_CONTENT,
+    ):
+        return
+
+    match response.request.method:
+        case "POST":
+            register_created_entity(response, owner)
+        case "DELETE":
+            if kind := RESOURCE_KINDS.get(get_route_template()):
+                entity_id = response.request.url.path.rsplit("/", 1)[-1]
+                cleanup_registry.unregister(kind, entity_id)
+        case "PATCH" if get_route_template() == USER:
+            update_user_owner(response)
+
+
+def register_created_entity(response: ApiResponse, owner: Any) -> None:
+    """
+    Функция записывает в cleanup_registry сущность, созданную запросом.
+
+    Вызывается из track_entity_changes до проверки по JSON-схеме, поэтому
+    записываются сущности, созданные и методами create_*, и методами *_api,
+    в том числе при несоответствии ответа схеме. Пользователь удаляется от
+    своего имени, поэтому данные для входа берутся из тела запроса.
+
+    Args:
+        response (ApiResponse): Ответ сервера.
+        owner (Any): Данные пользователя клиента, выполнившего запрос.
+    """
+    if response.status_code != HTTPStatus.OK:
+        return
+
+    entity = CREATE_ROUTES.get(get_route_template())
+    if entity is None:
+        return
+
+    kind, key = entity
+    try:
+        entity_id = response.json()[key]["id"]
+        if kind == "users":
+            request = json.loads(response.request.content)
+            owner = AuthenticationUserSchema(
+                email=request["email"], password=request["password"]
+            )
+    except (ValueError, KeyError, TypeError):
+        # Некорректное тело ответа покажет проверка по JSON-схеме.
+        return
+
+    cleanup_registry.register(kind, entity_id, owner)
+
+
+def update_user_owner(response: ApiResponse) -> None:
+    """
+    Функция обновляет email пользователя в данных для входа, от имени
+    которых удаляются он сам и созданные им сущности.
+
+    Args:
+        response (ApiResponse): Ответ на PATCH-запрос изменения пользователя.
+    """
+    try:
+        user = response.json()["user"]
+        user_id, email = user["id"], user["email"]
+    except (ValueError, KeyError, TypeError):
+        return
+
+    owner = cleanup_registry.get_owner("users", user_id)
+    if owner is not None and owner.email != email:
+        cleanup_registry.replace_owner(
+            owner, AuthenticationUserSchema(email=email, password=owner.password)
+        )
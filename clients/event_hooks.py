@@ -1,8 +1,12 @@
 import allure
 from httpx import Request, Response
 
+from clients.request_timing import RequestPhaseTrace
+from config import settings
 from tools.http.curl import make_curl_request
+from tools.http.exchanges import http_exchanges
 from tools.logger import get_logger
+from tools.recording import is_recorded
 
 
 logger = get_logger("HTTP_CLIENT")
@@ -12,12 +16,34 @@ def curl_event_hook(request: Request) -> None:
     """
     Записывает cURL команду в Allure.
 
+    Режим задаётся settings.REPORTING.CURL_ATTACHMENTS: в режиме on_failure
+    запрос только сохраняется в буфер теста, а cURL формируется и
+    прикладывается, если тест упал. Запросы внутри not_recorded не
+    записываются.
+
     Args:
         request (Request): Запрос, который будет выполнен.
     """
-    curl_command = make_curl_request(request=request)
+    if not is_recorded():
+        return
+
+    match settings.REPORTING.CURL_ATTACHMENTS:
+        case "always":
+            curl_command = make_curl_request(request=request)
+            allure.attach(curl_command, "cURL command", allure.attachment_type.TEXT)
+        case "on_failure":
+            http_exchanges.add_request(request)
 
-    allure.attach(curl_command, "cURL command", allure.attachment_type.TEXT)
+
+def buffer_response_event_hook(response: Response) -> None:
+    """
+    Сохраняет ответ в буфер теста рядом с его запросом.
+
+    Args:
+        response (Response): Полученный ответ.
+    """
+    if settings.REPORTING.CURL_ATTACHMENTS == "on_failure" and is_recorded():
+        http_exchanges.add_response(response)
 
 
 def log_request_event_hook(request: Request) -> None:
@@ -28,3 +54,52 @@ def log_response_event_hook(response: Response) -> None:
     logger.info(
         f"Получаем ответ: {response.status_code} {response.reason_phrase} от {response.url}"
     )
+
+
+def timing_event_hook(request: Request) -> None:
+    """
+    Подключает к запросу сбор времени фаз через trace-расширение httpx.
+
+    Время установки соединения, TLS, отправки, ожидания первого байта и
+    чтения тела сохраняется по шаблону маршрута в phase_timings.
+
+    Args:
+        request (Request): Запрос, который будет выполнен.
+    """
+    request.extensions["trace"] = RequestPhaseTrace(
+        request, request.extensions.get("trace")
+    )
+
+
+async def async_curl_event_hook(request: Request) -> None:
+    """
+    Асинхронная версия curl_event_hook для httpx.AsyncClient.
+
+    Args:
+        request (Request): Запрос, который будет выполнен.
+    """
+    curl_event_hook(request)
+
+
+async def async_buffer_response_event_hook(response: Response) -> None:
+    buffer_response_event_hook(response)
+
+
+async def async_log_request_event_hook(request: Request) -> None:
+    log_request_event_hook(request)
+
+
+async def async_log_response_event_hook(response: Response) -> None:
+    log_response_event_hook(response)
+
+
+async def async_timing_event_hook(request: Request) -> None:
+    """
+    Асинхронная версия timing_event_hook для httpx.AsyncClient.
+
+    Args:
+        request (Request): Запрос, который будет выполнен.
+    """
+    request.extensions["trace"] = RequestPhaseTrace(
+        request, request.extensions.get("trace")
+    ).atrace
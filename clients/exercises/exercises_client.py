@@ -1,7 +1,5 @@
-import allure
-from httpx import Response
-
-from clients.api_client import ApiClient
+from clients.api_client import ApiClient, AsyncApiClient
+from clients.api_response import ApiResponse
 from clients.api_coverage import tracker
 from clients.authentication.authentication_schema import AuthenticationUserSchema
 from clients.exercises.exercises_schema import (
@@ -11,44 +9,48 @@ from clients.exercises.exercises_schema import (
     UpdateExerciseRequestSchema,
     ExerciseResponseSchema,
 )
-from clients.private_http_builder import get_private_http_client
+from clients.private_http_builder import (
+    get_async_private_http_client,
+    get_private_http_client,
+)
+from tools.allure.steps import step
 from tools.routes.api_routes import APIRoutes
 
 
 class ExercisesClient(ApiClient):
     """Клиент для взаимодействия с эндпоинтами API управления упражнениями."""
 
-    @allure.step("Получаем список упражнений")
+    @step("Получаем список упражнений")
     @tracker.track_coverage_httpx(APIRoutes.EXERCISES.base_url)
-    def get_exercises_api(self, params: GetExercisesQuerySchema) -> Response:
+    def get_exercises_api(self, params: GetExercisesQuerySchema) -> ApiResponse:
         """Получает список упражнений с возможностью фильтрации.
 
         Args:
             params (GetExercisesQueryDict): Параметры запроса для фильтрации.
 
         Returns:
-            Response: Ответ сервера со списком упражнений.
+            ApiResponse: Ответ сервера со списком упражнений.
         """
         return self.get(
             APIRoutes.EXERCISES.base_url, params=params.model_dump(by_alias=True)
         )
 
-    @allure.step("Получаем информацию об упражнении")
+    @step("Получаем информацию об упражнении")
     @tracker.track_coverage_httpx(f"{APIRoutes.EXERCISES.base_url}/{{exercise_id}}")
-    def get_exercise_api(self, exercise_id: str) -> Response:
+    def get_exercise_api(self, exercise_id: str) -> ApiResponse:
         """Получает информацию о конкретном упражнении по его идентификатору.
 
         Args:
             exercise_id (str): Уникальный идентификатор упражнения.
 
         Returns:
-            Response: Ответ сервера с данными о запрошенном упражнении.
+            ApiResponse: Ответ сервера с данными о запрошенном упражнении.
         """
         return self.get(APIRoutes.EXERCISES.with_id(exercise_id))
 
-    @allure.step("Создаем упражнение")
+    @step("Создаем упражнение")
     @tracker.track_coverage_httpx(APIRoutes.EXERCISES.base_url)
-    def create_exercise_api(self, request: CreateExerciseRequestSchema) -> Response:
+    def create_exercise_api(self, request: CreateExerciseRequestSchema) -> ApiResponse:
         """Создает новое упражнение на сервере.
 
         Args:
@@ -56,17 +58,17 @@ class ExercisesClient(ApiClient):
                 включая название, описание и другие параметры.
 
         Returns:
-            Response: Ответ сервера после создания упражнения.
+            ApiResponse: Ответ сервера после создания упражнения.
         """
         return self.post(
             APIRoutes.EXERCISES.base_url, json=request.model_dump(by_alias=True)
         )
 
-    @allure.step("Обновляем упражнение")
+    @step("Обновляем упражнение")
     @tracker.track_coverage_httpx(f"{APIRoutes.EXERCISES.base_url}/{{exercise_id}}")
     def update_exercise_api(
         self, exercise_id: str, request: UpdateExerciseRequestSchema
-    ) -> Response:
+    ) -> ApiResponse:
         """Обновляет информацию об упражнении по его идентификатору.
 
         Args:
@@ -75,23 +77,23 @@ class ExercisesClient(ApiClient):
                 Только указанные поля будут изменены.
 
         Returns:
-            Response: Ответ сервера после обновления данных упражнения.
+            ApiResponse: Ответ сервера после обновления данных упражнения.
         """
         return self.patch(
             APIRoutes.EXERCISES.with_id(exercise_id),
             json=request.model_dump(by_alias=True),
         )
 
-    @allure.step("Удаляем упражнение")
+    @step("Удаляем упражнение")
     @tracker.track_coverage_httpx(f"{APIRoutes.EXERCISES.base_url}/{{exercise_id}}")
-    def delete_exercise_api(self, exercise_id: str) -> Response:
+    def delete_exercise_api(self, exercise_id: str) -> ApiResponse:
         """Удаляет упражнение с сервера по его идентификатору.
 
         Args:
             exercise_id (str): Уникальный идентификатор упражнения.
 
         Returns:
-            Response: Ответ сервера подтверждающий удаление упражнения.
+            ApiResponse: Ответ сервера подтверждающий удаление упражнения.
         """
         return self.delete(APIRoutes.EXERCISES.with_id(exercise_id))
 
@@ -105,7 +107,7 @@ class ExercisesClient(ApiClient):
             GetExercisesResponseDict: Ответ сервера со списком упражнений.
         """
         response = self.get_exercises_api(params=params.model_dump(by_alias=True))
-        return GetExercisesResponseSchema.model_validate_json(response.text)
+        return response.model(GetExercisesResponseSchema)
 
     def create_exercise(
         self, request: CreateExerciseRequestSchema
@@ -119,7 +121,7 @@ class ExercisesClient(ApiClient):
             ExerciseResponseDict: Ответ сервера после создания упражнения.
         """
         response = self.create_exercise_api(request)
-        return ExerciseResponseSchema.model_validate_json(response.text)
+        return response.model(ExerciseResponseSchema)
 
     def get_exercise(self, exercise_id: str) -> ExerciseResponseSchema:
         """
@@ -130,7 +132,7 @@ class ExercisesClient(ApiClient):
             ExerciseResponseDict: Ответ сервера с данными о запрошенном упражнении.
         """
         response = self.get_exercise_api(exercise_id)
-        return ExerciseResponseSchema.model_validate_json(response.text)
+        return response.model(ExerciseResponseSchema)
 
     def update_exercise(
         self, exercise_id: str, request: UpdateExerciseRequestSchema
@@ -145,7 +147,142 @@ class ExercisesClient(ApiClient):
             ExerciseResponseDict: Ответ сервера после обновления данных упражнения.
         """
         response = self.update_exercise_api(exercise_id, request)
-        return ExerciseResponseSchema.model_validate_json(response.text)
+        return response.model(ExerciseResponseSchema)
+
+
+class AsyncExercisesClient(AsyncApiClient):
+    """Асинхронный клиент для взаимодействия с эндпоинтами API управления упражнениями."""
+
+    @step("Получаем список упражнений")
+    @tracker.track_coverage_httpx(APIRoutes.EXERCISES.base_url)
+    async def get_exercises_api(self, params: GetExercisesQuerySchema) -> ApiResponse:
+        """Получает список упражнений с возможностью фильтрации.
+
+        Args:
+            params (GetExercisesQuerySchema): Параметры запроса для фильтрации.
+
+        Returns:
+            ApiResponse: Ответ сервера со списком упражнений.
+        """
+        return await self.get(
+            APIRoutes.EXERCISES.base_url, params=params.model_dump(by_alias=True)
+        )
+
+    @step("Получаем информацию об упражнении")
+    @tracker.track_coverage_httpx(f"{APIRoutes.EXERCISES.base_url}/{{exercise_id}}")
+    async def get_exercise_api(self, exercise_id: str) -> ApiResponse:
+        """Получает информацию о конкретном упражнении по его идентификатору.
+
+        Args:
+            exercise_id (str): Уникальный идентификатор упражнения.
+
+        Returns:
+            ApiResponse: Ответ сервера с данными о запрошенном упражнении.
+        """
+        return await self.get(APIRoutes.EXERCISES.with_id(exercise_id))
+
+    @step("Создаем упражнение")
+    @tracker.track_coverage_httpx(APIRoutes.EXERCISES.base_url)
+    async def create_exercise_api(
+        self, request: CreateExerciseRequestSchema
+    ) -> ApiResponse:
+        """Создает новое упражнение на сервере.
+
+        Args:
+            request (CreateExerciseRequestSchema): Данные для создания упражнения,
+                включая название, описание и другие параметры.
+
+        Returns:
+            ApiResponse: Ответ сервера после создания упражнения.
+        """
+        return await self.post(
+            APIRoutes.EXERCISES.base_url, json=request.model_dump(by_alias=True)
+        )
+
+    @step("Обновляем упражнение")
+    @tracker.track_coverage_httpx(f"{APIRoutes.EXERCISES.base_url}/{{exercise_id}}")
+    async def update_exercise_api(
+        self, exercise_id: str, request: UpdateExerciseRequestSchema
+    ) -> ApiResponse:
+        """Обновляет информацию об упражнении по его идентификатору.
+
+        Args:
+            exercise_id (str): Уникальный идентификатор упражнения.
+            request (UpdateExerciseRequestSchema): Данные для обновления упражнения.
+                Только указанные поля будут изменены.
+
+        Returns:
+            ApiResponse: Ответ сервера после обновления данных упражнения.
+        """
+        return await self.patch(
+            APIRoutes.EXERCISES.with_id(exercise_id),
+            json=request.model_dump(by_alias=True),
+        )
+
+    @step("Удаляем упражнение")
+    @tracker.track_coverage_httpx(f"{APIRoutes.EXERCISES.base_url}/{{exercise_id}}")
+    async def delete_exercise_api(self, exercise_id: str) -> ApiResponse:
+        """Удаляет упражнение с сервера по его идентификатору.
+
+        Args:
+            exercise_id (str): Уникальный идентификатор упражнения.
+
+        Returns:
+            ApiResponse: Ответ сервера подтверждающий удаление упражнения.
+        """
+        return await self.delete(APIRoutes.EXERCISES.with_id(exercise_id))
+
+    async def get_exercises(
+        self, params: GetExercisesQuerySchema
+    ) -> GetExercisesResponseSchema:
+        """Получает список упражнений с возможностью фильтрации.
+        Args:
+            params (GetExercisesQuerySchema): Параметры запроса для фильтрации.
+        Returns:
+            GetExercisesResponseSchema: Ответ сервера со списком упражнений.
+        """
+        response = await self.get_exercises_api(params)
+        return response.model(GetExercisesResponseSchema)
+
+    async def create_exercise(
+        self, request: CreateExerciseRequestSchema
+    ) -> ExerciseResponseSchema:
+        """
+        Создает новое упражнение на сервере.
+        Args:
+            request (CreateExerciseRequestSchema): Данные для создания упражнения,
+                включая название, описание и другие параметры.
+        Returns:
+            ExerciseResponseSchema: Ответ сервера после создания упражнения.
+        """
+        response = await self.create_exercise_api(request)
+        return response.model(ExerciseResponseSchema)
+
+    async def get_exercise(self, exercise_id: str) -> ExerciseResponseSchema:
+        """
+        Получает информацию о конкретном упражнении по его идентификатору.
+        Args:
+            exercise_id (str): Уникальный идентификатор упражнения.
+        Returns:
+            ExerciseResponseSchema: Ответ сервера с данными о запрошенном упражнении.
+        """
+        response = await self.get_exercise_api(exercise_id)
+        return response.model(ExerciseResponseSchema)
+
+    async def update_exercise(
+        self, exercise_id: str, request: UpdateExerciseRequestSchema
+    ) -> ExerciseResponseSchema:
+        """
+        Обновляет информацию об упражнении по его идентификатору.
+        Args:
+            exercise_id (str): Уникальный идентификатор упражнения.
+            request (UpdateExerciseRequestSchema): Данные для обновления упражнения.
+                Только указанные поля будут изменены.
+        Returns:
+            ExerciseResponseSchema: Ответ сервера после обновления данных упражнения.
+        """
+        response = await self.update_exercise_api(exercise_id, request)
+        return response.model(ExerciseResponseSchema)
 
 
 def get_exercises_client(user: AuthenticationUserSchema) -> ExercisesClient:
@@ -159,3 +296,19 @@ def get_exercises_client(user: AuthenticationUserSchema) -> ExercisesClient:
         ExercisesClient: Экземпляр ExercisesClient с настроенным HTTP-клиентом.
     """
     return ExercisesClient(client=get_private_http_client(user))
+
+
+async def get_async_exercises_client(
+    user: AuthenticationUserSchema,
+) -> AsyncExercisesClient:
+    """
+    Создает экземпляр AsyncExercisesClient с уже настроенным HTTP-клиентом.
+
+    Args:
+        user (AuthenticationUserSchema): Данные пользователя для авторизации.
+
+    Returns:
+        AsyncExercisesClient: Экземпляр AsyncExercisesClient с настроенным
+            асинхронным HTTP-клиентом.
+    """
+    return AsyncExercisesClient(client=await get_async_private_http_client(user))
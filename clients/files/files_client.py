@@ -1,20 +1,22 @@
-import allure
-from httpx import Response
-
-from clients.api_client import ApiClient
+from clients.api_client import ApiClient, AsyncApiClient
+from clients.api_response import ApiResponse
 from clients.api_coverage import tracker
 from clients.authentication.authentication_schema import AuthenticationUserSchema
 from clients.files.files_schema import UploadFileRequestSchema, UploadFileResponseSchema
-from clients.private_http_builder import get_private_http_client
+from clients.private_http_builder import (
+    get_async_private_http_client,
+    get_private_http_client,
+)
+from tools.allure.steps import step
 from tools.routes.api_routes import APIRoutes
 
 
 class FilesClient(ApiClient):
     """Клиент для взаимодействия с эндпоинтами API управления файлами."""
 
-    @allure.step("Загружаем файл на сервер")
+    @step("Загружаем файл на сервер")
     @tracker.track_coverage_httpx(APIRoutes.FILES.base_url)
-    def upload_file_api(self, request: UploadFileRequestSchema) -> Response:
+    def upload_file_api(self, request: UploadFileRequestSchema) -> ApiResponse:
         """Загружает файл на сервер.
 
         Args:
@@ -22,7 +24,7 @@ class FilesClient(ApiClient):
                 включая путь к локальному файлу.
 
         Returns:
-            Response: Ответ сервера после загрузки файла.
+            ApiResponse: Ответ сервера после загрузки файла.
         """
         return self.post(
             APIRoutes.FILES.base_url,
@@ -33,29 +35,29 @@ class FilesClient(ApiClient):
             files={"upload_file": request.upload_file.read_bytes()},
         )
 
-    @allure.step("Получаем информацию о файле по file_id")
+    @step("Получаем информацию о файле по file_id")
     @tracker.track_coverage_httpx(f"{APIRoutes.FILES.base_url}/{{file_id}}")
-    def get_file_api(self, file_id: str) -> Response:
+    def get_file_api(self, file_id: str) -> ApiResponse:
         """Получает информацию о файле по его идентификатору.
 
         Args:
             file_id (str): Уникальный идентификатор файла.
 
         Returns:
-            Response: Ответ сервера с данными о запрошенном файле.
+            ApiResponse: Ответ сервера с данными о запрошенном файле.
         """
         return self.get(APIRoutes.FILES.with_id(file_id))
 
-    @allure.step("Удаляем файл по file_id")
+    @step("Удаляем файл по file_id")
     @tracker.track_coverage_httpx(f"{APIRoutes.FILES.base_url}/{{file_id}}")
-    def delete_file_api(self, file_id: str) -> Response:
+    def delete_file_api(self, file_id: str) -> ApiResponse:
         """Удаляет файл с сервера по его идентификатору.
 
         Args:
             file_id (str): Уникальный идентификатор файла.
 
         Returns:
-            Response: Ответ сервера подтверждающий удаление файла.
+            ApiResponse: Ответ сервера подтверждающий удаление файла.
         """
         return self.delete(APIRoutes.FILES.with_id(file_id))
 
@@ -71,7 +73,74 @@ class FilesClient(ApiClient):
             содержащий информацию о загруженном файле.
         """
         response = self.upload_file_api(request)
-        return UploadFileResponseSchema.model_validate_json(response.text)
+        return response.model(UploadFileResponseSchema)
+
+
+class AsyncFilesClient(AsyncApiClient):
+    """Асинхронный клиент для взаимодействия с эндпоинтами API управления файлами."""
+
+    @step("Загружаем файл на сервер")
+    @tracker.track_coverage_httpx(APIRoutes.FILES.base_url)
+    async def upload_file_api(self, request: UploadFileRequestSchema) -> ApiResponse:
+        """Загружает файл на сервер.
+
+        Args:
+            request (UploadFileRequestSchema): Данные для загрузки файла,
+                включая путь к локальному файлу.
+
+        Returns:
+            ApiResponse: Ответ сервера после загрузки файла.
+        """
+        return await self.post(
+            APIRoutes.FILES.base_url,
+            data=request.model_dump(
+                by_alias=True,
+                exclude={"upload_file"},
+            ),
+            files={"upload_file": request.upload_file.read_bytes()},
+        )
+
+    @step("Получаем информацию о файле по file_id")
+    @tracker.track_coverage_httpx(f"{APIRoutes.FILES.base_url}/{{file_id}}")
+    async def get_file_api(self, file_id: str) -> ApiResponse:
+        """Получает информацию о файле по его идентификатору.
+
+        Args:
+            file_id (str): Уникальный идентификатор файла.
+
+        Returns:
+            ApiResponse: Ответ сервера с данными о запрошенном файле.
+        """
+        return await self.get(APIRoutes.FILES.with_id(file_id))
+
+    @step("Удаляем файл по file_id")
+    @tracker.track_coverage_httpx(f"{APIRoutes.FILES.base_url}/{{file_id}}")
+    async def delete_file_api(self, file_id: str) -> ApiResponse:
+        """Удаляет файл с сервера по его идентификатору.
+
+        Args:
+            file_id (str): Уникальный идентификатор файла.
+
+        Returns:
+            ApiResponse: Ответ сервера подтверждающий удаление файла.
+        """
+        return await self.delete(APIRoutes.FILES.with_id(file_id))
+
+    async def upload_file(
+        self, request: UploadFileRequestSchema
+    ) -> UploadFileResponseSchema:
+        """
+        Загружает файл на сервер и возвращает информацию о нем.
+
+        Args:
+            request (UploadFileRequestSchema): Данные для загрузки файла.
+
+        Returns:
+            UploadFileResponseSchema: Сериализованный JSON-ответ сервера,
+            содержащий информацию о загруженном файле.
+        """
+        response = await self.upload_file_api(request)
+        return response.model(UploadFileResponseSchema)
 
 
 def get_files_client(user: AuthenticationUserSchema) -> FilesClient:
@@ -82,3 +151,14 @@ def get_files_client(user: AuthenticationUserSchema) -> FilesClient:
         FilesClient: Экземпляр FilesClient с настроенным HTTP-клиентом.
     """
     return FilesClient(client=get_private_http_client(user))
+
+
+async def get_async_files_client(user: AuthenticationUserSchema) -> AsyncFilesClient:
+    """
+    Функция создаёт экземпляр AsyncFilesClient с уже настроенным HTTP-клиентом.
+
+    Returns:
+        AsyncFilesClient: Экземпляр AsyncFilesClient с настроенным
+            асинхронным HTTP-клиентом.
+    """
+    return AsyncFilesClient(client=await get_async_private_http_client(user))
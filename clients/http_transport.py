@@ -0,0 +1,254 @@
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Iterator
+
+from httpx import BaseTransport, HTTPTransport, PoolTimeout, Request, Response
+
+from config import settings
+from tools.logger import get_logger
+from tools.recording import is_recorded
+
+
+logger = get_logger("HTTP_TRANSPORT")
+
+
+class ConnectionStats:
+    """
+    Счётчики использования пула соединений.
+
+    Attrs:
+        requests (int): Количество запросов, прошедших через транспорт.
+        connections_opened (int): Количество новых TCP-соединений.
+        connections_reused (int): Количество запросов, отправленных по уже
+            открытому соединению.
+        idle_closes (int): Количество простаивавших соединений, закрытых пулом
+            (по KEEPALIVE_EXPIRY, лимиту keep-alive или сервером). Считается
+            только для запросов внутри SharedHTTPTransport.collect_stats.
+        pool_timeouts (int): Количество запросов, не дождавшихся свободного
+            соединения за POOL_TIMEOUT.
+        pool_wait_total (float): Суммарное время ожидания соединения пула, в секундах.
+        pool_wait_max (float): Максимальное время ожидания соединения пула, в секундах.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+        self.connections_reused = 0
+        self.idle_closes = 0
+        self.pool_timeouts = 0
+        self.pool_wait_total = 0.0
+        self.pool_wait_max = 0.0
+
+    def add_request(self, connection_opened: bool, pool_wait: float) -> None:
+        with self._lock:
+            self.requests += 1
+            if connection_opened:
+                self.connections_opened += 1
+            else:
+                self.connections_reused += 1
+            self.pool_wait_total += pool_wait
+            self.pool_wait_max = max(self.pool_wait_max, pool_wait)
+
+    def add_pool_timeout(self, pool_wait: float) -> None:
+        with self._lock:
+            self.pool_timeouts += 1
+            self.pool_wait_total += pool_wait
+            self.pool_wait_max = max(self.pool_wait_max, pool_wait)
+
+    def add_idle_closes(self, count: int) -> None:
+        with self._lock:
+            self.idle_closes += count
+
+    @property
+    def reuse_ratio(self) -> float:
+        """
+        Доля запросов, отправленных по уже открытому соединению.
+        """
+        if not self.requests:
+            return 0.0
+        return self.connections_reused / self.requests
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Возвращает счётчики в виде словаря для логов и отчётов.
+        """
+        return {
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "connections_reused": self.connections_reused,
+            "reuse_ratio": round(self.reuse_ratio, 4),
+            "idle_closes": self.idle_closes,
+            "pool_timeouts": self.pool_timeouts,
+            "pool_wait_total_ms": round(self.pool_wait_total * 1000, 2),
+            "pool_wait_max_ms": round(self.pool_wait_max * 1000, 2),
+        }
+
+
+class SharedHTTPTransport(BaseTransport):
+    """
+    Транспорт с общим пулом соединений для всех HTTP-клиентов процесса.
+
+    Закрытие отдельного httpx.Client не закрывает общий пул: метод close
+    ничего не делает, а соединения освобождаются только в shutdown.
+
+    Ожиданием пула считается время от входа в транспорт до первого
+    trace-события httpcore, которое отправляется уже после выдачи соединения.
+    Закрытия простаивавших соединений определяются по составу пула до и
+    после каждого запроса, выполненного внутри collect_stats (например,
+    за время теста): вне таких блоков пул не просматривается. Запросы
+    внутри tools.recording.not_recorded учитываются только в stats.
+
+    Attrs:
+        stats (ConnectionStats): Счётчики за всё время жизни транспорта.
+    """
+
+    def __init__(self, transport: HTTPTransport):
+        """
+        Args:
+            transport (HTTPTransport): Транспорт, владеющий пулом соединений.
+        """
+        self._transport = transport
+        self.stats = ConnectionStats()
+
+        self._lock = threading.Lock()
+        self._collectors: list[ConnectionStats] = [self.stats]
+        self._idle_connections: dict[Any, bool] = {}
+
+        # HTTPTransport не раскрывает пул публично. Если в другой версии
+        # httpx атрибута нет, закрытия простаивавших соединений не считаются.
+        self._pool = getattr(transport, "_pool", None)
+        if self._pool is None:
+            logger.warning(
+                "Пул соединений HTTPTransport недоступен, "
+                "закрытия простаивавших соединений не учитываются"
+            )
+
+    @contextmanager
+    def collect_stats(self) -> Iterator[ConnectionStats]:
+        """
+        Собирает отдельные счётчики для запросов, выполненных внутри блока.
+
+        Yields:
+            ConnectionStats: Счётчики запросов внутри блока.
+        """
+        stats = ConnectionStats()
+        with self._lock:
+            self._collectors.append(stats)
+        try:
+            yield stats
+        finally:
+            with self._lock:
+                self._collectors.remove(stats)
+
+    def handle_request(self, request: Request) -> Response:
+        collectors = self._get_collectors()
+        self._check_idle_closes(collectors)
+
+        started = time.perf_counter()
+        state = {"pool_wait": None, "connection_opened": False}
+        trace = request.extensions.get("trace")
+
+        def record_trace(event_name: str, info: dict[str, Any]) -> None:
+            if state["pool_wait"] is None:
+                state["pool_wait"] = time.perf_counter() - started
+            if event_name == "connection.connect_tcp.complete":
+                state["connection_opened"] = True
+            if trace is not None:
+                trace(event_name, info)
+
+        request.extensions["trace"] = record_trace
+        try:
+            response = self._transport.handle_request(request)
+        except PoolTimeout:
+            for stats in collectors:
+                stats.add_pool_timeout(time.perf_counter() - started)
+            raise
+        finally:
+            self._check_idle_closes(collectors)
+
+        for stats in collectors:
+            stats.add_request(state["connection_opened"], state["pool_wait"] or 0.0)
+
+        return response
+
+    def _get_collectors(self) -> list[ConnectionStats]:
+        if not is_recorded():
+            # Фоновые запросы не относятся к блокам collect_stats и не
+            # сбрасывают состав пула, запомненный для них.
+            return [self.stats]
+
+        with self._lock:
+            return list(self._collectors)
+
+    def _check_idle_closes(self, collectors: list[ConnectionStats]) -> None:
+        # События закрытия соединений httpcore не трассирует, поэтому
+        # сравниваем состав пула с составом при предыдущей проверке.
+        # Просмотр пула стоит O(размер пула), поэтому выполняется только
+        # при активном collect_stats и без удержания общей блокировки.
+        if not is_recorded():
+            return
+        if self._pool is None or len(collectors) < 2:
+            # Закрытия между блоками collect_stats не относятся ни к одному из них.
+            self._idle_connections = {}
+            return
+
+        connections = {
+            connection: connection.is_idle() for connection in self._pool.connections
+        }
+        with self._lock:
+            previous, self._idle_connections = self._idle_connections, connections
+
+        closed = sum(
+            1
+            for connection, was_idle in previous.items()
+            if was_idle and connection not in connections
+        )
+        if closed:
+            for stats in collectors:
+                stats.add_idle_closes(closed)
+
+    def close(self) -> None:
+        """
+        Пул общий для всех клиентов, поэтому закрытие клиента его не трогает.
+        """
+
+    def shutdown(self) -> None:
+        """
+        Закрывает все соединения пула.
+        """
+        self._transport.close()
+
+
+@lru_cache(maxsize=None)
+def get_shared_transport() -> SharedHTTPTransport:
+    """
+    Функция возвращает общий транспорт процесса (одного xdist-воркера).
+
+    Лимиты пула задаются в settings.HTTP_POOL. При settings.HTTP_CLIENT.HTTP2
+    запросы мультиплексируются в HTTP/2-соединениях.
+
+    Returns:
+        SharedHTTPTransport: Транспорт с общим пулом соединений.
+    """
+    return SharedHTTPTransport(
+        HTTPTransport(
+            limits=settings.HTTP_POOL.limits,
+            **settings.HTTP_CLIENT.http_versions,
+        )
+    )
+
+
+def shutdown_shared_transport() -> None:
+    """
+    Закрывает общий пул соединений и логирует статистику переиспользования.
+    """
+    if get_shared_transport.cache_info().currsize == 0:
+        return
+
+    transport = get_shared_transport()
+    logger.info(f"Статистика пула соединений: {transport.stats.as_dict()}")
+    transport.shutdown()
+    get_shared_transport.cache_clear()
@@ -1,42 +1,221 @@
-from functools import lru_cache
+from typing import Any
+from weakref import WeakSet
 
-from httpx import Client
+from httpx import AsyncClient, Client
 
-from clients.authentication.authentication_client import get_authentication_client
+from clients.authentication.authentication_client import (
+    get_async_authentication_client,
+    get_authentication_client,
+)
 from clients.authentication.authentication_schema import (
     AuthenticationUserSchema,
     LoginRequestSchema,
+    TokenSchema,
 )
+from clients.authentication.bearer_auth import BearerAuth
+from clients.authentication.token_store import get_token_store
 from config import settings
 from clients.event_hooks import (
+    async_buffer_response_event_hook,
+    async_curl_event_hook,
+    async_log_request_event_hook,
+    async_log_response_event_hook,
+    async_timing_event_hook,
+    buffer_response_event_hook,
     curl_event_hook,
     log_request_event_hook,
     log_response_event_hook,
+    timing_event_hook,
+)
+from clients.http_transport import get_shared_transport
+from tools.cache import ClosingLRUCache
+from tools.logger import get_logger
+
+
+logger = get_logger("HTTP_CLIENT_CACHE")
+
+# Вытесненные из кеша клиенты не закрываются сразу: на них могут ссылаться
+# созданные ранее доменные клиенты (например, CoursesClient в фикстуре уровня
+# сессии). Соединения принадлежат общему транспорту, поэтому вытесненный
+# клиент ресурсов не удерживает и удаляется сборщиком мусора вместе с
+# последней ссылкой, а оставшиеся закрываются в close_private_http_clients.
+_evicted_http_clients: WeakSet[Client] = WeakSet()
+
+_private_http_clients: ClosingLRUCache[AuthenticationUserSchema, Client] = (
+    ClosingLRUCache(
+        max_size=settings.HTTP_CLIENT_CACHE.MAX_SIZE,
+        ttl=settings.HTTP_CLIENT_CACHE.TTL,
+        on_evict=_evicted_http_clients.add,
+    )
 )
 
 
-@lru_cache(maxsize=None)
 def get_private_http_client(user: AuthenticationUserSchema) -> Client:
+    """
+    Функция возвращает экземпляр httpx.Client с аутентификацией пользователя.
+
+    Клиенты кешируются по пользователю в ограниченном кеше (размер и TTL
+    задаются в settings.HTTP_CLIENT_CACHE). Вытесненный клиент остаётся
+    рабочим для тех, кто его уже получил, и закрывается только в конце
+    сессии, а следующий вызов для пользователя создаёт новый клиент.
+
+    Args:
+        user (AuthenticationUserSchema): Данные пользователя для входа.
+
+    Returns:
+        Client: Объект httpx.Client с настроенной авторизацией пользователя.
+    """
+    return _private_http_clients.get_or_create(
+        user, lambda: _build_private_http_client(user)
+    )
+
+
+def _build_private_http_client(user: AuthenticationUserSchema) -> Client:
     """
     Функция создаёт экземпляр httpx.Client с аутентификацией пользователя.
 
+    Клиенты всех пользователей используют общий пул соединений процесса,
+    а токен пользователя добавляется к каждому запросу через BearerAuth.
+
+    Args:
+        user (AuthenticationUserSchema): Данные пользователя для входа.
+
+    Returns:
+        Client: Объект httpx.Client с настроенной авторизацией пользователя.
+    """
+    return Client(
+        timeout=settings.http_timeout,
+        base_url=settings.HTTP_CLIENT.url_as_string,
+        auth=_get_bearer_auth(user),
+        transport=get_shared_transport(),
+        event_hooks={
+            "request": [
+                curl_event_hook,
+                log_request_event_hook,
+                timing_event_hook,
+            ],
+            "response": [log_response_event_hook, buffer_response_event_hook],
+        },
+    )
+
+
+def _get_bearer_auth(user: AuthenticationUserSchema) -> BearerAuth:
+    """
+    Функция создаёт авторизацию пользователя с автоматическим обновлением токена.
+
+    Args:
+        user (AuthenticationUserSchema): Данные пользователя для входа.
+
+    Returns:
+        BearerAuth: Авторизация с токенами доступа и обновления пользователя.
+    """
+    token = _get_token(user)
+    return BearerAuth(
+        user=user,
+        access_token=token.access_token,
+        refresh_token=token.refresh_token,
+    )
+
+
+def _get_token(user: AuthenticationUserSchema) -> TokenSchema:
+    """
+    Функция возвращает токены пользователя.
+
+    Сначала токены ищутся в файловом хранилище, общем для всех xdist-воркеров,
+    и только при их отсутствии или истечении выполняется вход через
+    /authentication/login. Полученные токены сохраняются в хранилище.
+
     Args:
         user (AuthenticationUserSchema): Данные пользователя для входа.
 
     Returns:
-        Client: Объект httpx.Client с настроенным заголовком авторизации.
+        TokenSchema: Токены доступа и обновления пользователя.
     """
+    token_store = get_token_store()
+    if token_store and (stored_token := token_store.get(user.email)):
+        return TokenSchema(
+            tokenType="bearer",
+            accessToken=stored_token.access_token,
+            refreshToken=stored_token.refresh_token,
+        )
+
     authentication_client = get_authentication_client()
 
     login_request = LoginRequestSchema(email=user.email, password=user.password)
     login_response = authentication_client.login(login_request)
 
-    return Client(
-        timeout=settings.HTTP_CLIENT.TIMEOUT,
+    if token_store:
+        token_store.put(user.email, login_response.token)
+
+    return login_response.token
+
+
+def get_private_http_client_cache_stats() -> dict[str, Any]:
+    """
+    Функция возвращает счётчики кеша приватных HTTP-клиентов.
+
+    Returns:
+        dict[str, Any]: Размер кеша, попадания, промахи и вытеснения.
+    """
+    return _private_http_clients.stats()
+
+
+def close_private_http_clients() -> None:
+    """
+    Функция очищает кеш приватных HTTP-клиентов и закрывает все клиенты,
+    на которые ещё остались ссылки.
+    """
+    cached = _private_http_clients.clear()
+    clients = list(_evicted_http_clients)
+    _evicted_http_clients.clear()
+    for client in clients:
+        client.close()
+
+    logger.info(
+        f"Удалено из кеша приватных HTTP-клиентов: {cached}, "
+        f"закрыто используемых: {len(clients)}. "
+        f"Статистика кеша: {get_private_http_client_cache_stats()}"
+    )
+
+
+async def get_async_private_http_client(user: AuthenticationUserSchema) -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с аутентификацией пользователя.
+
+    В отличие от синхронной версии результат не кешируется: соединения
+    httpx.AsyncClient привязаны к event loop, в котором они были открыты,
+    поэтому клиент нужно закрывать в том же цикле (например, через async with).
+
+    Args:
+        user (AuthenticationUserSchema): Данные пользователя для входа.
+
+    Returns:
+        AsyncClient: Объект httpx.AsyncClient с настроенной авторизацией пользователя.
+    """
+    login_request = LoginRequestSchema(email=user.email, password=user.password)
+
+    async with get_async_authentication_client() as authentication_client:
+        login_response = await authentication_client.login(login_request)
+
+    return AsyncClient(
+        timeout=settings.http_timeout,
         base_url=settings.HTTP_CLIENT.url_as_string,
-        headers={"Authorization": f"Bearer {login_response.token.access_token}"},
+        **settings.HTTP_CLIENT.http_versions,
+        limits=settings.HTTP_POOL.limits,
+        auth=BearerAuth(
+            user=user,
+            access_token=login_response.token.access_token,
+            refresh_token=login_response.token.refresh_token,
+        ),
         event_hooks={
-            "request": [curl_event_hook, log_request_event_hook],
-            "response": [log_response_event_hook],
+            "request": [
+                async_curl_event_hook,
+                async_log_request_event_hook,
+                async_timing_event_hook,
+            ],
+            "response": [
+                async_log_response_event_hook,
+                async_buffer_response_event_hook,
+            ],
         },
     )
@@ -1,25 +1,65 @@
-from httpx import Client
+from httpx import AsyncClient, Client
 
 from clients.event_hooks import (
+    async_buffer_response_event_hook,
+    async_curl_event_hook,
+    async_log_request_event_hook,
+    async_log_response_event_hook,
+    async_timing_event_hook,
+    buffer_response_event_hook,
     curl_event_hook,
     log_request_event_hook,
     log_response_event_hook,
+    timing_event_hook,
 )
+from clients.http_transport import get_shared_transport
 from config import settings
 
 
 def get_public_http_client() -> Client:
     """
-    Функция создаёт экземпляр httpx.Client с базовыми настройками.
+    Функция создаёт экземпляр httpx.Client с базовыми настройками
+    поверх общего пула соединений процесса.
 
     Returns:
         Готовый к использованию объект httpx.Client.
     """
     return Client(
-        timeout=settings.HTTP_CLIENT.TIMEOUT,
+        timeout=settings.http_timeout,
         base_url=settings.HTTP_CLIENT.url_as_string,
+        transport=get_shared_transport(),
         event_hooks={
-            "request": [curl_event_hook, log_request_event_hook],
-            "response": [log_response_event_hook],
+            "request": [
+                curl_event_hook,
+                log_request_event_hook,
+                timing_event_hook,
+            ],
+            "response": [log_response_event_hook, buffer_response_event_hook],
+        },
+    )
+
+
+def get_async_public_http_client() -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с базовыми настройками.
+
+    Returns:
+        Готовый к использованию объект httpx.AsyncClient.
+    """
+    return AsyncClient(
+        timeout=settings.http_timeout,
+        base_url=settings.HTTP_CLIENT.url_as_string,
+        **settings.HTTP_CLIENT.http_versions,
+        limits=settings.HTTP_POOL.limits,
+        event_hooks={
+            "request": [
+                async_curl_event_hook,
+                async_log_request_event_hook,
+                async_timing_event_hook,
+            ],
+            "response": [
+                async_log_response_event_hook,
+                async_buffer_response_event_hook,
+            ],
         },
     )
@@ -0,0 +1,162 @@
+import threading
+import time
+from typing import Any
+
+from httpx import Request
+
+from clients.api_coverage import get_route_template
+from tools.logger import get_logger
+
+
+logger = get_logger("HTTP_TIMING")
+
+PHASES = ("pool_wait", "connect", "tls", "send", "ttfb", "body")
+
+# Соответствие операций httpcore (имя trace-события без .started/.complete)
+# фазам запроса. Отдельного события для DNS в httpcore нет, поэтому
+# разрешение имени входит в connect.
+TRACE_PHASES = {
+    "connection.connect_tcp": "connect",
+    "connection.start_tls": "tls",
+    "http11.send_request_headers": "send",
+    "http11.send_request_body": "send",
+    "http2.send_connection_init": "send",
+    "http2.send_request_headers": "send",
+    "http2.send_request_body": "send",
+    "http11.receive_response_headers": "ttfb",
+    "http2.receive_response_headers": "ttfb",
+    "http11.receive_response_body": "body",
+    "http2.receive_response_body": "body",
+}
+RESPONSE_CLOSED_EVENTS = (
+    "http11.response_closed.complete",
+    "http2.response_closed.complete",
+)
+
+
+class PhaseTimingStats:
+    """
+    Агрегированное время фаз запросов по методу и шаблону маршрута.
+
+    Для каждой пары (метод, маршрут) хранится количество запросов,
+    суммарное и максимальное время каждой фазы.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: dict[tuple[str, str], dict[str, Any]] = {}
+
+    def add(self, method: str, route: str, phases: dict[str, float]) -> None:
+        with self._lock:
+            entry = self._routes.setdefault(
+                (method, route),
+                {
+                    "count": 0,
+                    "total": dict.fromkeys(PHASES, 0.0),
+                    "max": dict.fromkeys(PHASES, 0.0),
+                },
+            )
+            entry["count"] += 1
+            for phase, duration in phases.items():
+                entry["total"][phase] += duration
+                entry["max"][phase] = max(entry["max"][phase], duration)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Возвращает среднее и максимальное время фаз в миллисекундах
+        в виде словаря {"POST /api/v1/courses": {...}} для логов и отчётов.
+        """
+        with self._lock:
+            routes = sorted(self._routes.items())
+
+        return {
+            f"{method} {route}": {
+                "count": entry["count"],
+                **{
+                    f"{phase}_ms": {
+                        "avg": round(entry["total"][phase] / entry["count"] * 1000, 2),
+                        "max": round(entry["max"][phase] * 1000, 2),
+                    }
+                    for phase in PHASES
+                },
+            }
+            for (method, route), entry in routes
+        }
+
+
+phase_timings = PhaseTimingStats()
+
+
+class RequestPhaseTrace:
+    """
+    Обработчик trace-событий httpcore для одного запроса.
+
+    Время фаз фиксируется по парам событий .started/.complete, а итог
+    записывается в phase_timings после закрытия ответа, то есть уже
+    после чтения тела.
+
+    Attrs:
+        method (str): HTTP-метод запроса.
+        route (str): Шаблон маршрута swagger или путь запроса, если
+            запрос выполнен не через клиент с track_coverage_httpx.
+        phases (dict[str, float]): Время фаз запроса в секундах.
+    """
+
+    def __init__(self, request: Request, trace: Any = None):
+        """
+        Args:
+            request (Request): Запрос, для которого собирается время фаз.
+            trace (Any): Ранее установленный обработчик trace, которому
+                события передаются дальше.
+        """
+        self.method = request.method
+        self.route = get_route_template() or request.url.path
+        self.phases = dict.fromkeys(PHASES, 0.0)
+
+        self._trace = trace
+        self._created = time.perf_counter()
+        self._first_event: float | None = None
+        self._started: dict[str, float] = {}
+
+    def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        self.handle_event(event_name)
+        if self._trace is not None:
+            self._trace(event_name, info)
+
+    async def atrace(self, event_name: str, info: dict[str, Any]) -> None:
+        """
+        Асинхронная версия обработчика для httpx.AsyncClient.
+        """
+        self.handle_event(event_name)
+        if self._trace is not None:
+            await self._trace(event_name, info)
+
+    def handle_event(self, event_name: str) -> None:
+        now = time.perf_counter()
+        if self._first_event is None:
+            self._first_event = now
+            self.phases["pool_wait"] = now - self._created
+
+        operation, _, stage = event_name.rpartition(".")
+        if stage == "started":
+            self._started[operation] = now
+        elif stage == "complete" and operation in self._started:
+            if phase := TRACE_PHASES.get(operation):
+                self.phases[phase] += now - self._started.pop(operation)
+
+        if event_name in RESPONSE_CLOSED_EVENTS:
+            self._finish()
+
+    def _finish(self) -> None:
+        phase_timings.add(self.method, self.route, self.phases)
+        logger.debug(
+            f"Время фаз {self.method} {self.route}: "
+            + ", ".join(
+                f"{phase}={duration * 1000:.2f}ms"
+                for phase, duration in self.phases.items()
+            )
+        )
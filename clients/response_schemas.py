@@ -0,0 +1,82 @@
+from http import HTTPStatus
+
+from clients.authentication.authentication_schema import LoginResponseSchema
+from clients.courses.courses_schema import (
+    CourseResponseSchema,
+    GetCoursesResponseSchema,
+)
+from clients.errors_schema import (
+    InternalErrorResponseSchema,
+    ValidationErrorResponseSchema,
+)
+from clients.exercises.exercises_schema import (
+    ExerciseResponseSchema,
+    GetExercisesResponseSchema,
+)
+from clients.files.files_schema import UploadFileResponseSchema
+from clients.users.users_schema import GetUserResponseSchema, UserResponseSchema
+from tools.routes.api_routes import APIRoutes
+from tools.schema_registry import schema_registry
+
+AUTHENTICATION_LOGIN = f"{APIRoutes.AUTHENTICATION.base_url}/login"
+AUTHENTICATION_REFRESH = f"{APIRoutes.AUTHENTICATION.base_url}/refresh"
+COURSE = f"{APIRoutes.COURSES.base_url}/{{course_id}}"
+EXERCISE = f"{APIRoutes.EXERCISES.base_url}/{{exercise_id}}"
+FILE = f"{APIRoutes.FILES.base_url}/{{file_id}}"
+USER = f"{APIRoutes.USERS.base_url}/{{user_id}}"
+USER_ME = f"{APIRoutes.USERS.base_url}/me"
+
+# Успешные ответы эндпоинтов: (метод, шаблон маршрута) -> модель ответа.
+SUCCESS_RESPONSES = {
+    ("POST", AUTHENTICATION_LOGIN): LoginResponseSchema,
+    ("POST", AUTHENTICATION_REFRESH): LoginResponseSchema,
+    ("GET", APIRoutes.COURSES.base_url): GetCoursesResponseSchema,
+    ("POST", APIRoutes.COURSES.base_url): CourseResponseSchema,
+    ("GET", COURSE): CourseResponseSchema,
+    ("PATCH", COURSE): CourseResponseSchema,
+    ("GET", APIRoutes.EXERCISES.base_url): GetExercisesResponseSchema,
+    ("POST", APIRoutes.EXERCISES.base_url): ExerciseResponseSchema,
+    ("GET", EXERCISE): ExerciseResponseSchema,
+    ("PATCH", EXERCISE): ExerciseResponseSchema,
+    ("POST", APIRoutes.FILES.base_url): UploadFileResponseSchema,
+    ("GET", FILE): UploadFileResponseSchema,
+    ("POST", APIRoutes.USERS.base_url): UserResponseSchema,
+    ("GET", USER_ME): GetUserResponseSchema,
+    ("GET", USER): GetUserResponseSchema,
+    ("PATCH", USER): UserResponseSchema,
+}
+
+# Маршруты с идентификатором ресурса, отвечающие 404 на несуществующий ресурс.
+RESOURCE_ROUTES = (COURSE, EXERCISE, FILE, USER)
+
+
+def register_response_schemas() -> None:
+    """
+    Функция регистрирует модели ответов всех эндпоинтов в schema_registry.
+
+    Кроме успешных ответов регистрируются ошибки: 422 для любого эндпоинта,
+    404 для маршрутов с идентификатором ресурса и 401 для входа в систему.
+    """
+    for (method, route), model_class in SUCCESS_RESPONSES.items():
+        schema_registry.register_response(method, route, HTTPStatus.OK, model_class)
+
+    endpoints = [*SUCCESS_RESPONSES, *(("DELETE", route) for route in RESOURCE_ROUTES)]
+    for method, route in endpoints:
+        schema_registry.register_response(
+            method,
+            route,
+            HTTPStatus.UNPROCESSABLE_ENTITY,
+            ValidationErrorResponseSchema,
+        )
+        if route in RESOURCE_ROUTES:
+            schema_registry.register_response(
+                method, route, HTTPStatus.NOT_FOUND, InternalErrorResponseSchema
+            )
+
+    schema_registry.register_response(
+        "POST",
+        AUTHENTICATION_LOGIN,
+        HTTPStatus.UNAUTHORIZED,
+        InternalErrorResponseSchema,
+    )
+
@@ -0,0 +1,229 @@
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+from clients.api_coverage import get_route_template
+from clients.api_response import ApiResponse
+from clients.response_schemas import register_response_schemas
+from config import settings
+from tools.assertions.schema import get_schema_errors, validate_json_schema
+from tools.logger import get_logger
+from tools.schema_registry import schema_registry
+
+
+logger = get_logger("SCHEMA_VALIDATION")
+
+
+class ResponseSchemaValidator:
+    """
+    Автоматическая проверка ответов по JSON-схемам с политикой выборки.
+
+    Политика применяется к каждой паре (метод, шаблон маршрута): проверяются
+    все ответы, каждый sample_every-й или первые first ответов. При workers > 0
+    проверка выполняется в фоновых потоках: несоответствие схеме не прерывает
+    тест, а записывается в список ошибок вместе с тестом и запросом, которые
+    его вызвали.
+    """
+
+    def __init__(
+        self,
+        policy: Literal["all", "sample", "first"],
+        sample_every: int,
+        first: int,
+        workers: int,
+    ):
+        """
+        Args:
+            policy (Literal["all", "sample", "first"]): Политика выборки ответов.
+            sample_every (int): Шаг выборки для политики sample.
+            first (int): Количество проверяемых ответов маршрута для политики first.
+            workers (int): Количество фоновых потоков. 0 — проверка в потоке запроса.
+        """
+        self.policy = policy
+        self.sample_every = max(sample_every, 1)
+        self.first = first
+        self.workers = workers
+        self._lock = threading.Lock()
+        self._routes: dict[tuple[str, str], dict[str, int]] = {}
+        self._failures: list[dict[str, Any]] = []
+        self._futures: set[Future] = set()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def validate(self, response: ApiResponse, route: str) -> None:
+        """
+        Проверяет ответ по схеме его эндпоинта, если это разрешает политика.
+
+        Args:
+            response (ApiResponse): Ответ сервера.
+            route (str): Шаблон маршрута запроса.
+
+        Raises:
+            ValidationError: Если тело ответа не соответствует схеме
+                и проверка выполняется в потоке запроса.
+        """
+        method = response.request.method
+        model_class = schema_registry.get_response_model(
+            method, route, response.status_code
+        )
+        if model_class is None:
+            return
+
+        key = (method, route)
+        if not self._should_validate(key):
+            return
+
+        if not self.workers:
+            try:
+                validate_json_schema(response.json(), model_class)
+            except Exception:
+                self._count(key, "failed")
+                raise
+            return
+
+        origin = {
+            "test": os.environ.get("PYTEST_CURRENT_TEST", "").rsplit(" ", 1)[0],
+            "request": f"{method} {response.request.url}",
+            "status": response.status_code,
+        }
+        future = self._get_executor().submit(
+            self._validate_in_background, key, response.json(), model_class, origin
+        )
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._discard_future)
+
+    def drain(self) -> None:
+        """
+        Дожидается завершения всех фоновых проверок.
+        """
+        with self._lock:
+            futures = list(self._futures)
+        wait(futures)
+
+    def close(self) -> None:
+        """
+        Дожидается фоновых проверок и останавливает пул потоков.
+        """
+        self.drain()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def summary(self) -> list[dict[str, Any]]:
+        """
+        Возвращает количество проверенных, пропущенных и несоответствующих
+        схеме ответов по маршрутам.
+
+        Returns:
+            list[dict[str, Any]]: Строки сводки, отсортированные по маршруту и методу.
+        """
+        with self._lock:
+            routes = sorted(self._routes.items(), key=lambda item: item[0][::-1])
+
+        return [
+            {"method": method, "route": route, **counters}
+            for (method, route), counters in routes
+        ]
+
+    @property
+    def failures(self) -> list[dict[str, Any]]:
+        """
+        Объект-свойство с несоответствиями схеме, найденными фоновыми проверками.
+        """
+        with self._lock:
+            return list(self._failures)
+
+    def _should_validate(self, key: tuple[str, str]) -> bool:
+        with self._lock:
+            counters = self._routes.setdefault(
+                key, {"validated": 0, "skipped": 0, "failed": 0}
+            )
+            seen = counters["validated"] + counters["skipped"]
+            match self.policy:
+                case "sample":
+                    selected = seen % self.sample_every == 0
+                case "first":
+                    selected = seen < self.first
+                case _:
+                    selected = True
+
+            counters["validated" if selected else "skipped"] += 1
+            return selected
+
+    def _count(self, key: tuple[str, str], counter: str) -> None:
+        with self._lock:
+            self._routes[key][counter] += 1
+
+    def _validate_in_background(
+        self,
+        key: tuple[str, str],
+        instance: Any,
+        model_class: type[BaseModel],
+        origin: dict[str, Any],
+    ) -> None:
+        errors = get_schema_errors(instance, model_class)
+        if not errors:
+            return
+
+        self._count(key, "failed")
+        with self._lock:
+            self._failures.append(
+                {**origin, "schema": model_class.__name__, "errors": errors}
+            )
+        logger.error(
+            f"Ответ {origin['request']} ({origin['status']}) в тесте "
+            f"{origin['test']} не соответствует схеме {model_class.__name__}: "
+            + "; ".join(errors)
+        )
+
+    def _discard_future(self, future: Future) -> None:
+        with self._lock:
+            self._futures.discard(future)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="schema-validation"
+                )
+            return self._executor
+
+
+register_response_schemas()
+
+response_schema_validator = ResponseSchemaValidator(
+    policy=settings.SCHEMA_VALIDATION.POLICY,
+    sample_every=settings.SCHEMA_VALIDATION.SAMPLE_EVERY,
+    first=settings.SCHEMA_VALIDATION.FIRST,
+    workers=settings.SCHEMA_VALIDATION.WORKERS,
+)
+
+
+def validate_response_schema(response: ApiResponse) -> None:
+    """
+    Функция проверяет ответ по JSON-схеме, зарегистрированной для его эндпоинта,
+    с учётом политики SCHEMA_VALIDATION.
+
+    Шаблон маршрута берётся из get_route_template, поэтому проверяются только
+    ответы методов клиентов, обёрнутых tracker.track_coverage_httpx. Ответы
+    без зарегистрированной модели и вызовы при SCHEMA_VALIDATION.AUTO=false
+    пропускаются.
+
+    Args:
+        response (ApiResponse): Ответ сервера. Разобранное тело остаётся
+            в кеше ответа и переиспользуется тестом.
+
+    Raises:
+        ValidationError: Если тело ответа не соответствует схеме
+            и проверка выполняется в потоке запроса.
+    """
+    if not settings.SCHEMA_VALIDATION.AUTO:
+        return
+
+    route = get_route_template()
+    if route is not None:
+        response_schema_validator.validate(response, route)
@@ -1,11 +1,13 @@
-import allure
-from httpx import Response
-
-from clients.api_client import ApiClient
+from clients.api_client import ApiClient, AsyncApiClient
+from clients.api_response import ApiResponse
 from clients.api_coverage import tracker
 from clients.authentication.authentication_schema import AuthenticationUserSchema
 from clients.users.users_schema import UserResponseSchema, UpdateUserRequestSchema
-from clients.private_http_builder import get_private_http_client
+from clients.private_http_builder import (
+    get_async_private_http_client,
+    get_private_http_client,
+)
+from tools.allure.steps import step
 from tools.routes.api_routes import APIRoutes
 
 
@@ -16,34 +18,34 @@ class PrivateUsersClient(ApiClient):
     требующих авторизации.
     """
 
-    @allure.step("Получаем информацию о текущем пользователе")
+    @step("Получаем информацию о текущем пользователе")
     @tracker.track_coverage_httpx(f"{APIRoutes.USERS.base_url}/me")
-    def get_user_me_api(self) -> Response:
+    def get_user_me_api(self) -> ApiResponse:
         """Возвращает информацию о текущем авторизованном пользователе.
 
         Returns:
-            Response: Ответ сервера с данными текущего пользователя.
+            ApiResponse: Ответ сервера с данными текущего пользователя.
         """
         return self.get(f"{APIRoutes.USERS.base_url}/me")
 
-    @allure.step("Получаем информацию о пользователе по user_id")
+    @step("Получаем информацию о пользователе по user_id")
     @tracker.track_coverage_httpx(f"{APIRoutes.USERS.base_url}/{{user_id}}")
-    def get_user_api(self, user_id: str) -> Response:
+    def get_user_api(self, user_id: str) -> ApiResponse:
         """Получает информацию о пользователе по его идентификатору.
 
         Args:
             user_id (str): Уникальный идентификатор пользователя.
 
         Returns:
-            Response: Ответ сервера с данными запрошенного пользователя.
+            ApiResponse: Ответ сервера с данными запрошенного пользователя.
         """
         return self.get(APIRoutes.USERS.with_id(user_id))
 
-    @allure.step("Обновляем информацию о пользователе по user_id")
+    @step("Обновляем информацию о пользователе по user_id")
     @tracker.track_coverage_httpx(f"{APIRoutes.USERS.base_url}/{{user_id}}")
     def update_user_api(
         self, user_id: str, request: UpdateUserRequestSchema
-    ) -> Response:
+    ) -> ApiResponse:
         """Обновляет информацию о пользователе по его идентификатору.
 
         Args:
@@ -51,22 +53,22 @@ class PrivateUsersClient(ApiClient):
             request (UserUpdateRequestDict): Данные для обновления профиля пользователя.
 
         Returns:
-            Response: Ответ сервера после обновления данных пользователя.
+            ApiResponse: Ответ сервера после обновления данных пользователя.
         """
         return self.patch(
             APIRoutes.USERS.with_id(user_id), json=request.model_dump(by_alias=True)
         )
 
-    @allure.step("Удаляем пользователя по user_id")
+    @step("Удаляем пользователя по user_id")
     @tracker.track_coverage_httpx(f"{APIRoutes.USERS.base_url}/{{user_id}}")
-    def delete_user_api(self, user_id: str) -> Response:
+    def delete_user_api(self, user_id: str) -> ApiResponse:
         """Удаляет пользователя по его идентификатору.
 
         Args:
             user_id (str): Уникальный идентификатор пользователя.
 
         Returns:
-            Response: Ответ сервера подтверждающий удаление пользователя.
+            ApiResponse: Ответ сервера подтверждающий удаление пользователя.
         """
         return self.delete(APIRoutes.USERS.with_id(user_id))
 
@@ -81,7 +83,78 @@ class PrivateUsersClient(ApiClient):
             UserResponseSchema: Объект с данными пользователя.
         """
         response = self.get_user_api(user_id)
-        return UserResponseSchema.model_validate_json(response.text)
+        return response.model(UserResponseSchema)
+
+
+class AsyncPrivateUsersClient(AsyncApiClient):
+    """Асинхронный клиент для работы с закрытыми эндпоинтами API управления пользователями."""
+
+    @step("Получаем информацию о текущем пользователе")
+    @tracker.track_coverage_httpx(f"{APIRoutes.USERS.base_url}/me")
+    async def get_user_me_api(self) -> ApiResponse:
+        """Возвращает информацию о текущем авторизованном пользователе.
+
+        Returns:
+            ApiResponse: Ответ сервера с данными текущего пользователя.
+        """
+        return await self.get(f"{APIRoutes.USERS.base_url}/me")
+
+    @step("Получаем информацию о пользователе по user_id")
+    @tracker.track_coverage_httpx(f"{APIRoutes.USERS.base_url}/{{user_id}}")
+    async def get_user_api(self, user_id: str) -> ApiResponse:
+        """Получает информацию о пользователе по его идентификатору.
+
+        Args:
+            user_id (str): Уникальный идентификатор пользователя.
+
+        Returns:
+            ApiResponse: Ответ сервера с данными запрошенного пользователя.
+        """
+        return await self.get(APIRoutes.USERS.with_id(user_id))
+
+    @step("Обновляем информацию о пользователе по user_id")
+    @tracker.track_coverage_httpx(f"{APIRoutes.USERS.base_url}/{{user_id}}")
+    async def update_user_api(
+        self, user_id: str, request: UpdateUserRequestSchema
+    ) -> ApiResponse:
+        """Обновляет информацию о пользователе по его идентификатору.
+
+        Args:
+            user_id (str): Уникальный идентификатор пользователя.
+            request (UpdateUserRequestSchema): Данные для обновления профиля пользователя.
+
+        Returns:
+            ApiResponse: Ответ сервера после обновления данных пользователя.
+        """
+        return await self.patch(
+            APIRoutes.USERS.with_id(user_id), json=request.model_dump(by_alias=True)
+        )
+
+    @step("Удаляем пользователя по user_id")
+    @tracker.track_coverage_httpx(f"{APIRoutes.USERS.base_url}/{{user_id}}")
+    async def delete_user_api(self, user_id: str) -> ApiResponse:
+        """Удаляет пользователя по его идентификатору.
+
+        Args:
+            user_id (str): Уникальный идентификатор пользователя.
+
+        Returns:
+            ApiResponse: Ответ сервера подтверждающий удаление пользователя.
+        """
+        return await self.delete(APIRoutes.USERS.with_id(user_id))
+
+    async def get_user(self, user_id: str) -> UserResponseSchema:
+        """
+        Метод получает информацию о пользователе по его идентификатору.
+
+        Args:
+            user_id (str): Уникальный идентификатор пользователя.
+
+        Returns:
+            UserResponseSchema: Объект с данными пользователя.
+        """
+        response = await self.get_user_api(user_id)
+        return response.model(UserResponseSchema)
 
 
 def get_private_users_client(user: AuthenticationUserSchema) -> PrivateUsersClient:
@@ -95,3 +168,19 @@ def get_private_users_client(user: AuthenticationUserSchema) -> PrivateUsersClie
         PrivateUsersClient: Экземпляр PrivateUsersClient с авторизованным HTTP-клиентом.
     """
     return PrivateUsersClient(client=get_private_http_client(user))
+
+
+async def get_async_private_users_client(
+    user: AuthenticationUserSchema,
+) -> AsyncPrivateUsersClient:
+    """
+    Функция создаёт экземпляр AsyncPrivateUsersClient с уже настроенным HTTP-клиентом.
+
+    Args:
+        user (AuthenticationUserSchema): Пользователь для авторизации.
+
+    Returns:
+        AsyncPrivateUsersClient: Экземпляр AsyncPrivateUsersClient
+            с авторизованным асинхронным HTTP-клиентом.
+    """
+    return AsyncPrivateUsersClient(client=await get_async_private_http_client(user))
@@ -1,19 +1,21 @@
-import allure
-from httpx import Response
-
-from clients.api_client import ApiClient
+from clients.api_client import ApiClient, AsyncApiClient
+from clients.api_response import ApiResponse
 from clients.api_coverage import tracker
-from clients.public_http_builder import get_public_http_client
+from clients.public_http_builder import (
+    get_async_public_http_client,
+    get_public_http_client,
+)
 from clients.users.users_schema import CreateUserRequestSchema, UserResponseSchema
+from tools.allure.steps import step
 from tools.routes.api_routes import APIRoutes
 
 
 class PublicUsersClient(ApiClient):
     """Клиент для работы с публичными эндпоинтами API управления пользователями."""
 
-    @allure.step("Создаем пользователя")
+    @step("Создаем пользователя")
     @tracker.track_coverage_httpx(APIRoutes.USERS.base_url)
-    def create_user_api(self, request: CreateUserRequestSchema) -> Response:
+    def create_user_api(self, request: CreateUserRequestSchema) -> ApiResponse:
         """Создает нового пользователя через API.
 
         Args:
@@ -21,7 +23,7 @@ class PublicUsersClient(ApiClient):
                 включая email, пароль и персональные данные.
 
         Returns:
-            Response: Ответ сервера после попытки создания пользователя.
+            ApiResponse: Ответ сервера после попытки создания пользователя.
         """
         return self.post(
             APIRoutes.USERS.base_url, json=request.model_dump(by_alias=True)
@@ -39,7 +41,41 @@ class PublicUsersClient(ApiClient):
                 информацию о результате регистрации и, при успехе, токены доступа.
         """
         response = self.create_user_api(request)
-        return UserResponseSchema.model_validate_json(response.text)
+        return response.model(UserResponseSchema)
+
+
+class AsyncPublicUsersClient(AsyncApiClient):
+    """Асинхронный клиент для работы с публичными эндпоинтами API управления пользователями."""
+
+    @step("Создаем пользователя")
+    @tracker.track_coverage_httpx(APIRoutes.USERS.base_url)
+    async def create_user_api(self, request: CreateUserRequestSchema) -> ApiResponse:
+        """Создает нового пользователя через API.
+
+        Args:
+            request (CreateUserRequestSchema): Данные для регистрации пользователя,
+                включая email, пароль и персональные данные.
+
+        Returns:
+            ApiResponse: Ответ сервера после попытки создания пользователя.
+        """
+        return await self.post(
+            APIRoutes.USERS.base_url, json=request.model_dump(by_alias=True)
+        )
+
+    async def create_user(self, request: CreateUserRequestSchema) -> UserResponseSchema:
+        """Выполняет регистрацию пользователя и возвращает обработанный JSON-ответ.
+
+        Args:
+            request (CreateUserRequestSchema): Учетные данные и персональная информация
+                нового пользователя (email, пароль, ФИО и т.д.).
+
+        Returns:
+            UserResponseSchema: Сериализованный JSON-ответ сервера с данными
+                созданного пользователя.
+        """
+        response = await self.create_user_api(request)
+        return response.model(UserResponseSchema)
 
 
 def get_public_users_client() -> PublicUsersClient:
@@ -50,3 +86,14 @@ def get_public_users_client() -> PublicUsersClient:
         PublicUsersClient: Экземпляр класса для работы с публичными эндпоинтами API.
     """
     return PublicUsersClient(client=get_public_http_client())
+
+
+def get_async_public_users_client() -> AsyncPublicUsersClient:
+    """
+    Функция создаёт экземпляр AsyncPublicUsersClient с уже настроенным HTTP-клиентом.
+
+    Returns:
+        AsyncPublicUsersClient: Экземпляр класса для асинхронной работы
+            с публичными эндпоинтами API.
+    """
+    return AsyncPublicUsersClient(client=get_async_public_http_client())
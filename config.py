@@ -1,4 +1,6 @@
-from typing import Self
+from pathlib import Path
+from typing import Literal, Self
+from httpx import Limits, Timeout
 from pydantic import BaseModel, HttpUrl, FilePath, DirectoryPath
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -12,6 +14,7 @@ class HTTPClientConfig(BaseModel):
 
     URL: HttpUrl
     TIMEOUT: float
+    HTTP2: bool = False
 
     @property
     def url_as_string(self):
@@ -20,6 +23,292 @@ class HTTPClientConfig(BaseModel):
         """
         return f"{self.URL}"
 
+    @property
+    def http_versions(self) -> dict[str, bool]:
+        """
+        Объект-свойство с параметрами http1/http2 для транспортов httpx.
+
+        Для https версия протокола согласуется через ALPN. Для http HTTP/2
+        возможен только с prior knowledge (h2c), поэтому HTTP/1.1 отключается.
+        """
+        if not self.HTTP2:
+            return {"http1": True, "http2": False}
+
+        return {"http1": self.URL.scheme == "https", "http2": True}
+
+
+class HTTPClientCacheConfig(BaseModel):
+    """
+    Класс для хранения настроек кеша приватных HTTP-клиентов.
+
+    Attrs:
+        MAX_SIZE (int): Максимальное количество клиентов в кеше воркера.
+        TTL (float): Время жизни клиента без обращений, в секундах.
+    """
+
+    MAX_SIZE: int = 32
+    TTL: float = 600
+
+
+class HTTPPoolConfig(BaseModel):
+    """
+    Класс для хранения настроек пула соединений и таймаутов HTTP-клиентов.
+
+    Не заданные таймауты берутся из HTTP_CLIENT.TIMEOUT.
+
+    Attrs:
+        MAX_CONNECTIONS (int | None): Максимальное количество соединений пула.
+        MAX_KEEPALIVE_CONNECTIONS (int | None): Максимальное количество
+            простаивающих keep-alive соединений.
+        KEEPALIVE_EXPIRY (float | None): Время простоя, после которого
+            keep-alive соединение закрывается, в секундах.
+        CONNECT_TIMEOUT (float | None): Таймаут установки соединения.
+        READ_TIMEOUT (float | None): Таймаут чтения ответа.
+        WRITE_TIMEOUT (float | None): Таймаут отправки запроса.
+        POOL_TIMEOUT (float | None): Таймаут ожидания свободного соединения пула.
+    """
+
+    MAX_CONNECTIONS: int | None = 100
+    MAX_KEEPALIVE_CONNECTIONS: int | None = 20
+    KEEPALIVE_EXPIRY: float | None = 5.0
+    CONNECT_TIMEOUT: float | None = None
+    READ_TIMEOUT: float | None = None
+    WRITE_TIMEOUT: float | None = None
+    POOL_TIMEOUT: float | None = None
+
+    @property
+    def limits(self) -> Limits:
+        """
+        Объект-свойство с лимитами пула соединений для транспортов httpx.
+        """
+        return Limits(
+            max_connections=self.MAX_CONNECTIONS,
+            max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=self.KEEPALIVE_EXPIRY,
+        )
+
+    def get_timeout(self, default: float) -> Timeout:
+        """
+        Возвращает таймауты httpx, подставляя default вместо не заданных (None)
+        значений. Заданный 0 сохраняется.
+
+        Args:
+            default (float): Общий таймаут HTTP-клиента.
+
+        Returns:
+            Timeout: Таймауты установки соединения, чтения, записи и ожидания пула.
+        """
+        return Timeout(
+            default,
+            connect=default if self.CONNECT_TIMEOUT is None else self.CONNECT_TIMEOUT,
+            read=default if self.READ_TIMEOUT is None else self.READ_TIMEOUT,
+            write=default if self.WRITE_TIMEOUT is None else self.WRITE_TIMEOUT,
+            pool=default if self.POOL_TIMEOUT is None else self.POOL_TIMEOUT,
+        )
+
+
+class TokenStoreConfig(BaseModel):
+    """
+    Класс для хранения настроек файлового хранилища токенов.
+
+    Attrs:
+        ENABLED (bool): Использовать ли хранилище перед запросом на /authentication/login.
+        FILE (Path): Путь к файлу хранилища, общему для всех xdist-воркеров.
+        EXPIRY_MARGIN (float): Запас в секундах до истечения токена,
+            при котором токен уже не используется.
+        DEFAULT_TTL (float): Время жизни токена, если его нельзя определить из JWT.
+    """
+
+    ENABLED: bool = True
+    FILE: Path = Path("./.pytest_cache/tokens.json")
+    EXPIRY_MARGIN: float = 60
+    DEFAULT_TTL: float = 1800
+
+
+class LatencyReportConfig(BaseModel):
+    """
+    Класс для хранения настроек отчёта о задержках эндпоинтов.
+
+    Attrs:
+        ENABLED (bool): Сохранять ли гистограммы задержек по итогам прогона.
+        RESULTS_DIR (Path): Каталог для гистограмм воркеров и итоговой сводки.
+        ACCURACY (float): Относительная погрешность перцентилей гистограмм.
+    """
+
+    ENABLED: bool = True
+    RESULTS_DIR: Path = Path("./latency-results")
+    ACCURACY: float = 0.01
+
+
+class SchemaValidationConfig(BaseModel):
+    """
+    Класс для хранения настроек проверки ответов по JSON-схемам.
+
+    Attrs:
+        AUTO (bool): Проверять ли каждый ответ ApiClient по схеме,
+            зарегистрированной для его метода, маршрута и статуса.
+        CACHE_DIR (Path): Каталог для сгенерированных JSON-схем моделей,
+            общий для всех xdist-воркеров.
+        POLICY (Literal["all", "sample", "first"]): Какие ответы проверять
+            автоматически: все, каждый SAMPLE_EVERY-й или первые FIRST ответов
+            каждого маршрута.
+        SAMPLE_EVERY (int): Шаг выборки для политики sample.
+        FIRST (int): Количество проверяемых ответов маршрута для политики first.
+        WORKERS (int): Количество фоновых потоков проверки. 0 означает проверку
+            в потоке запроса с исключением при несоответствии схеме.
+    """
+
+    AUTO: bool = True
+    CACHE_DIR: Path = Path("./.pytest_cache/json-schemas")
+    POLICY: Literal["all", "sample", "first"] = "all"
+    SAMPLE_EVERY: int = 10
+    FIRST: int = 5
+    WORKERS: int = 0
+
+
+class ParsingConfig(BaseModel):
+    """
+    Класс для хранения настроек разбора ответов в модели.
+
+    Attrs:
+        STRICT (bool): Строгий режим: тело ответа валидируется напрямую из байтов
+            закешированным TypeAdapter без приведения типов (например, "1" не
+            принимается вместо 1). По умолчанию тело разбирается один раз в
+            JSON-объект, общий с проверкой по JSON-схеме, и валидируется в
+            обычном (lax) режиме.
+    """
+
+    STRICT: bool = False
+
+
+class EntityPoolConfig(BaseModel):
+    """
+    Класс для хранения настроек пула тестовых сущностей одного типа.
+
+    Attrs:
+        SIZE (int): Количество свободных сущностей для монопольной выдачи
+            тестам, которые изменяют или удаляют сущность.
+        PREFILL (bool): Создавать ли все сущности пула параллельно при создании
+            пула (один раз за сессию воркера). По умолчанию сущности создаются
+            при первой выдаче.
+        REFILL (bool): Досоздавать ли свободные сущности до SIZE в фоне после
+            возврата монопольно выданной сущности.
+        SHAREABLE (bool): Выдавать ли одну общую сущность тестам, которые её
+            не изменяют. False — каждый тест получает сущность монопольно.
+    """
+
+    SIZE: int = 2
+    PREFILL: bool = False
+    REFILL: bool = True
+    SHAREABLE: bool = True
+
+
+class EntityPoolsConfig(BaseModel):
+    """
+    Класс для хранения настроек пулов тестовых сущностей по типам.
+
+    Attrs:
+        USERS (EntityPoolConfig): Пул пользователей. Монопольно выданный
+            пользователь после теста не переиспользуется.
+        FILES (EntityPoolConfig): Пул загруженных файлов.
+        COURSES (EntityPoolConfig): Пул курсов.
+        EXERCISES (EntityPoolConfig): Пул упражнений.
+    """
+
+    USERS: EntityPoolConfig = EntityPoolConfig(SIZE=0)
+    FILES: EntityPoolConfig = EntityPoolConfig(SIZE=1)
+    COURSES: EntityPoolConfig = EntityPoolConfig()
+    EXERCISES: EntityPoolConfig = EntityPoolConfig()
+
+
+class FixtureSetupConfig(BaseModel):
+    """
+    Класс для хранения настроек подготовки тестовых данных в фикстурах.
+
+    Attrs:
+        MODE (Literal["threads", "async"]): Как создавать элементы списков:
+            синхронными клиентами в пуле потоков или асинхронными клиентами
+            в отдельном event loop.
+        WORKERS (int): Количество потоков или одновременных запросов.
+            1 — элементы создаются последовательно.
+        COURSES_LIST_SIZE (int): Количество курсов в function_courses_list.
+        EXERCISES_LIST_SIZE (int): Количество упражнений в function_exercises.
+    """
+
+    MODE: Literal["threads", "async"] = "threads"
+    WORKERS: int = 8
+    COURSES_LIST_SIZE: int = 2
+    EXERCISES_LIST_SIZE: int = 2
+
+    @property
+    def is_concurrent(self) -> bool:
+        """
+        Объект-свойство: создаются ли элементы списков параллельно. В этом
+        случае порядок их создания на сервере не совпадает с порядком
+        элементов в фикстуре.
+        """
+        return self.WORKERS > 1
+
+
+class CleanupConfig(BaseModel):
+    """
+    Класс для хранения настроек удаления созданных тестовых данных.
+
+    Attrs:
+        ENABLED (bool): Записывать ли сущности, созданные методами create_*
+            доменных клиентов, и удалять ли их.
+        SCOPE (Literal["session", "test"]): Когда удалять сущности: в конце
+            сессии воркера или после каждого теста. Сущности пулов удаляются
+            только в конце сессии.
+        WORKERS (int): Количество потоков удаления.
+        RETRIES (int): Количество повторов удаления одной сущности.
+        RETRY_DELAY (float): Базовая пауза между повторами, в секундах.
+    """
+
+    ENABLED: bool = True
+    SCOPE: Literal["session", "test"] = "session"
+    WORKERS: int = 8
+    RETRIES: int = 2
+    RETRY_DELAY: float = 0.5
+
+
+class ReportingConfig(BaseModel):
+    """
+    Класс для хранения настроек вложений Allure.
+
+    Attrs:
+        CURL_ATTACHMENTS (Literal["always", "on_failure", "off"]): Когда
+            прикладывать cURL-команды запросов: к каждому запросу, только
+            к упавшим тестам или никогда.
+        CURL_BUFFER_SIZE (int): Количество последних запросов теста, которые
+            прикладываются к отчёту в режиме on_failure.
+        STEPS (Literal["full", "lean"]): Детализация шагов: full создаёт шаг
+            для каждого вызова и каждой проверки, lean оставляет только шаги
+            верхнего уровня и сворачивает проверки полей в одно вложение.
+    """
+
+    CURL_ATTACHMENTS: Literal["always", "on_failure", "off"] = "on_failure"
+    CURL_BUFFER_SIZE: int = 20
+    STEPS: Literal["full", "lean"] = "full"
+
+
+class LoggingConfig(BaseModel):
+    """
+    Класс для хранения настроек логирования.
+
+    Attrs:
+        LEVEL (str): Уровень логгеров проекта.
+        JSON_LOGS (bool): Дублировать ли логи в JSON Lines файл воркера.
+        JSON_LOGS_DIR (Path): Каталог для JSON-логов, по файлу на xdist-воркер.
+        SAMPLING (dict[str, int]): Шаг выборки записей для отдельных логгеров,
+            например {"HTTP_CLIENT": 10}. 0 отключает логгер.
+    """
+
+    LEVEL: str = "DEBUG"
+    JSON_LOGS: bool = False
+    JSON_LOGS_DIR: Path = Path("./logs")
+    SAMPLING: dict[str, int] = {}
+
 
 class TestData(BaseModel):
     """
@@ -43,10 +332,28 @@ class Settings(BaseSettings):
 
     TEST_DATA: TestData
     HTTP_CLIENT: HTTPClientConfig
+    HTTP_POOL: HTTPPoolConfig = HTTPPoolConfig()
+    HTTP_CLIENT_CACHE: HTTPClientCacheConfig = HTTPClientCacheConfig()
+    TOKEN_STORE: TokenStoreConfig = TokenStoreConfig()
+    LATENCY_REPORT: LatencyReportConfig = LatencyReportConfig()
+    SCHEMA_VALIDATION: SchemaValidationConfig = SchemaValidationConfig()
+    PARSING: ParsingConfig = ParsingConfig()
+    ENTITY_POOLS: EntityPoolsConfig = EntityPoolsConfig()
+    FIXTURE_SETUP: FixtureSetupConfig = FixtureSetupConfig()
+    CLEANUP: CleanupConfig = CleanupConfig()
+    REPORTING: ReportingConfig = ReportingConfig()
+    LOGGING: LoggingConfig = LoggingConfig()
     APP_INTERHAL_HOST: HttpUrl
     ALLURE_RESULTS_DIR: DirectoryPath
     API_VERSION: str = "/api/v1"
 
+    @property
+    def http_timeout(self) -> Timeout:
+        """
+        Объект-свойство с таймаутами HTTP-клиентов с учётом настроек HTTP_POOL.
+        """
+        return self.HTTP_POOL.get_timeout(self.HTTP_CLIENT.TIMEOUT)
+
     @classmethod
     def initialize(cls) -> Self:
         """
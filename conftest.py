@@ -4,5 +4,10 @@ pytest_plugins = [
     "fixtures.exercises",
     "fixtures.files",
     "fixtures.users",
+    "fixtures.pools",
     "fixtures.allure",
+    "fixtures.http",
+    "fixtures.latency",
+    "fixtures.schemas",
+    "fixtures.cleanup",
 ]
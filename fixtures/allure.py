@@ -1,7 +1,9 @@
 from typing import Iterator
 import pytest
 
+from config import settings
 from tools.allure.environment import create_allure_environment
+from tools.http.exchanges import http_exchanges
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -11,3 +13,26 @@ def save_allure_environment_file() -> Iterator[None]:
     """
     yield
     create_allure_environment()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item: pytest.Item) -> None:
+    """
+    Очищает буфер HTTP-обменов перед каждым тестом.
+    """
+    http_exchanges.clear()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    """
+    Прикладывает к упавшему тесту cURL-команды и ответы из буфера HTTP-обменов.
+
+    Срабатывает в режиме settings.REPORTING.CURL_ATTACHMENTS="on_failure"
+    для падений как в самом тесте, так и в его фикстурах.
+    """
+    outcome = yield
+    report: pytest.TestReport = outcome.get_result()
+
+    if report.failed and settings.REPORTING.CURL_ATTACHMENTS == "on_failure":
+        http_exchanges.attach()
@@ -0,0 +1,113 @@
+import json
+from http import HTTPStatus
+from typing import Iterator
+
+import allure
+import pytest
+
+from clients.api_response import ApiResponse
+from clients.authentication.authentication_client import get_authentication_client
+from clients.authentication.authentication_schema import (
+    AuthenticationUserSchema,
+    LoginRequestSchema,
+)
+from clients.courses.courses_client import get_courses_client
+from clients.exercises.exercises_client import get_exercises_client
+from clients.files.files_client import get_files_client
+from clients.users.private_users_client import get_private_users_client
+from config import settings
+from tools.cleanup_registry import cleanup_registry
+from tools.logger import get_logger
+
+
+logger = get_logger("CLEANUP")
+
+
+def delete_user(owner: AuthenticationUserSchema, entity_id: str) -> ApiResponse:
+    """
+    Удаляет пользователя от его собственного имени.
+
+    Сначала проверяет вход: если пользователь уже удалён тестом или его
+    данные для входа изменены вне ApiClient, возвращается ответ на вход
+    (401), и cleanup_registry считает пользователя удалённым.
+
+    Args:
+        owner (AuthenticationUserSchema): Данные для входа пользователя.
+        entity_id (str): Идентификатор пользователя.
+
+    Returns:
+        ApiResponse: Ответ на вход, если он не удался, иначе ответ на удаление.
+    """
+    login_response = get_authentication_client().login_api(
+        LoginRequestSchema(email=owner.email, password=owner.password)
+    )
+    if login_response.status_code != HTTPStatus.OK:
+        return login_response
+
+    return get_private_users_client(owner).delete_user_api(entity_id)
+
+
+def register_deleters() -> None:
+    """
+    Регистрирует функции удаления пользователей, файлов, курсов и упражнений.
+
+    Сущности удаляются от имени пользователя, который их создал: для
+    пользователя — от его собственного имени.
+    """
+    cleanup_registry.register_deleter(
+        "exercises",
+        lambda owner, entity_id: get_exercises_client(owner).delete_exercise_api(
+            entity_id
+        ),
+    )
+    cleanup_registry.register_deleter(
+        "courses",
+        lambda owner, entity_id: get_courses_client(owner).delete_course_api(entity_id),
+    )
+    cleanup_registry.register_deleter(
+        "files",
+        lambda owner, entity_id: get_files_client(owner).delete_file_api(entity_id),
+    )
+    cleanup_registry.register_deleter("users", delete_user)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def created_data_cleanup() -> Iterator[None]:
+    """
+    Удаляет все данные, созданные воркером, в конце сессии и прикладывает
+    к отчёту Allure отчёт об удалении: количество удалённых сущностей по
+    типам, скорость удаления и оставшиеся сущности.
+    """
+    register_deleters()
+    yield
+
+    if not settings.CLEANUP.ENABLED or not len(cleanup_registry):
+        return
+
+    report = cleanup_registry.cleanup("session")
+    logger.info(
+        f"Удалено тестовых данных: {report['entities'] - len(report['leftovers'])} "
+        f"из {report['entities']} за {report['duration']} с"
+    )
+    if report["leftovers"]:
+        logger.error(f"Не удалось удалить сущностей: {len(report['leftovers'])}")
+
+    allure.attach(
+        json.dumps(report, indent=2, ensure_ascii=False),
+        "Test data cleanup report",
+        allure.attachment_type.JSON,
+    )
+
+
+@pytest.fixture(autouse=True)
+def test_data_cleanup() -> Iterator[None]:
+    """
+    При CLEANUP.SCOPE=test удаляет данные, созданные тестом, сразу после него.
+    Сущности пулов остаются до конца сессии.
+    """
+    yield
+
+    if settings.CLEANUP.ENABLED and settings.CLEANUP.SCOPE == "test":
+        report = cleanup_registry.cleanup("test")
+        if report["leftovers"]:
+            logger.warning(f"Не удалось удалить после теста: {report['leftovers']}")
@@ -1,15 +1,23 @@
 import pytest
 from pydantic import BaseModel
 
-from fixtures.users import UserFixture
+from fixtures.users import UserFixture, create_user
 from fixtures.files import FileFixture
-from clients.courses.courses_client import CoursesClient, get_courses_client
+from clients.courses.courses_client import (
+    CoursesClient,
+    get_async_courses_client,
+    get_courses_client,
+)
 from clients.courses.courses_schema import (
     CreateCourseRequestSchema,
     CourseResponseSchema,
     GetCoursesResponseSchema,
     GetCoursesQuerySchema,
 )
+from clients.users.public_users_client import PublicUsersClient
+from config import settings
+from tools.entity_pool import EntityPool
+from tools.fan_out import create_entities, run_concurrently
 
 
 class CourseFixture(BaseModel):
@@ -68,39 +76,39 @@ class CoursesListFixture(BaseModel):
 
 
 @pytest.fixture
-def courses_client(function_user: UserFixture) -> CoursesClient:
+def courses_client(shared_user: UserFixture) -> CoursesClient:
     """
     Фикстура создает CoursesClient с уже настроенным HTTP-клиентом.
 
     Args:
-        function_user (UserFixture): Фикстура с данными пользователя.
+        shared_user (UserFixture): Общий пользователь воркера из пула.
 
     Returns:
         CoursesClient: Экземпляр CoursesClient для работы с эндпоинтами courses.
     """
-    return get_courses_client(function_user.authentication_user)
+    return get_courses_client(shared_user.authentication_user)
 
 
 @pytest.fixture
 def function_course(
     courses_client: CoursesClient,
-    function_user: UserFixture,
-    function_file: FileFixture,
+    shared_user: UserFixture,
+    shared_file: FileFixture,
 ) -> CourseFixture:
     """
-    Фикстура создает курс.
+    Фикстура создает новый курс с общими автором и файлом превью из пулов.
 
     Args:
         courses_client (CoursesClient): Клиент для работы с курсами.
-        function_user (UserFixture): Фикстура с данными пользователя.
-        function_file (FileFixture): Фикстура с данными файла.
+        shared_user (UserFixture): Общий пользователь воркера.
+        shared_file (FileFixture): Общий файл воркера.
 
     Returns:
         CourseFixtures: Объект с данными курса.
     """
     request = CreateCourseRequestSchema(
-        preview_file_id=function_file.file_id,
-        created_by_user_id=function_user.user_id,
+        preview_file_id=shared_file.file_id,
+        created_by_user_id=shared_user.user_id,
     )
     response = courses_client.create_course(request)
 
@@ -110,31 +118,47 @@ def function_course(
 @pytest.fixture
 def function_courses_list(
     courses_client: CoursesClient,
-    function_file: FileFixture,
-    function_user: UserFixture,
+    public_users_client: PublicUsersClient,
+    shared_user: UserFixture,
+    file_pool: EntityPool[FileFixture],
 ) -> CoursesListFixture:
     """
-    Фикстура создает список курсов.
+    Фикстура создает список курсов нового пользователя.
+
+    Пользователь создаётся одновременно с получением общего файла, а курсы
+    создаются параллельно (settings.FIXTURE_SETUP). Количество курсов задаётся
+    в settings.FIXTURE_SETUP.COURSES_LIST_SIZE.
 
     Args:
         courses_client (CoursesClient): Клиент для работы с курсами.
-        function_file (FileFixture): Фикстура с данными файла.
-        function_user (UserFixture): Фикстура с данными пользователя.
+        public_users_client (PublicUsersClient): Клиент для создания пользователя.
+        shared_user (UserFixture): Общий пользователь воркера, от имени
+            которого создаются курсы.
+        file_pool (EntityPool[FileFixture]): Пул файлов воркера.
 
     Returns:
         CoursesListFixture: Объект с данными списка курсов.
     """
-    request_first = CreateCourseRequestSchema(
-        preview_file_id=function_file.file_id,
-        created_by_user_id=function_user.user_id,
+    user, file = run_concurrently(
+        lambda: create_user(public_users_client),
+        file_pool.get_shared,
+        workers=settings.FIXTURE_SETUP.WORKERS,
     )
-    request_second = CreateCourseRequestSchema(
-        preview_file_id=function_file.file_id,
-        created_by_user_id=function_user.user_id,
+    requests = [
+        CreateCourseRequestSchema(
+            preview_file_id=file.file_id, created_by_user_id=user.user_id
+        )
+        for _ in range(settings.FIXTURE_SETUP.COURSES_LIST_SIZE)
+    ]
+    responses = create_entities(
+        courses_client,
+        lambda: get_async_courses_client(shared_user.authentication_user),
+        "create_course",
+        requests,
     )
-    response_first = courses_client.create_course(request_first).course
-    response_second = courses_client.create_course(request_second).course
     return CoursesListFixture(
-        request=GetCoursesQuerySchema(user_id=function_user.user_id),
-        response=GetCoursesResponseSchema(courses=[response_first, response_second]),
+        request=GetCoursesQuerySchema(user_id=user.user_id),
+        response=GetCoursesResponseSchema(
+            courses=[response.course for response in responses]
+        ),
     )
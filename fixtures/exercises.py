@@ -3,13 +3,19 @@ from pydantic import BaseModel
 
 from fixtures.users import UserFixture
 from fixtures.courses import CourseFixture
-from clients.exercises.exercises_client import ExercisesClient, get_exercises_client
+from clients.exercises.exercises_client import (
+    ExercisesClient,
+    get_async_exercises_client,
+    get_exercises_client,
+)
 from clients.exercises.exercises_schema import (
     CreateExerciseRequestSchema,
     ExerciseResponseSchema,
     GetExercisesQuerySchema,
     GetExercisesResponseSchema,
 )
+from config import settings
+from tools.fan_out import create_entities
 
 
 class ExerciseFixture(BaseModel):
@@ -55,35 +61,35 @@ class ExercisesListFixture(BaseModel):
 
 
 @pytest.fixture
-def exercises_client(function_user: UserFixture) -> ExercisesClient:
+def exercises_client(shared_user: UserFixture) -> ExercisesClient:
     """
     Фикстура для получения экземпляра класса ExercisesClient.
 
     Args:
-        function_user (UserFixture): фикстура с данными пользователя.
+        shared_user (UserFixture): общий пользователь воркера из пула.
 
     Returns:
         ExercisesClient:
         Экземпляр класса ExercisesClient для работы с эндпоинтами exercises.
     """
-    return get_exercises_client(function_user.authentication_user)
+    return get_exercises_client(shared_user.authentication_user)
 
 
 @pytest.fixture
 def function_exercise(
-    exercises_client: ExercisesClient, function_course: CourseFixture
+    exercises_client: ExercisesClient, shared_course: CourseFixture
 ) -> ExerciseFixture:
     """
-    Фикстура для создания упражнения.
+    Фикстура для создания упражнения в общем курсе воркера.
 
     Args:
-        function_course (CourseFixture): фикстура с данными курса.
+        shared_course (CourseFixture): общий курс воркера из пула.
 
     Returns:
         ExerciseFixture:
         Объект с данными о созданном упражнении.
     """
-    request = CreateExerciseRequestSchema(course_id=function_course.course_id)
+    request = CreateExerciseRequestSchema(course_id=shared_course.course_id)
     response = exercises_client.create_exercise(request)
 
     return ExerciseFixture(request=request, response=response)
@@ -91,14 +97,21 @@ def function_exercise(
 
 @pytest.fixture
 def function_exercises(
-    exercises_client: ExercisesClient, function_course: CourseFixture
+    exercises_client: ExercisesClient,
+    function_course: CourseFixture,
+    shared_user: UserFixture,
 ) -> ExercisesListFixture:
     """
     Фикстура для получения списка упражнений.
 
+    Упражнения создаются параллельно (settings.FIXTURE_SETUP), их количество
+    задаётся в settings.FIXTURE_SETUP.EXERCISES_LIST_SIZE.
+
     Args:
         exercises_client (ExercisesClient): экземпляр класса ExercisesClient.
         function_course (CourseFixture): фикстура с данными курса.
+        shared_user (UserFixture): общий пользователь воркера, от имени
+            которого создаются упражнения.
 
     Returns:
         ExercisesListFixture:
@@ -107,12 +120,15 @@ def function_exercises(
 
     create_exercise_requests = [
         CreateExerciseRequestSchema(course_id=function_course.course_id)
-        for _ in range(2)
-    ]
-    exercises = [
-        exercises_client.create_exercise(request).exercise
-        for request in create_exercise_requests
+        for _ in range(settings.FIXTURE_SETUP.EXERCISES_LIST_SIZE)
     ]
+    responses = create_entities(
+        exercises_client,
+        lambda: get_async_exercises_client(shared_user.authentication_user),
+        "create_exercise",
+        create_exercise_requests,
+    )
+    exercises = [response.exercise for response in responses]
     return ExercisesListFixture(
         request=GetExercisesQuerySchema(
             course_id=function_course.course_id,
@@ -30,17 +30,17 @@ class FileFixture(BaseModel):
 
 
 @pytest.fixture
-def files_client(function_user: UserFixture) -> FilesClient:
+def files_client(shared_user: UserFixture) -> FilesClient:
     """
     Фикстура возвращает экземпляр FilesClient с авторизованным HTTP-клиентом.
 
     Args:
-        function_user (UserFixture): Объект с данными созданного пользователя.
+        shared_user (UserFixture): Общий пользователь воркера из пула.
 
     Returns:
         FilesClient: Экземпляр класса для работы с files эндпоинтами API.
     """
-    return get_files_client(function_user.authentication_user)
+    return get_files_client(shared_user.authentication_user)
 
 
 @pytest.fixture
@@ -0,0 +1,64 @@
+import json
+import os
+from typing import Iterator
+
+import allure
+import pytest
+
+from clients.http_transport import get_shared_transport, shutdown_shared_transport
+from clients.private_http_builder import (
+    close_private_http_clients,
+    get_private_http_client_cache_stats,
+)
+from clients.request_timing import phase_timings
+
+
+@pytest.fixture(scope="session", autouse=True)
+def shared_http_transport() -> Iterator[None]:
+    """
+    Закрывает HTTP-клиенты воркера после выполнения всех тестов.
+
+    Сначала закрываются все закешированные приватные клиенты, затем общий
+    пул соединений. Статистика кеша клиентов, переиспользования соединений
+    и время фаз запросов по маршрутам прикладываются к отчёту Allure.
+    """
+    yield
+
+    statistics = {
+        "worker": os.environ.get("PYTEST_XDIST_WORKER", "master"),
+        "private_http_client_cache": get_private_http_client_cache_stats(),
+        "connection_pool": get_shared_transport().stats.as_dict(),
+    }
+    allure.attach(
+        json.dumps(statistics, indent=2),
+        "HTTP clients statistics",
+        allure.attachment_type.JSON,
+    )
+    allure.attach(
+        json.dumps(phase_timings.as_dict(), indent=2),
+        "HTTP request phase timings",
+        allure.attachment_type.JSON,
+    )
+
+    close_private_http_clients()
+    shutdown_shared_transport()
+
+
+@pytest.fixture(autouse=True)
+def http_pool_statistics() -> Iterator[None]:
+    """
+    Прикладывает к отчёту Allure статистику пула соединений за время теста.
+
+    Учитываются запросы как самого теста, так и его фикстур: открытые и
+    переиспользованные соединения, ожидание свободного соединения пула,
+    таймауты пула и закрытия простаивавших соединений.
+    """
+    with get_shared_transport().collect_stats() as statistics:
+        yield
+
+    if statistics.requests or statistics.pool_timeouts:
+        allure.attach(
+            json.dumps(statistics.as_dict(), indent=2),
+            "HTTP pool statistics",
+            allure.attachment_type.JSON,
+        )
@@ -0,0 +1,68 @@
+import json
+import os
+from typing import Iterator
+
+import allure
+import pytest
+
+from clients.api_latency import EndpointLatencies, endpoint_latencies
+from config import settings
+from tools.logger import get_logger
+
+
+logger = get_logger("LATENCY_REPORT")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Удаляет гистограммы воркеров, оставшиеся от предыдущего прогона.
+
+    Выполняется только в управляющем процессе, до запуска xdist-воркеров.
+    """
+    if hasattr(config, "workerinput") or not settings.LATENCY_REPORT.ENABLED:
+        return
+
+    for path in settings.LATENCY_REPORT.RESULTS_DIR.glob("worker-*.json"):
+        path.unlink()
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """
+    Сохраняет гистограммы воркера, а в управляющем процессе сводит
+    гистограммы всех воркеров в summary.json и summary.csv.
+    """
+    if not settings.LATENCY_REPORT.ENABLED:
+        return
+
+    results_dir = settings.LATENCY_REPORT.RESULTS_DIR
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    if len(endpoint_latencies):
+        endpoint_latencies.dump(results_dir / f"worker-{worker}.json")
+
+    if hasattr(session.config, "workerinput"):
+        return
+
+    merged = EndpointLatencies(settings.LATENCY_REPORT.ACCURACY)
+    for path in sorted(results_dir.glob("worker-*.json")):
+        merged.merge(EndpointLatencies.load(path, settings.LATENCY_REPORT.ACCURACY))
+
+    if not len(merged):
+        return
+
+    merged.write_summary(results_dir / "summary.json", results_dir / "summary.csv")
+    logger.info(f"Сводка задержек эндпоинтов сохранена в {results_dir.resolve()}")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def endpoint_latency_report() -> Iterator[None]:
+    """
+    Прикладывает к отчёту Allure перцентили задержек эндпоинтов воркера.
+    """
+    yield
+
+    if settings.LATENCY_REPORT.ENABLED and len(endpoint_latencies):
+        allure.attach(
+            json.dumps(endpoint_latencies.summary(), indent=2),
+            "API latency percentiles",
+            allure.attachment_type.JSON,
+        )
@@ -0,0 +1,271 @@
+from http import HTTPStatus
+from typing import Callable, Iterator, TypeVar
+
+import pytest
+
+from clients.courses.courses_client import get_courses_client
+from clients.courses.courses_schema import (
+    CourseResponseSchema,
+    CreateCourseRequestSchema,
+)
+from clients.exercises.exercises_client import get_exercises_client
+from clients.exercises.exercises_schema import (
+    CreateExerciseRequestSchema,
+    ExerciseResponseSchema,
+)
+from clients.files.files_client import get_files_client
+from clients.files.files_schema import UploadFileRequestSchema, UploadFileResponseSchema
+from clients.users.public_users_client import get_public_users_client
+from config import EntityPoolConfig, settings
+from fixtures.courses import CourseFixture
+from fixtures.exercises import ExerciseFixture
+from fixtures.files import FileFixture
+from fixtures.users import UserFixture, create_user
+from tools.cleanup_registry import cleanup_registry
+from tools.entity_pool import EntityPool
+from tools.logger import get_logger
+
+
+logger = get_logger("ENTITY_POOL")
+
+T = TypeVar("T")
+
+
+def build_pool(
+    name: str,
+    config: EntityPoolConfig,
+    factory: Callable[[], T],
+    refresh: Callable[[T], T | None] | None = None,
+) -> EntityPool[T]:
+    """
+    Функция создаёт пул сущностей по настройкам типа и при PREFILL заполняет его.
+
+    Сущности пула удаляются реестром cleanup_registry только в конце сессии.
+
+    Args:
+        name (str): Название пула.
+        config (EntityPoolConfig): Настройки пула из settings.ENTITY_POOLS.
+        factory (Callable[[], T]): Функция создания сущности.
+        refresh (Callable[[T], T | None] | None): Функция, перечитывающая
+            сущность после монопольного использования.
+
+    Returns:
+        EntityPool[T]: Пул сущностей.
+    """
+    def create() -> T:
+        with cleanup_registry.keep_until_session_end():
+            return factory()
+
+    pool = EntityPool(
+        name=name,
+        factory=create,
+        size=config.SIZE,
+        refill=config.REFILL,
+        shareable=config.SHAREABLE,
+        refresh=refresh,
+    )
+    if config.PREFILL:
+        pool.fill()
+        logger.info(f"Пул {name} заполнен: {pool.stats()}")
+
+    return pool
+
+
+def close_pool(pool: EntityPool) -> None:
+    """
+    Функция останавливает фоновое досоздание сущностей и логирует сводку пула.
+
+    Args:
+        pool (EntityPool): Пул сущностей.
+    """
+    pool.close()
+    logger.info(f"Сводка пула {pool.name}: {pool.stats()}")
+
+
+@pytest.fixture(scope="session")
+def user_pool() -> Iterator[EntityPool[UserFixture]]:
+    """
+    Фикстура создаёт пул пользователей воркера.
+
+    Общий пользователь пула — автор общих файлов, курсов и упражнений и
+    владелец клиентов courses_client, exercises_client и files_client.
+    """
+
+    pool = build_pool(
+        "users",
+        settings.ENTITY_POOLS.USERS,
+        lambda: create_user(get_public_users_client()),
+    )
+    yield pool
+    close_pool(pool)
+
+
+@pytest.fixture(scope="session")
+def file_pool(
+    user_pool: EntityPool[UserFixture],
+) -> Iterator[EntityPool[FileFixture]]:
+    """
+    Фикстура создаёт пул файлов воркера, загруженных общим пользователем.
+    """
+
+    def get_client():
+        return get_files_client(user_pool.get_shared().authentication_user)
+
+    def create_file() -> FileFixture:
+        request = UploadFileRequestSchema(
+            upload_file=settings.TEST_DATA.IMAGE_JPEG_FILE
+        )
+        response = get_client().upload_file(request)
+        return FileFixture(request=request, response=response)
+
+    def refresh_file(file: FileFixture) -> FileFixture | None:
+        response = get_client().get_file_api(file.file_id)
+        if response.status_code != HTTPStatus.OK:
+            return None
+        return file.model_copy(
+            update={"response": response.model(UploadFileResponseSchema)}
+        )
+
+    pool = build_pool("files", settings.ENTITY_POOLS.FILES, create_file, refresh_file)
+    yield pool
+    close_pool(pool)
+
+
+@pytest.fixture(scope="session")
+def course_pool(
+    user_pool: EntityPool[UserFixture], file_pool: EntityPool[FileFixture]
+) -> Iterator[EntityPool[CourseFixture]]:
+    """
+    Фикстура создаёт пул курсов воркера с общими автором и файлом превью.
+    """
+
+    def get_client():
+        return get_courses_client(user_pool.get_shared().authentication_user)
+
+    def create_course() -> CourseFixture:
+        request = CreateCourseRequestSchema(
+            preview_file_id=file_pool.get_shared().file_id,
+            created_by_user_id=user_pool.get_shared().user_id,
+        )
+        response = get_client().create_course(request)
+        return CourseFixture(request=request, response=response)
+
+    def refresh_course(course: CourseFixture) -> CourseFixture | None:
+        response = get_client().get_course_api(course.course_id)
+        if response.status_code != HTTPStatus.OK:
+            return None
+        return course.model_copy(
+            update={"response": response.model(CourseResponseSchema)}
+        )
+
+    pool = build_pool(
+        "courses", settings.ENTITY_POOLS.COURSES, create_course, refresh_course
+    )
+    yield pool
+    close_pool(pool)
+
+
+@pytest.fixture(scope="session")
+def exercise_pool(
+    user_pool: EntityPool[UserFixture], course_pool: EntityPool[CourseFixture]
+) -> Iterator[EntityPool[ExerciseFixture]]:
+    """
+    Фикстура создаёт пул упражнений воркера в общем курсе.
+    """
+
+    def get_client():
+        return get_exercises_client(user_pool.get_shared().authentication_user)
+
+    def create_exercise() -> ExerciseFixture:
+        request = CreateExerciseRequestSchema(
+            course_id=course_pool.get_shared().course_id
+        )
+        response = get_client().create_exercise(request)
+        return ExerciseFixture(request=request, response=response)
+
+    def refresh_exercise(exercise: ExerciseFixture) -> ExerciseFixture | None:
+        response = get_client().get_exercise_api(exercise.exercise_id)
+        if response.status_code != HTTPStatus.OK:
+            return None
+        return exercise.model_copy(
+            update={"response": response.model(ExerciseResponseSchema)}
+        )
+
+    pool = build_pool(
+        "exercises", settings.ENTITY_POOLS.EXERCISES, create_exercise, refresh_exercise
+    )
+    yield pool
+    close_pool(pool)
+
+
+@pytest.fixture
+def shared_user(user_pool: EntityPool[UserFixture]) -> Iterator[UserFixture]:
+    """
+    Фикстура выдаёт общего пользователя воркера для тестов, которые его не изменяют.
+    """
+    with user_pool.lease() as user:
+        yield user
+
+
+@pytest.fixture
+def shared_file(file_pool: EntityPool[FileFixture]) -> Iterator[FileFixture]:
+    """
+    Фикстура выдаёт общий файл воркера для тестов, которые его не изменяют.
+    """
+    with file_pool.lease() as file:
+        yield file
+
+
+@pytest.fixture
+def leased_file(file_pool: EntityPool[FileFixture]) -> Iterator[FileFixture]:
+    """
+    Фикстура монопольно выдаёт файл из пула и возвращает его после теста.
+    Удалённый тестом файл в пул не возвращается.
+    """
+    with file_pool.lease(exclusive=True) as file:
+        yield file
+
+
+@pytest.fixture
+def shared_course(course_pool: EntityPool[CourseFixture]) -> Iterator[CourseFixture]:
+    """
+    Фикстура выдаёт общий курс воркера для тестов, которые его не изменяют.
+
+    В общий курс тесты могут добавлять упражнения, поэтому он не подходит
+    для проверки списка упражнений курса (для этого есть function_course).
+    """
+    with course_pool.lease() as course:
+        yield course
+
+
+@pytest.fixture
+def leased_course(course_pool: EntityPool[CourseFixture]) -> Iterator[CourseFixture]:
+    """
+    Фикстура монопольно выдаёт курс из пула и возвращает его после теста
+    с перечитанными данными. Удалённый тестом курс в пул не возвращается.
+    """
+    with course_pool.lease(exclusive=True) as course:
+        yield course
+
+
+@pytest.fixture
+def shared_exercise(
+    exercise_pool: EntityPool[ExerciseFixture],
+) -> Iterator[ExerciseFixture]:
+    """
+    Фикстура выдаёт общее упражнение воркера для тестов, которые его не изменяют.
+    """
+    with exercise_pool.lease() as exercise:
+        yield exercise
+
+
+@pytest.fixture
+def leased_exercise(
+    exercise_pool: EntityPool[ExerciseFixture],
+) -> Iterator[ExerciseFixture]:
+    """
+    Фикстура монопольно выдаёт упражнение из пула и возвращает его после теста
+    с перечитанными данными. Удалённое тестом упражнение в пул не возвращается.
+    """
+    with exercise_pool.lease(exclusive=True) as exercise:
+        yield exercise
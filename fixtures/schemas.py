@@ -0,0 +1,59 @@
+import json
+from typing import Iterator
+
+import allure
+import pytest
+
+from clients.response_schemas import register_response_schemas
+from clients.schema_validation import response_schema_validator
+from tools.logger import get_logger
+from tools.schema_registry import schema_registry
+
+
+logger = get_logger("SCHEMA_REGISTRY")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Заранее генерирует JSON-схемы всех моделей ответов и сохраняет их на диск.
+
+    Выполняется только в управляющем процессе, до запуска xdist-воркеров:
+    воркеры затем читают готовые схемы из кеша, а не генерируют их заново.
+    Схемы, исходный код моделей которых не менялся, повторно не генерируются.
+    """
+    if hasattr(config, "workerinput"):
+        return
+
+    register_response_schemas()
+    count = schema_registry.build()
+    logger.info(
+        f"JSON-схемы моделей ответов ({count}) готовы в {schema_registry.cache_dir}"
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def response_schema_validation_summary() -> Iterator[None]:
+    """
+    Прикладывает к отчёту Allure сводку автоматической проверки ответов по
+    JSON-схемам: проверенные, пропущенные политикой выборки и несоответствующие
+    схеме ответы по маршрутам, а также ошибки фоновых проверок с тестом
+    и запросом, в которых они найдены.
+    """
+    yield
+
+    response_schema_validator.close()
+    summary = response_schema_validator.summary()
+    if not summary:
+        return
+
+    failures = response_schema_validator.failures
+    if failures:
+        logger.error(f"Ответов, не соответствующих JSON-схеме: {len(failures)}")
+
+    allure.attach(
+        json.dumps(
+            {"routes": summary, "failures": failures}, indent=2, ensure_ascii=False
+        ),
+        "JSON schema validation summary",
+        allure.attachment_type.JSON,
+    )
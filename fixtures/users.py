@@ -64,6 +64,22 @@ class UserFixture(BaseModel):
         return self.response.user.id
 
 
+def create_user(public_users_client: PublicUsersClient) -> UserFixture:
+    """
+    Функция создаёт пользователя и возвращает его данные.
+
+    Args:
+        public_users_client (PublicUsersClient): Клиент для работы с публичными эндпоинтами API.
+
+    Returns:
+        UserFixture: Объект с данными созданного пользователя.
+    """
+    request = CreateUserRequestSchema()
+    response = public_users_client.create_user(request)
+
+    return UserFixture(request=request, response=response)
+
+
 @pytest.fixture
 def public_users_client() -> PublicUsersClient:
     """Фикстура возвращает экземпляр PublicUsersClient.
@@ -86,10 +102,7 @@ def function_user(public_users_client: PublicUsersClient) -> UserFixture:
     Returns:
         UserFixture: Объект с данными созданного пользователя.
     """
-    request = CreateUserRequestSchema()
-    response = public_users_client.create_user(request)
-
-    return UserFixture(request=request, response=response)
+    return create_user(public_users_client)
 
 
 @pytest.fixture
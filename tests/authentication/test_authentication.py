@@ -64,12 +64,12 @@ class TestAuthentication:
             email=function_user.email, password=function_user.password
         )
         response = authentication_client.login_api(request)
-        response_data = LoginResponseSchema.model_validate_json(response.text)
+        response_data = response.model(LoginResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_login_response(response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), LoginResponseSchema)
 
     @allure.story(AllureStory.LOGIN)
     @allure.sub_suite(AllureStory.LOGIN)
@@ -88,16 +88,12 @@ class TestAuthentication:
             refresh_token=login_response.token.refresh_token
         )
         refresh_response = authentication_client.refresh_api(refresh_request)
-        refresh_response_data = LoginResponseSchema.model_validate_json(
-            refresh_response.text
-        )
+        refresh_response_data = refresh_response.model(LoginResponseSchema)
 
         assert_status_code(refresh_response.status_code, HTTPStatus.OK)
         assert_login_response(refresh_response_data)
 
-        validate_json_schema(
-            refresh_response.json(), refresh_response_data.model_json_schema()
-        )
+        validate_json_schema(refresh_response.json(), LoginResponseSchema)
 
     @allure.story(AllureStory.VALIDATE_ENTITY)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
@@ -120,12 +116,12 @@ class TestAuthentication:
         response = authentication_client.refresh_api(
             RefreshRequestSchema(refresh_token="incorrect-token")
         )
-        response_data = InternalErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(InternalErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNAUTHORIZED)
         assert_refresh_token_with_incorrect_token_response(actual=response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), InternalErrorResponseSchema)
 
     @allure.story(AllureStory.VALIDATE_ENTITY)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
@@ -136,9 +132,9 @@ class TestAuthentication:
     ):
         request = LoginRequestSchema(email="", password="password")
         response = authentication_client.login_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_login_with_incorrect_email_response(actual=response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
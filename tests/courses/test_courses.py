@@ -70,12 +70,12 @@ class TestCourses:
 
         request = GetCoursesQuerySchema(user_id=function_courses_list.user_id)
         response = courses_client.get_courses_api(request)
-        response_data = GetCoursesResponseSchema.model_validate_json(response.text)
+        response_data = response.model(GetCoursesResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_get_courses_response(function_courses_list.response, response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), GetCoursesResponseSchema)
 
     @allure.tag(AllureTag.CREATE_ENTITY)
     @allure.story(AllureStory.CREATE_ENTITY)
@@ -85,29 +85,29 @@ class TestCourses:
     def test_create_course(
         self,
         courses_client: CoursesClient,
-        function_user: UserFixture,
-        function_file: FileFixture,
+        shared_user: UserFixture,
+        shared_file: FileFixture,
     ):
         """
         Тест создания курса.
 
         Args:
             courses_client (CoursesClient): Клиент для работы с курсами.
-            function_user (UserFixture): Фикстура с данными пользователя.
-            function_file (FileFixture): Фикстура с данными файла.
+            shared_user (UserFixture): Общий пользователь воркера из пула.
+            shared_file (FileFixture): Общий файл воркера из пула.
         """
 
         request = CreateCourseRequestSchema(
-            preview_file_id=function_file.file_id,
-            created_by_user_id=function_user.user_id,
+            preview_file_id=shared_file.file_id,
+            created_by_user_id=shared_user.user_id,
         )
         response = courses_client.create_course_api(request)
-        response_data = CourseResponseSchema.model_validate_json(response.text)
+        response_data = response.model(CourseResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_create_course_response(request=request, response=response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), CourseResponseSchema)
 
     @allure.tag(AllureTag.GET_ENTITY)
     @allure.story(AllureStory.GET_ENTITY)
@@ -115,22 +115,22 @@ class TestCourses:
     @allure.severity(Severity.BLOCKER)
     @allure.title("Получение курса по id")
     def test_get_course(
-        self, function_course: CourseFixture, courses_client: CoursesClient
+        self, shared_course: CourseFixture, courses_client: CoursesClient
     ):
         """
         Тест получения курса.
 
         Args:
-            function_course (CourseFixture): Фикстура с данными курса.
+            shared_course (CourseFixture): Общий курс воркера из пула.
             courses_client (CoursesClient): Клиент для работы с курсами.
         """
-        response = courses_client.get_course_api(course_id=function_course.course_id)
-        response_data = CourseResponseSchema.model_validate_json(response.text)
+        response = courses_client.get_course_api(course_id=shared_course.course_id)
+        response_data = response.model(CourseResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
-        assert_get_course_response(function_course.response, response_data)
+        assert_get_course_response(shared_course.response, response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), CourseResponseSchema)
 
     @allure.tag(AllureTag.UPDATE_ENTITY)
     @allure.story(AllureStory.UPDATE_ENTITY)
@@ -138,25 +138,25 @@ class TestCourses:
     @allure.severity(Severity.CRITICAL)
     @allure.title("Обновление курса")
     def test_update_course(
-        self, function_course: CourseFixture, courses_client: CoursesClient
+        self, leased_course: CourseFixture, courses_client: CoursesClient
     ):
         """
         Тест обновления курса.
 
         Args:
-            function_course (CourseFixture): Фикстура с данными курса.
+            leased_course (CourseFixture): Курс, монопольно выданный из пула.
             courses_client (CoursesClient): Клиент для работы с курсами.
         """
         request = UpdateCourseRequestSchema()
         response = courses_client.update_course_api(
-            course_id=function_course.course_id, request=request
+            course_id=leased_course.course_id, request=request
         )
-        response_data = CourseResponseSchema.model_validate_json(response.text)
+        response_data = response.model(CourseResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
-        assert_update_course_response(request, response_data, function_course.course_id)
+        assert_update_course_response(request, response_data, leased_course.course_id)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), CourseResponseSchema)
 
     @allure.tag(AllureTag.DELETE_ENTITY)
     @allure.story(AllureStory.DELETE_ENTITY)
@@ -164,23 +164,21 @@ class TestCourses:
     @allure.severity(Severity.CRITICAL)
     @allure.title("Удаление курса")
     def test_delete_course(
-        self, function_course: CourseFixture, courses_client: CoursesClient
+        self, leased_course: CourseFixture, courses_client: CoursesClient
     ):
         """
         Тест удаления курса.
 
         Args:
-            function_course (CourseFixture): Фикстура с данными курса.
+            leased_course (CourseFixture): Курс, монопольно выданный из пула.
             courses_client (CoursesClient): Клиент для работы с курсами.
         """
 
-        delete_response = courses_client.delete_course_api(function_course.course_id)
+        delete_response = courses_client.delete_course_api(leased_course.course_id)
         assert_status_code(delete_response.status_code, HTTPStatus.OK)
 
-        get_response = courses_client.get_course_api(function_course.course_id)
-        get_response_data = InternalErrorResponseSchema.model_validate_json(
-            get_response.text
-        )
+        get_response = courses_client.get_course_api(leased_course.course_id)
+        get_response_data = get_response.model(InternalErrorResponseSchema)
 
         assert_status_code(get_response.status_code, HTTPStatus.NOT_FOUND)
         assert_not_found_course_response(get_response_data)
@@ -208,14 +206,14 @@ class TestCourses:
         setattr(request, field_name, "")
 
         response = courses_client.create_course_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_create_course_with_empty_field_response(
             response_data, FIELD_NAME_MAPPING.get(field_name)
         )
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @pytest.mark.parametrize("field_name", ["preview_file_id", "created_by_user_id"])
     @allure.tag(AllureTag.VALIDATE_ENTITY)
@@ -238,7 +236,7 @@ class TestCourses:
         request = CreateCourseRequestSchema()
         setattr(request, field_name, "incorrect-id")
         response = courses_client.create_course_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_create_course_with_incorrect_field_id_response(
@@ -261,14 +259,14 @@ class TestCourses:
         too_long_string = "a" * (MAX_LENGTH_FIELDS.get("title") + 1)
         request = CreateCourseRequestSchema(title=too_long_string)
         response = courses_client.create_course_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_create_or_update_course_with_too_long_title_response(
             response_data, too_long_string
         )
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
@@ -278,27 +276,27 @@ class TestCourses:
         "Обновление курса с названием превышающим максимально допустимую длину"
     )
     def test_update_course_with_too_long_title(
-        self, courses_client: CoursesClient, function_course: CourseFixture
+        self, courses_client: CoursesClient, shared_course: CourseFixture
     ):
         """
         Тест обновления курса с слишком длинным названием.
 
         Args:
             courses_client (CoursesClient): Клиент для работы с курсами.
-            function_course (CourseFixture): Фикстура с данными курса.
+            shared_course (CourseFixture): Общий курс воркера из пула.
         """
 
         too_long_string = "a" * (MAX_LENGTH_FIELDS.get("title") + 1)
         request = UpdateCourseRequestSchema(title=too_long_string)
-        response = courses_client.update_course_api(function_course.course_id, request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response = courses_client.update_course_api(shared_course.course_id, request)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_create_or_update_course_with_too_long_title_response(
             response_data, too_long_string
         )
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
@@ -307,11 +305,11 @@ class TestCourses:
     @allure.title("Получение несуществующего курса")
     def test_get_course_with_non_existent_id(self, courses_client: CoursesClient):
         response = courses_client.get_course_api(course_id=fake.uuid4())
-        response_data = InternalErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(InternalErrorResponseSchema)
         assert_status_code(response.status_code, HTTPStatus.NOT_FOUND)
         assert_not_found_course_response(response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), InternalErrorResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
@@ -320,11 +318,11 @@ class TestCourses:
     @allure.title("Удаление несуществующего курса")
     def test_delete_course_with_non_existent_id(self, courses_client: CoursesClient):
         response = courses_client.delete_course_api(course_id=fake.uuid4())
-        response_data = InternalErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(InternalErrorResponseSchema)
         assert_status_code(response.status_code, HTTPStatus.NOT_FOUND)
         assert_not_found_course_response(response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), InternalErrorResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
@@ -333,12 +331,12 @@ class TestCourses:
     @allure.title("Удаление курса по некорректному идентификатору")
     def test_delete_course_with_incorrect_id(self, courses_client: CoursesClient):
         response = courses_client.delete_course_api(course_id="incorrect-id")
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_delete_course_with_incorrect_id_response(actual=response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
@@ -348,12 +346,12 @@ class TestCourses:
     def test_get_courses_with_non_existent_id(self, courses_client: CoursesClient):
         request = GetCoursesQuerySchema(user_id=fake.uuid4())
         response = courses_client.get_courses_api(request)
-        response_data = GetCoursesResponseSchema.model_validate_json(response.text)
+        response_data = response.model(GetCoursesResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_get_courses_with_non_existent_id_response(response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), GetCoursesResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
@@ -363,12 +361,12 @@ class TestCourses:
     def test_get_courses_with_incorrect_id(self, courses_client: CoursesClient):
         request = GetCoursesQuerySchema(user_id="incorrect-id")
         response = courses_client.get_courses_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_get_courses_with_incorrect_id_response(response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
@@ -377,9 +375,9 @@ class TestCourses:
     @allure.title("Получение курса по некорректному идентификатору")
     def test_get_course_with_incorrect_id(self, courses_client: CoursesClient):
         response = courses_client.get_course_api(course_id="incorrect-id")
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_get_course_with_incorrect_id_response(response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
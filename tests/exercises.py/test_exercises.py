@@ -58,25 +58,25 @@ class TestExercises:
     @allure.severity(Severity.BLOCKER)
     @allure.title("Создание упражнения")
     def test_create_exercise(
-        self, exercises_client: ExercisesClient, function_course: CourseFixture
+        self, exercises_client: ExercisesClient, shared_course: CourseFixture
     ):
         """
         Тест создания упражнения.
 
         Args:
             exercises_client (ExercisesClient): Клиент для работы с упражнениями.
-            function_course (CourseFixture): Фикстура с данными курса.
+            shared_course (CourseFixture): Общий курс воркера из пула.
 
         """
 
-        request = CreateExerciseRequestSchema(course_id=function_course.course_id)
+        request = CreateExerciseRequestSchema(course_id=shared_course.course_id)
         response = exercises_client.create_exercise_api(request)
-        response_data = ExerciseResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ExerciseResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_create_exercise_response(response_data, request)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ExerciseResponseSchema)
 
     @allure.tag(AllureTag.GET_ENTITY)
     @allure.severity(Severity.BLOCKER)
@@ -84,25 +84,25 @@ class TestExercises:
     @allure.sub_suite(AllureStory.GET_ENTITY)
     @allure.title("Получение упражнения")
     def test_get_exercise(
-        self, exercises_client: ExercisesClient, function_exercise: ExerciseFixture
+        self, exercises_client: ExercisesClient, shared_exercise: ExerciseFixture
     ):
         """
         Тест получения информации об упражнении.
 
         Args:
             exercises_client (ExercisesClient): Клиент для работы с упражнениями.
-            function_exercise (ExerciseFixture): Фикстура с данными упражнения.
+            shared_exercise (ExerciseFixture): Общее упражнение воркера из пула.
         """
 
-        response = exercises_client.get_exercise_api(function_exercise.exercise_id)
-        response_data = ExerciseResponseSchema.model_validate_json(response.text)
+        response = exercises_client.get_exercise_api(shared_exercise.exercise_id)
+        response_data = response.model(ExerciseResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
-        assert_get_exercise_response(response_data, function_exercise.response)
+        assert_get_exercise_response(response_data, shared_exercise.response)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ExerciseResponseSchema)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ExerciseResponseSchema)
 
     @allure.tag(AllureTag.UPDATE_ENTITY)
     @allure.severity(Severity.CRITICAL)
@@ -110,32 +110,32 @@ class TestExercises:
     @allure.sub_suite(AllureStory.UPDATE_ENTITY)
     @allure.title("Обновление упражнения")
     def test_update_exercise(
-        self, exercises_client: ExercisesClient, function_exercise: ExerciseFixture
+        self, exercises_client: ExercisesClient, leased_exercise: ExerciseFixture
     ):
         """
         Тест обновления информации об упражнении.
 
         Args:
             exercises_client (ExercisesClient): Клиент для работы с упражнениями.
-            function_exercise (ExerciseFixture): Фикстура с данными упражнения.
+            leased_exercise (ExerciseFixture): Упражнение, монопольно выданное из пула.
         """
 
         request = UpdateExerciseRequestSchema(
-            course_id=function_exercise.response.exercise.course_id
+            course_id=leased_exercise.response.exercise.course_id
         )
         response = exercises_client.update_exercise_api(
-            request=request, exercise_id=function_exercise.exercise_id
+            request=request, exercise_id=leased_exercise.exercise_id
         )
-        response_data = ExerciseResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ExerciseResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_update_exercise_response(
             request=request,
             response=response_data,
-            exercise_id=function_exercise.exercise_id,
+            exercise_id=leased_exercise.exercise_id,
         )
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ExerciseResponseSchema)
 
     @allure.tag(AllureTag.DELETE_ENTITY)
     @allure.severity(Severity.CRITICAL)
@@ -143,32 +143,30 @@ class TestExercises:
     @allure.sub_suite(AllureStory.DELETE_ENTITY)
     @allure.title("Удаление упражнения")
     def test_delete_exercise(
-        self, exercises_client: ExercisesClient, function_exercise: ExerciseFixture
+        self, exercises_client: ExercisesClient, leased_exercise: ExerciseFixture
     ):
         """
         Тест удаления упражнения.
 
         Args:
             exercises_client (ExercisesClient): Клиент для работы с упражнениями.
-            function_exercise (ExerciseFixture): Фикстура с данными упражнения.
+            leased_exercise (ExerciseFixture): Упражнение, монопольно выданное из пула.
         """
 
         delete_response = exercises_client.delete_exercise_api(
-            exercise_id=function_exercise.exercise_id
+            exercise_id=leased_exercise.exercise_id
         )
         assert_status_code(delete_response.status_code, HTTPStatus.OK)
 
         get_response = exercises_client.get_exercise_api(
-            exercise_id=function_exercise.exercise_id
-        )
-        get_response_data = InternalErrorResponseSchema.model_validate_json(
-            get_response.text
+            exercise_id=leased_exercise.exercise_id
         )
+        get_response_data = get_response.model(InternalErrorResponseSchema)
 
         assert_status_code(get_response.status_code, HTTPStatus.NOT_FOUND)
         assert_not_found_exercise_response(get_response_data)
 
-        validate_json_schema(get_response.json(), get_response_data.model_json_schema())
+        validate_json_schema(get_response.json(), InternalErrorResponseSchema)
 
     @allure.tag(AllureTag.GET_ENTITIES)
     @allure.severity(Severity.BLOCKER)
@@ -192,7 +190,7 @@ class TestExercises:
 
         request = GetExercisesQuerySchema(course_id=function_course.course_id)
         response = exercises_client.get_exercises_api(request)
-        response_data = GetExercisesResponseSchema.model_validate_json(response.text)
+        response_data = response.model(GetExercisesResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
 
@@ -202,7 +200,7 @@ class TestExercises:
             response=response_data,
         )
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), GetExercisesResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.severity(Severity.BLOCKER)
@@ -220,12 +218,12 @@ class TestExercises:
         """
         request = GetExercisesQuerySchema(course_id="incorrect-id")
         response = exercises_client.get_exercises_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_get_exercises_with_incorrect_course_id_response(actual=response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.severity(Severity.BLOCKER)
@@ -243,10 +241,10 @@ class TestExercises:
         """
         request = GetExercisesQuerySchema(course_id=fake.uuid4())
         response = exercises_client.get_exercises_api(request)
-        response_data = GetExercisesResponseSchema.model_validate_json(response.text)
+        response_data = response.model(GetExercisesResponseSchema)
         assert_get_exercises_with_non_existent_course_id_response(actual=response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), GetExercisesResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.severity(Severity.BLOCKER)
@@ -265,12 +263,12 @@ class TestExercises:
 
         request = CreateExerciseRequestSchema(course_id="incorrect-id")
         response = exercises_client.create_exercise_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_create_exercise_with_invalid_course_id_response(response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @pytest.mark.parametrize(
         "field_name", ["title", "description", "course_id", "estimated_time"]
@@ -283,7 +281,7 @@ class TestExercises:
         self,
         exercises_client: ExercisesClient,
         field_name: str,
-        function_course: CourseFixture,
+        shared_course: CourseFixture,
     ):
         """
         Тест создания упражнения с пустым обязательным полем.
@@ -291,22 +289,22 @@ class TestExercises:
         Args:
             exercises_client (ExercisesClient): Клиент для работы с упражнениями.
             field_name (str): Имя поля, которое будет пустым в запросе.
-            function_course (CourseFixture): Фикстура с данными курса.
+            shared_course (CourseFixture): Общий курс воркера из пула.
         """
         allure.dynamic.title(
             f"Попытка создать упражнение с пустым обязательным полем {field_name}"
         )
-        request = CreateExerciseRequestSchema(course_id=function_course.course_id)
+        request = CreateExerciseRequestSchema(course_id=shared_course.course_id)
         setattr(request, field_name, "")
         response = exercises_client.create_exercise_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_create_or_update_exercise_with_empty_required_string_field_response(
             response_data, field_name
         )
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @pytest.mark.parametrize("field_name", ["title", "estimated_time"])
     @allure.tag(AllureTag.VALIDATE_ENTITY)
@@ -317,7 +315,7 @@ class TestExercises:
         self,
         exercises_client: ExercisesClient,
         field_name: str,
-        function_course: CourseFixture,
+        shared_course: CourseFixture,
     ):
         """
         Тест создания упражнения с слишком длинным строковым полем.
@@ -325,24 +323,24 @@ class TestExercises:
         Args:
             exercises_client (ExercisesClient): Клиент для работы с упражнениями.
             field_name (str): Имя поля, которое будет содержать слишком длинное значение в запросе.
-            function_course (CourseFixture): Фикстура с данными курса.
+            shared_course (CourseFixture): Общий курс воркера из пула.
         """
 
         allure.dynamic.title(
             f"Создание упражнения с слишком длинным значением в {field_name} поле"
         )
         to_long_string = "a" * (MAX_LENGTH_FIELDS.get(field_name) + 1)
-        request = CreateExerciseRequestSchema(course_id=function_course.course_id)
+        request = CreateExerciseRequestSchema(course_id=shared_course.course_id)
         setattr(request, field_name, to_long_string)
         response = exercises_client.create_exercise_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_create_or_update_exercise_with_too_long_string_field_response(
             response_data, field_name, to_long_string
         )
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @pytest.mark.parametrize("field_name", ["title", "description", "estimated_time"])
     @allure.tag(AllureTag.VALIDATE_ENTITY)
@@ -353,7 +351,7 @@ class TestExercises:
         self,
         exercises_client: ExercisesClient,
         field_name: str,
-        function_course: CourseFixture,
+        shared_course: CourseFixture,
     ):
         """
         Тест обновления упражнения с пустым обязательным полем.
@@ -361,7 +359,7 @@ class TestExercises:
         Args:
             exercises_client (ExercisesClient): Клиент для работы с упражнениями.
             field_name (str): Имя поля, которое будет пустым в запросе.
-            function_course (CourseFixture): Фикстура с данными курса.
+            shared_course (CourseFixture): Общий курс воркера из пула.
         """
 
         allure.dynamic.title(
@@ -370,16 +368,16 @@ class TestExercises:
         request = UpdateExerciseRequestSchema()
         setattr(request, field_name, "")
         response = exercises_client.update_exercise_api(
-            function_course.course_id, request
+            shared_course.course_id, request
         )
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_create_or_update_exercise_with_empty_required_string_field_response(
             response_data, field_name
         )
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @pytest.mark.parametrize("field_name", ["title", "estimated_time"])
     @allure.tag(AllureTag.VALIDATE_ENTITY)
@@ -390,7 +388,7 @@ class TestExercises:
         self,
         exercises_client: ExercisesClient,
         field_name: str,
-        function_course: CourseFixture,
+        shared_course: CourseFixture,
     ):
         """
         Тест обновления упражнения с слишком длинным строковым полем.
@@ -398,7 +396,7 @@ class TestExercises:
         Args:
             exercises_client (ExercisesClient): Клиент для работы с упражнениями.
             field_name (str): Имя поля, которое будет содержать слишком длинное значение в запросе.
-            function_course (CourseFixture): Фикстура с данными курса.
+            shared_course (CourseFixture): Общий курс воркера из пула.
         """
 
         allure.dynamic.title(
@@ -408,16 +406,16 @@ class TestExercises:
         request = UpdateExerciseRequestSchema()
         setattr(request, field_name, to_long_string)
         response = exercises_client.update_exercise_api(
-            function_course.course_id, request
+            shared_course.course_id, request
         )
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_create_or_update_exercise_with_too_long_string_field_response(
             response_data, field_name, to_long_string
         )
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @pytest.mark.parametrize(
         "min_score, max_score",
@@ -435,7 +433,7 @@ class TestExercises:
         exercises_client: ExercisesClient,
         min_score: int,
         max_score: int,
-        function_course: CourseFixture,
+        shared_course: CourseFixture,
     ):
         """
         Тест создания упражнения с некорректными значениями min_score и max_score.
@@ -444,23 +442,23 @@ class TestExercises:
             exercises_client (ExercisesClient): Клиент для работы с упражнениями.
             min_score (int): Минимальное значение для min_score.
             max_score (int): Максимальное значение для max_score.
-            function_course (CourseFixture): Фикстура с данными курса.
+            shared_course (CourseFixture): Общий курс воркера из пула.
         """
         allure.dynamic.title(
             f"Создание упражнения с некорректными значениями"
             f" {min_score=} - {max_score=}"
         )
-        request = CreateExerciseRequestSchema(course_id=function_course.course_id)
+        request = CreateExerciseRequestSchema(course_id=shared_course.course_id)
         setattr(request, "min_score", min_score)
         setattr(request, "max_score", max_score)
         response = exercises_client.create_exercise_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_create_or_update_exercise_with_incorrect_score_response(
             response_data, request
         )
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @pytest.mark.parametrize(
         "min_score, max_score",
@@ -478,7 +476,7 @@ class TestExercises:
         exercises_client: ExercisesClient,
         min_score: int,
         max_score: int,
-        function_course: CourseFixture,
+        shared_course: CourseFixture,
     ):
         """
         Тест обновления упражнения с некорректными значениями min_score и max_score.
@@ -487,7 +485,7 @@ class TestExercises:
             exercises_client (ExercisesClient): Клиент для работы с упражнениями.
             min_score (int): Минимальное значение для min_score.
             max_score (int): Максимальное значение для max_score.
-            function_course (CourseFixture): Фикстура с данными курса.
+            shared_course (CourseFixture): Общий курс воркера из пула.
         """
         allure.dynamic.title(
             f"Обновление упражнения с некорректными значениями"
@@ -498,16 +496,16 @@ class TestExercises:
         setattr(request, "min_score", min_score)
         setattr(request, "max_score", max_score)
         response = exercises_client.update_exercise_api(
-            function_course.course_id, request
+            shared_course.course_id, request
         )
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_create_or_update_exercise_with_incorrect_score_response(
             response_data, request
         )
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
@@ -524,12 +522,12 @@ class TestExercises:
             exercises_client (ExercisesClient): Клиент для работы с упражнениями.
         """
         response = exercises_client.get_exercise_api("incorrect-id")
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_get_exercise_with_incorrect_exercise_id_response(actual=response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
@@ -547,12 +545,12 @@ class TestExercises:
         """
 
         response = exercises_client.delete_exercise_api("incorrect-id")
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_delete_exercise_with_incorrect_exercise_id_response(actual=response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @pytest.mark.xfail(reason="В разработке")
     @allure.tag(AllureTag.VALIDATE_ENTITY)
@@ -570,8 +568,8 @@ class TestExercises:
             exercises_client (ExercisesClient): Клиент для работы с упражнениями.
         """
         response = exercises_client.delete_exercise_api(exercise_id=fake.uuid4())
-        response_data = InternalErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(InternalErrorResponseSchema)
         assert_status_code(response.status_code, HTTPStatus.NOT_FOUND)
         assert_not_found_exercise_response(actual=response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), InternalErrorResponseSchema)
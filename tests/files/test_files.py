@@ -59,38 +59,38 @@ class TestFiles:
             upload_file=settings.TEST_DATA.IMAGE_JPEG_FILE
         )
         response = files_client.upload_file_api(request)
-        response_data = UploadFileResponseSchema.model_validate_json(response.text)
+        response_data = response.model(UploadFileResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_upload_file_response(request=request, response=response_data)
         assert_file_is_accessible(files_client, response_data.file.id, HTTPStatus.OK)
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), UploadFileResponseSchema)
 
     @allure.tag(AllureTag.GET_ENTITY)
     @allure.story(AllureStory.GET_ENTITY)
     @allure.sub_suite(AllureStory.GET_ENTITY)
     @allure.severity(Severity.CRITICAL)
     @allure.title("Получение файла")
-    def test_get_file(self, files_client: FilesClient, function_file: FileFixture):
+    def test_get_file(self, files_client: FilesClient, shared_file: FileFixture):
         """
         Тест проверяет, что при запросе файла по его идентификатору,
         в ответе сервера возвращается информация о файле.
 
         Args:
             files_client (FilesClient): HTTP-клиент для взаимодействия с сервером.
-            function_file (FileFixture): Объект с данными загруженного файла.
+            shared_file (FileFixture): Общий файл воркера из пула.
 
         Raises:
             AssertionError: Если данные в ответе не совпадают с ожидаемыми.
         """
 
-        response = files_client.get_file_api(function_file.file_id)
-        response_data = UploadFileResponseSchema.model_validate_json(response.text)
+        response = files_client.get_file_api(shared_file.file_id)
+        response_data = response.model(UploadFileResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
-        assert_get_file_response(response_data, function_file.response)
+        assert_get_file_response(response_data, shared_file.response)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), UploadFileResponseSchema)
 
     @pytest.mark.parametrize("field_name", ["filename", "directory"])
     @allure.tag(AllureTag.VALIDATE_ENTITY)
@@ -117,43 +117,41 @@ class TestFiles:
         )
         setattr(request, field_name, "")
         response = files_client.upload_file_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_create_file_with_empty_field_response(response_data, field_name)
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @allure.tag(AllureTag.DELETE_ENTITY)
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.sub_suite(AllureStory.DELETE_ENTITY)
     @allure.severity(Severity.NORMAL)
     @allure.title("Удаление файла")
-    def test_delete_file(self, files_client: FilesClient, function_file: FileFixture):
+    def test_delete_file(self, files_client: FilesClient, leased_file: FileFixture):
         """
         Тест проверяет, что при удалении файла,
         он удаляется из хранилища и не может быть получен по его идентификатору.
 
         Args:
             files_client (FilesClient): HTTP-клиент для взаимодействия с сервером.
-            function_file (FileFixture): Объект с данными загруженного файла.
+            leased_file (FileFixture): Файл, монопольно выданный из пула.
 
         Raises:
             AssertionError: Если данные в ответе не совпадают с ожидаемыми.
         """
 
-        delete_response = files_client.delete_file_api(function_file.file_id)
+        delete_response = files_client.delete_file_api(leased_file.file_id)
 
         assert_status_code(delete_response.status_code, HTTPStatus.OK)
 
-        get_response = files_client.get_file_api(function_file.file_id)
-        get_response_data = InternalErrorResponseSchema.model_validate_json(
-            get_response.text
-        )
+        get_response = files_client.get_file_api(leased_file.file_id)
+        get_response_data = get_response.model(InternalErrorResponseSchema)
 
         assert_status_code(get_response.status_code, HTTPStatus.NOT_FOUND)
         assert_file_not_found_response(get_response_data)
 
-        validate_json_schema(get_response.json(), get_response_data.model_json_schema())
+        validate_json_schema(get_response.json(), InternalErrorResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
@@ -172,12 +170,12 @@ class TestFiles:
             AssertionError: Если данные в ответе не совпадают с ожидаемыми.
         """
         response = files_client.get_file_api("incorrect-id")
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_get_file_with_incorrect_file_id_response(response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
@@ -201,9 +199,9 @@ class TestFiles:
         """
 
         response = files_client.delete_file_api(file_id="incorrect-id")
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_delete_file_with_incorrect_file_id_response(actual=response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
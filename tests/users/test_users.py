@@ -71,12 +71,12 @@ class TestUsers:
 
         request = CreateUserRequestSchema(email=fake.email(email))
         response = public_users_client.create_user_api(request)
-        response_data = UserResponseSchema.model_validate_json(response.text)
+        response_data = response.model(UserResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_create_user_response(request, response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), UserResponseSchema)
 
     @allure.tag(AllureTag.GET_ENTITY)
     @allure.story(AllureStory.GET_ENTITY)
@@ -101,12 +101,12 @@ class TestUsers:
             ValidationError: Если данные ответа не соответствуют схеме.
         """
         response = private_users_client.get_user_me_api()
-        response_data = UserResponseSchema.model_validate_json(response.text)
+        response_data = response.model(UserResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_get_user_response(response_data.user, function_user.response.user)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), UserResponseSchema)
 
     @allure.tag(AllureTag.GET_ENTITY)
     @allure.story(AllureStory.GET_ENTITY)
@@ -129,12 +129,12 @@ class TestUsers:
             ValidationError: Если данные ответа не соответствуют схеме.
         """
         response = private_users_client.get_user_api(function_user.user_id)
-        response_data = UserResponseSchema.model_validate_json(response.text)
+        response_data = response.model(UserResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_user(actual=response_data.user, expected=function_user.response.user)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), UserResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
@@ -155,12 +155,12 @@ class TestUsers:
         """
 
         response = private_users_client.get_user_api(user_id=fake.uuid4())
-        response_data = InternalErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(InternalErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.NOT_FOUND)
         assert_not_found_user_response(actual=response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), InternalErrorResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
@@ -181,12 +181,12 @@ class TestUsers:
         """
 
         response = private_users_client.get_user_api(user_id="incorrect-id")
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_get_user_with_incorrect_user_id_response(actual=response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @allure.tag(AllureTag.UPDATE_ENTITY)
     @allure.story(AllureStory.UPDATE_ENTITY)
@@ -214,12 +214,12 @@ class TestUsers:
         response = private_users_client.update_user_api(
             request=request, user_id=function_user.user_id
         )
-        response_data = UserResponseSchema.model_validate_json(response.text)
+        response_data = response.model(UserResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_update_user_response(response_data, request, function_user.user_id)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), UserResponseSchema)
 
     @allure.tag(AllureTag.DELETE_ENTITY)
     @allure.story(AllureStory.DELETE_ENTITY)
@@ -250,15 +250,11 @@ class TestUsers:
         assert_status_code(delete_response.status_code, HTTPStatus.OK)
 
         not_found_response = private_users_client.get_user_api(created_user.user.id)
-        not_found_response_data = InternalErrorResponseSchema.model_validate_json(
-            not_found_response.text
-        )
+        not_found_response_data = not_found_response.model(InternalErrorResponseSchema)
         assert_status_code(not_found_response.status_code, HTTPStatus.NOT_FOUND)
         assert_not_found_user_response(actual=not_found_response_data)
 
-        validate_json_schema(
-            not_found_response.json(), not_found_response_data.model_json_schema()
-        )
+        validate_json_schema(not_found_response.json(), InternalErrorResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
@@ -281,12 +277,12 @@ class TestUsers:
         """
 
         response = private_users_client.delete_user_api(user_id="incorrect-id")
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_delete_user_with_incorrect_user_id_response(actual=response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @pytest.mark.parametrize(
         "field_name", ["email", "first_name", "last_name", "middle_name"]
@@ -320,13 +316,13 @@ class TestUsers:
             f"Создание пользователя с пустым обязательным полем {field_name}"
         )
         response = public_users_client.create_user_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_create_or_update_user_with_empty_required_field_response(
             actual=response_data, field_name=field_name
         )
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @pytest.mark.parametrize(
         "field_name", ["email", "first_name", "last_name", "middle_name"]
@@ -364,14 +360,14 @@ class TestUsers:
         response = private_users_client.update_user_api(
             request=request, user_id=function_user.user_id
         )
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_create_or_update_user_with_empty_required_field_response(
             actual=response_data, field_name=field_name
         )
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @pytest.mark.parametrize(
         "field_name", ["email", "first_name", "last_name", "middle_name"]
@@ -407,14 +403,14 @@ class TestUsers:
         setattr(request, field_name, too_long_string)
 
         response = public_users_client.create_user_api(request=request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_create_or_update_user_with_too_long_field_response(
             actual=response_data, field_name=field_name, input_value=too_long_string
         )
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @pytest.mark.parametrize(
         "field_name", ["email", "first_name", "last_name", "middle_name"]
@@ -453,11 +449,11 @@ class TestUsers:
         response = private_users_client.update_user_api(
             request=request, user_id=function_user.user_id
         )
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_create_or_update_user_with_too_long_field_response(
             actual=response_data, field_name=field_name, input_value=too_long_string
         )
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
@@ -0,0 +1,139 @@
+import inspect
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Iterator
+
+import allure
+from allure_commons.utils import func_parameters, represent
+
+from config import settings
+from tools.recording import is_recorded
+
+_step_depth: ContextVar[int] = ContextVar("allure_step_depth", default=0)
+_step_checks: ContextVar[list[dict[str, Any]] | None] = ContextVar(
+    "allure_step_checks", default=None
+)
+
+
+def step(title: str) -> Callable:
+    """
+    Декоратор шага Allure, поддерживающий как обычные, так и асинхронные функции.
+
+    Стандартный allure.step оборачивает только синхронный вызов: для корутинной
+    функции шаг закрывается раньше, чем выполнится запрос. Для корутин шаг
+    открывается внутри обёртки и остаётся активным до завершения await.
+
+    В режиме settings.REPORTING.STEPS="lean" шаг открывается только на верхнем
+    уровне: вложенные шаги не создаются, а проверки, записанные через
+    record_check, прикладываются к шагу верхнего уровня одним вложением.
+
+    Внутри tools.recording.not_recorded (запросы вне теста, например фоновое
+    досоздание сущностей пула) шаг не открывается.
+
+    Args:
+        title (str): Заголовок шага. Поддерживает подстановку параметров функции,
+            как и allure.step (например, "Отправляем GET-запрос на {url}").
+
+    Returns:
+        Callable: Декоратор, оборачивающий функцию в шаг Allure.
+    """
+    lean = settings.REPORTING.STEPS == "lean"
+
+    def decorator(func: Callable) -> Callable:
+        if not inspect.iscoroutinefunction(func):
+            allure_step = allure.step(title)(func)
+
+            @wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                __tracebackhide__ = True
+                if not is_recorded():
+                    return func(*args, **kwargs)
+                if not lean:
+                    return allure_step(*args, **kwargs)
+                if _step_depth.get():
+                    return func(*args, **kwargs)
+
+                with _top_level_step(_format_title(title, func, args, kwargs)):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        @wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            __tracebackhide__ = True
+            if not is_recorded() or (lean and _step_depth.get()):
+                return await func(*args, **kwargs)
+
+            formatted_title = _format_title(title, func, args, kwargs)
+            if lean:
+                with _top_level_step(formatted_title):
+                    return await func(*args, **kwargs)
+
+            with allure.step(formatted_title):
+                return await func(*args, **kwargs)
+
+        return async_wrapper
+
+    return decorator
+
+
+def record_check(name: str, actual: Any, expected: Any, passed: bool) -> bool:
+    """
+    Записывает проверку в свёрнутый список проверок текущего шага.
+
+    Работает только в режиме lean внутри шага верхнего уровня; в остальных
+    случаях проверка не записывается, и вызывающий код сам открывает шаг.
+
+    Args:
+        name (str): Название проверяемого значения.
+        actual (Any): Текущее значение.
+        expected (Any): Ожидаемое значение.
+        passed (bool): Результат проверки.
+
+    Returns:
+        bool: True, если проверка записана в список текущего шага.
+    """
+    checks = _step_checks.get()
+    if checks is None:
+        return False
+
+    checks.append(
+        {
+            "name": name,
+            "passed": passed,
+            "expected": represent(expected),
+            "actual": represent(actual),
+        }
+    )
+    return True
+
+
+def _format_title(title: str, func: Callable, args: tuple, kwargs: dict) -> str:
+    params = func_parameters(func, *args, **kwargs)
+    formatted_args = [represent(arg) for arg in args]
+    return title.format(*formatted_args, **params)
+
+
+@contextmanager
+def _top_level_step(title: str) -> Iterator[None]:
+    depth_token = _step_depth.set(1)
+    checks_token = _step_checks.set([])
+    try:
+        with allure.step(title):
+            try:
+                yield
+            finally:
+                checks = _step_checks.get()
+                # Единственная успешная проверка уже описана заголовком шага.
+                if len(checks) > 1 or not all(check["passed"] for check in checks):
+                    allure.attach(
+                        json.dumps(checks, indent=2, ensure_ascii=False),
+                        f"Проверки ({sum(check['passed'] for check in checks)}"
+                        f"/{len(checks)})",
+                        allure.attachment_type.JSON,
+                    )
+    finally:
+        _step_checks.reset(checks_token)
+        _step_depth.reset(depth_token)
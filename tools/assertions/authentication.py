@@ -1,10 +1,9 @@
-import allure
-
 from clients.authentication.authentication_schema import LoginResponseSchema
 from clients.errors_schema import (
     InternalErrorResponseSchema,
     ValidationErrorResponseSchema,
 )
+from tools.allure.steps import step
 from tools.assertions.base import assert_equal, assert_is_true
 from tools.assertions.errors import (
     assert_internal_error_response,
@@ -15,7 +14,7 @@ from tools.logger import get_logger
 logger = get_logger("AUTHENTICATION_ASSERTIONS")
 
 
-@allure.step("Проверяем ответ сервера после аутентификации")
+@step("Проверяем ответ сервера после аутентификации")
 def assert_login_response(response: LoginResponseSchema) -> None:
     """
     Проверяет структуру ответа на аутентификацию.
@@ -33,7 +32,7 @@ def assert_login_response(response: LoginResponseSchema) -> None:
     assert_is_true(response.token.refresh_token, "refresh_token")
 
 
-@allure.step("Проверяем ответ сервера после обновления токена с невалидным токеном")
+@step("Проверяем ответ сервера после обновления токена с невалидным токеном")
 def assert_refresh_token_with_incorrect_token_response(
     actual: InternalErrorResponseSchema,
 ) -> None:
@@ -51,7 +50,7 @@ def assert_refresh_token_with_incorrect_token_response(
     assert_internal_error_response(actual=actual, expected=expected)
 
 
-@allure.step("Проверяем ответ сервера на запрос аутентификации с некорректным email")
+@step("Проверяем ответ сервера на запрос аутентификации с некорректным email")
 def assert_login_with_incorrect_email_response(
     actual: ValidationErrorResponseSchema,
 ) -> None:
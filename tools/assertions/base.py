@@ -1,14 +1,13 @@
 from typing import Any, Sized
 
-import allure
-
+from tools.allure.steps import record_check, step
 from tools.logger import get_logger
 
 
 logger = get_logger("BASE_ASSERTIONS")
 
 
-@allure.step("Проверяем, что статус код ответа сервера соответствует {expected}")
+@step("Проверяем, что статус код ответа сервера соответствует {expected}")
 def assert_status_code(actual: int, expected: int) -> None:
     """
     Проверяет статус код ответа.
@@ -21,14 +20,17 @@ def assert_status_code(actual: int, expected: int) -> None:
         AssertionError: Если статус код не соответствует ожидаемому.
     """
 
-    logger.info(f"Проверяем, что статус код ответа сервера соответствует {expected}")
+    if not record_check("status_code", actual, expected, actual == expected):
+        logger.info(
+            f"Проверяем, что статус код ответа сервера соответствует {expected}"
+        )
 
     assert (
         actual == expected
     ), f"Incorrect response staus code. Expected: '{expected}', resived: '{actual}'"
 
 
-@allure.step("Проверяем, что значение {name} соответствует ожидаемому {expected}")
+@step("Проверяем, что значение {name} соответствует ожидаемому {expected}")
 def assert_equal(actual: Any, expected: Any, name: str) -> None:
     """
     Проверяет равенство двух значений.
@@ -42,14 +44,17 @@ def assert_equal(actual: Any, expected: Any, name: str) -> None:
         AssertionError: Если значения не равны.
     """
 
-    logger.info(f"Проверяем, что значение {name} соответствует ожидаемому {expected}")
+    if not record_check(name, actual, expected, actual == expected):
+        logger.info(
+            f"Проверяем, что значение {name} соответствует ожидаемому {expected}"
+        )
 
     assert (
         actual == expected
     ), f"Incorrect '{name}'. Expected: '{expected}', resived: '{actual}'"
 
 
-@allure.step("Проверяем, что значение {name} является истинным")
+@step("Проверяем, что значение {name} является истинным")
 def assert_is_true(actual: Any, name: str) -> None:
     """
     Проверяет, что значение является истинным.
@@ -61,11 +66,13 @@ def assert_is_true(actual: Any, name: str) -> None:
     Raises:
         AssertionError: Если значение не является истинным.
     """
-    logger.info(f"Проверяем, что значение {name} является истинным")
+    if not record_check(name, actual, True, bool(actual)):
+        logger.info(f"Проверяем, что значение {name} является истинным")
 
     assert actual, f"Incorrect value: '{name}'. Expected True, got: '{actual}'."
 
 
+@step("Проверяем, что длина {name} соответствует ожидаемой {expected}")
 def assert_length(actual: Sized, expected: Sized, name: str) -> None:
     """
     Проверяет соответствие длин коллекций.
@@ -78,9 +85,10 @@ def assert_length(actual: Sized, expected: Sized, name: str) -> None:
     Raises:
         AssertionError: Если длины не совпадают.
     """
-    with allure.step(f"Проверяем, что длина {name} соответствует ожидаемой {expected}"):
+    passed = len(actual) == len(expected)
+    if not record_check(f"len({name})", len(actual), len(expected), passed):
         logger.info(f"Проверяем, что длина {name} соответствует ожидаемой {expected}")
 
-        assert len(actual) == len(
-            expected
-        ), f"Incorrect '{name}' length. Expected: '{len(expected)}', resived: '{len(actual)}'"
+    assert (
+        passed
+    ), f"Incorrect '{name}' length. Expected: '{len(expected)}', resived: '{len(actual)}'"
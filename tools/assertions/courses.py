@@ -1,5 +1,3 @@
-import allure
-
 from clients.courses.courses_schema import (
     CourseSchema,
     UpdateCourseRequestSchema,
@@ -12,7 +10,10 @@ from clients.errors_schema import (
     ValidationErrorResponseSchema,
 )
 from clients.courses.constants import FIELD_NAME_MAPPING, MAX_LENGTH_FIELDS
-from tools.assertions.base import assert_equal, assert_length
+from config import settings
+from tools.allure.steps import step
+from tools.assertions.base import assert_equal
+from tools.assertions.diff import assert_collections_equal, assert_models_equal
 from tools.assertions.errors import (
     assert_internal_error_response,
     assert_validation_error_for_invalid_id,
@@ -20,15 +21,13 @@ from tools.assertions.errors import (
     assert_validation_error_for_too_long_field,
     assert_validation_error_for_empty_string_field,
 )
-from tools.assertions.files import assert_file
-from tools.assertions.users import assert_user
 from tools.logger import get_logger
 
 
 logger = get_logger("COURSES_ASSERTIONS")
 
 
-@allure.step("Проверяем соответсвие данных курса")
+@step("Проверяем соответсвие данных курса")
 def assert_course(actual: CourseSchema, expected: CourseSchema):
     """
     Проверка соответствия данных курса.
@@ -41,17 +40,10 @@ def assert_course(actual: CourseSchema, expected: CourseSchema):
         AssertionError: Если данные не совпадают.
     """
     logger.info("Проверяем соответсвие данных курса")
-    assert_equal(actual.id, expected.id, "id")
-    assert_equal(actual.title, expected.title, "title")
-    assert_equal(actual.description, expected.description, "description")
-    assert_equal(actual.estimated_time, expected.estimated_time, "estimated_time")
-    assert_equal(actual.max_score, expected.max_score, "max_score")
-    assert_equal(actual.min_score, expected.min_score, "min_score")
-    assert_file(actual.preview_file, expected.preview_file)
-    assert_user(actual.created_by_user, expected.created_by_user)
+    assert_models_equal(actual, expected, "course")
 
 
-@allure.step("Проверяем ответ сервера на запрос создания курса")
+@step("Проверяем ответ сервера на запрос создания курса")
 def assert_create_course_response(
     request: CreateCourseRequestSchema, response: CourseResponseSchema
 ):
@@ -67,28 +59,18 @@ def assert_create_course_response(
     """
 
     logger.info("Проверяем ответ сервера на запрос создания курса")
-    assert_equal(response.course.title, request.title, "title")
-    assert_equal(response.course.description, request.description, "description")
-    assert_equal(response.course.max_score, request.max_score, "max_score")
-    assert_equal(response.course.min_score, request.min_score, "min_score")
-    assert_equal(
-        response.course.estimated_time,
-        request.estimated_time,
-        "estimated_time",
-    )
-    assert_equal(
-        response.course.preview_file.id,
-        request.preview_file_id,
-        "preview_file_id",
-    )
-    assert_equal(
-        response.course.created_by_user.id,
-        request.created_by_user_id,
-        "created_by_user_id",
+    assert_models_equal(
+        response.course,
+        request,
+        "course",
+        mapping={
+            "preview_file_id": "preview_file.id",
+            "created_by_user_id": "created_by_user.id",
+        },
     )
 
 
-@allure.step("Проверяем ответ сервера на запрос курса")
+@step("Проверяем ответ сервера на запрос курса")
 def assert_get_course_response(
     expected_response: CourseResponseSchema, response: CourseResponseSchema
 ):
@@ -107,7 +89,7 @@ def assert_get_course_response(
     assert_course(expected_response.course, response.course)
 
 
-@allure.step("Проверяем ответ сервера на запрос списка курсов")
+@step("Проверяем ответ сервера на запрос списка курсов")
 def assert_get_courses_response(
     expected_response: GetCoursesResponseSchema,
     response: GetCoursesResponseSchema,
@@ -123,13 +105,17 @@ def assert_get_courses_response(
     """
 
     logger.info("Проверяем ответ сервера на запрос списка курсов")
-    assert_length(response.courses, expected_response.courses, "courses")
-
-    for index, course in enumerate(expected_response.courses):
-        assert_course(response.courses[index], course)
+    # Порядок списка совпадает с порядком создания курсов, который
+    # предсказуем только при последовательной подготовке данных.
+    assert_collections_equal(
+        response.courses,
+        expected_response.courses,
+        "courses",
+        ignore_order=settings.FIXTURE_SETUP.is_concurrent,
+    )
 
 
-@allure.step("Проверяем ответ сервера на запрос обновления курса")
+@step("Проверяем ответ сервера на запрос обновления курса")
 def assert_update_course_response(
     request: UpdateCourseRequestSchema, response: CourseResponseSchema, course_id: str
 ):
@@ -147,16 +133,10 @@ def assert_update_course_response(
 
     logger.info("Проверяем ответ сервера на запрос обновления курса")
     assert_equal(response.course.id, course_id, "id")
-
-    for field_name in request.model_dump().keys():
-        assert_equal(
-            getattr(response.course, field_name),
-            getattr(request, field_name),
-            field_name,
-        )
+    assert_models_equal(response.course, request, "course")
 
 
-@allure.step("Проверяем ответ сервера на запрос несуществующего курса")
+@step("Проверяем ответ сервера на запрос несуществующего курса")
 def assert_not_found_course_response(actual: InternalErrorResponseSchema):
     """
     Проверяет, что при запросе несуществующего курса сервер возвращает ошибку.
@@ -172,7 +152,7 @@ def assert_not_found_course_response(actual: InternalErrorResponseSchema):
     assert_internal_error_response(actual, expected)
 
 
-@allure.step("Проверяем ответ сервера на запрос курса с пустым обязательным параметром")
+@step("Проверяем ответ сервера на запрос курса с пустым обязательным параметром")
 def assert_create_course_with_empty_field_response(
     actual: ValidationErrorResponseSchema, field_name: str
 ):
@@ -200,7 +180,7 @@ def assert_create_course_with_empty_field_response(
         assert_validation_error_for_empty_id_field(actual=actual, field_name=field_name)
 
 
-@allure.step(
+@step(
     "Проверяем ответ сервера на запрос создания курса с некорректным id полем в теле запроса"
 )
 def assert_create_course_with_incorrect_field_id_response(
@@ -224,7 +204,7 @@ def assert_create_course_with_incorrect_field_id_response(
     assert_validation_error_for_invalid_id(actual=actual, location=["body", field_name])
 
 
-@allure.step(
+@step(
     "Проверяем ответ сервера на запрос создания или обновления курса со слишком длинным title"
 )
 def assert_create_or_update_course_with_too_long_title_response(
@@ -253,7 +233,7 @@ def assert_create_or_update_course_with_too_long_title_response(
     )
 
 
-@allure.step("Проверяем ответ сервера на запрос курсов с несуществующим user_id")
+@step("Проверяем ответ сервера на запрос курсов с несуществующим user_id")
 def assert_get_courses_with_non_existent_id_response(
     actual: GetCoursesResponseSchema,
 ):
@@ -271,7 +251,7 @@ def assert_get_courses_with_non_existent_id_response(
     assert_get_courses_response(expected_response=expected, response=actual)
 
 
-@allure.step("Проверяем ответ сервера на запрос курсов с некорректным user_id")
+@step("Проверяем ответ сервера на запрос курсов с некорректным user_id")
 def assert_get_courses_with_incorrect_id_response(
     actual: ValidationErrorResponseSchema,
 ):
@@ -288,7 +268,7 @@ def assert_get_courses_with_incorrect_id_response(
     assert_validation_error_for_invalid_id(actual=actual, location=["query", "userId"])
 
 
-@allure.step("Проверяем ответ сервера на запрос курса с некорректным id")
+@step("Проверяем ответ сервера на запрос курса с некорректным id")
 def assert_get_course_with_incorrect_id_response(actual: ValidationErrorResponseSchema):
     """
     Проверяет, что при запросе курса с некорректным id сервер возвращает ошибку.
@@ -305,7 +285,7 @@ def assert_get_course_with_incorrect_id_response(actual: ValidationErrorResponse
     )
 
 
-@allure.step("Проверяем ответ сервера на запрос удаления курса с некорректным id")
+@step("Проверяем ответ сервера на запрос удаления курса с некорректным id")
 def assert_delete_course_with_incorrect_id_response(
     actual: ValidationErrorResponseSchema,
 ):
@@ -0,0 +1,393 @@
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Collection, Mapping, Sequence
+
+from pydantic import BaseModel
+
+from tools.allure.steps import record_check, step
+from tools.logger import get_logger
+
+
+logger = get_logger("DIFF_ASSERTIONS")
+
+# Максимум записей в каждом разделе отчёта о расхождении коллекций.
+REPORT_LIMIT = 10
+
+
+@dataclass(frozen=True, slots=True)
+class FieldAccessor:
+    """
+    Предвычисленный доступ к полю модели.
+
+    Attrs:
+        name (str): Путь к атрибуту модели (например, "preview_file.id").
+        pointer (str): JSON-pointer поля по алиасам (например, "/previewFile/id").
+        get (Callable[[Any], Any]): Функция получения значения поля из модели.
+    """
+
+    name: str
+    pointer: str
+    get: Callable[[Any], Any]
+
+
+@dataclass(frozen=True, slots=True)
+class Mismatch:
+    """
+    Расхождение значений двух моделей.
+
+    Attrs:
+        path (str): JSON-pointer расходящегося значения.
+        expected (Any): Ожидаемое значение.
+        actual (Any): Текущее значение.
+    """
+
+    path: str
+    expected: Any
+    actual: Any
+
+    def __str__(self) -> str:
+        return f"{self.path}: expected {self.expected!r}, got {self.actual!r}"
+
+
+def _escape_pointer_token(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+@lru_cache(maxsize=None)
+def get_field_accessors(model_class: type[BaseModel]) -> tuple[FieldAccessor, ...]:
+    """
+    Функция возвращает accessor'ы всех полей класса модели.
+
+    Результат кешируется по классу, поэтому поля и алиасы разбираются
+    один раз за процесс.
+
+    Args:
+        model_class (type[BaseModel]): Класс pydantic-модели.
+
+    Returns:
+        tuple[FieldAccessor, ...]: Accessor'ы полей в порядке их объявления.
+    """
+    return tuple(
+        get_path_accessor(model_class, name) for name in model_class.model_fields
+    )
+
+
+@lru_cache(maxsize=None)
+def get_path_accessor(model_class: type[BaseModel], path: str) -> FieldAccessor:
+    """
+    Функция возвращает accessor для пути к атрибуту модели, в том числе вложенному.
+
+    Args:
+        model_class (type[BaseModel]): Класс pydantic-модели.
+        path (str): Путь к атрибуту через точку (например, "created_by_user.id").
+
+    Returns:
+        FieldAccessor: Accessor с JSON-pointer по алиасам полей.
+    """
+    tokens = []
+    current: Any = model_class
+    for name in path.split("."):
+        field = None
+        if isinstance(current, type) and issubclass(current, BaseModel):
+            field = current.model_fields.get(name)
+
+        tokens.append(_escape_pointer_token(field.alias or name if field else name))
+        current = field.annotation if field else None
+
+    return FieldAccessor(
+        name=path, pointer="/" + "/".join(tokens), get=attrgetter(path)
+    )
+
+
+def diff_models(
+    actual: BaseModel,
+    expected: BaseModel,
+    fields: Collection[str] | None = None,
+    exclude: Collection[str] = (),
+    mapping: Mapping[str, str] | None = None,
+) -> list[Mismatch]:
+    """
+    Функция сравнивает модели за один проход и возвращает все расхождения.
+
+    Сравниваются поля expected: это может быть модель того же класса или
+    схема запроса, поля которой отображаются на поля ответа через mapping.
+    Вложенные модели и списки сравниваются рекурсивно.
+
+    Args:
+        actual (BaseModel): Текущая модель (например, модель из ответа сервера).
+        expected (BaseModel): Ожидаемая модель или схема запроса.
+        fields (Collection[str] | None): Сравниваемые поля expected. По умолчанию все.
+        exclude (Collection[str]): Поля expected, которые не сравниваются.
+        mapping (Mapping[str, str] | None): Соответствие полей expected путям
+            в actual (например, {"preview_file_id": "preview_file.id"}).
+
+    Returns:
+        list[Mismatch]: Расхождения с JSON-pointer путями в actual.
+    """
+    mismatches: list[Mismatch] = []
+    _diff_model(actual, expected, "", mismatches, fields, exclude, mapping or {})
+    return mismatches
+
+
+def _diff_model(
+    actual: BaseModel,
+    expected: BaseModel,
+    prefix: str,
+    mismatches: list[Mismatch],
+    fields: Collection[str] | None = None,
+    exclude: Collection[str] = (),
+    mapping: Mapping[str, str] | None = None,
+) -> None:
+    actual_class = type(actual)
+    for accessor in get_field_accessors(type(expected)):
+        if accessor.name in exclude or (
+            fields is not None and accessor.name not in fields
+        ):
+            continue
+
+        target = accessor
+        if mapping or actual_class is not type(expected):
+            path = (
+                mapping.get(accessor.name, accessor.name) if mapping else accessor.name
+            )
+            target = get_path_accessor(actual_class, path)
+
+        _diff_values(
+            target.get(actual),
+            accessor.get(expected),
+            prefix + target.pointer,
+            mismatches,
+        )
+
+
+def _diff_values(
+    actual: Any, expected: Any, pointer: str, mismatches: list[Mismatch]
+) -> None:
+    if isinstance(actual, BaseModel) and isinstance(expected, BaseModel):
+        _diff_model(actual, expected, pointer, mismatches)
+    elif isinstance(actual, list) and isinstance(expected, list):
+        if len(actual) != len(expected):
+            mismatches.append(
+                Mismatch(
+                    f"{pointer} (length)", expected=len(expected), actual=len(actual)
+                )
+            )
+        for index, (actual_item, expected_item) in enumerate(zip(actual, expected)):
+            _diff_values(actual_item, expected_item, f"{pointer}/{index}", mismatches)
+    elif actual != expected:
+        mismatches.append(Mismatch(pointer, expected=expected, actual=actual))
+
+
+@dataclass(slots=True)
+class CollectionDiff:
+    """
+    Результат сравнения коллекций моделей по ключу.
+
+    Attrs:
+        missing (list[Any]): Ключи ожидаемых элементов, которых нет в actual.
+        extra (list[Any]): Ключи элементов actual, которых нет в ожидаемых.
+        duplicates (list[Any]): Ключи, встречающиеся в actual больше одного раза.
+        changed (list[Mismatch]): Расхождения полей элементов с одинаковым ключом.
+        order (Mismatch | None): Первая позиция, на которой порядок общих
+            элементов расходится, если порядок проверяется.
+    """
+
+    missing: list[Any] = field(default_factory=list)
+    extra: list[Any] = field(default_factory=list)
+    duplicates: list[Any] = field(default_factory=list)
+    changed: list[Mismatch] = field(default_factory=list)
+    order: Mismatch | None = None
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.missing
+            or self.extra
+            or self.duplicates
+            or self.changed
+            or self.order is not None
+        )
+
+    def report(self) -> list[str]:
+        """
+        Возвращает описание расхождений по разделам: отсутствующие, лишние,
+        повторяющиеся, изменённые элементы и порядок. В каждом разделе
+        выводится не больше REPORT_LIMIT записей.
+
+        Returns:
+            list[str]: Строки отчёта. Пустой список, если коллекции совпадают.
+        """
+        lines = []
+        for section in ("missing", "extra", "duplicates"):
+            keys = getattr(self, section)
+            if keys:
+                shown = ", ".join(map(str, keys[:REPORT_LIMIT]))
+                more = (
+                    f" ... +{len(keys) - REPORT_LIMIT}"
+                    if len(keys) > REPORT_LIMIT
+                    else ""
+                )
+                lines.append(f"{section} ({len(keys)}): {shown}{more}")
+        if self.changed:
+            lines.append(f"changed ({len(self.changed)}):")
+            lines.extend(f"  {mismatch}" for mismatch in self.changed[:REPORT_LIMIT])
+            if len(self.changed) > REPORT_LIMIT:
+                lines.append(f"  ... +{len(self.changed) - REPORT_LIMIT}")
+        if self.order is not None:
+            lines.append(f"order: {self.order}")
+        return lines
+
+
+def diff_collections(
+    actual: Sequence[BaseModel],
+    expected: Sequence[BaseModel],
+    key: str = "id",
+    ignore_order: bool = False,
+    fields: Collection[str] | None = None,
+    exclude: Collection[str] = (),
+    mapping: Mapping[str, str] | None = None,
+) -> CollectionDiff:
+    """
+    Функция сравнивает коллекции моделей, индексируя обе стороны по ключу.
+
+    Элементы сопоставляются через словарь по значению key, поэтому сравнение
+    выполняется за O(n) и не зависит от позиций элементов. Пути расхождений
+    указывают на индекс элемента в actual.
+
+    Args:
+        actual (Sequence[BaseModel]): Текущие элементы (например, из ответа сервера).
+        expected (Sequence[BaseModel]): Ожидаемые элементы.
+        key (str): Путь к атрибуту-ключу элемента (например, "id").
+        ignore_order (bool): Не проверять порядок общих элементов.
+        fields (Collection[str] | None): Сравниваемые поля элементов. По умолчанию все.
+        exclude (Collection[str]): Поля элементов, которые не сравниваются.
+        mapping (Mapping[str, str] | None): Соответствие полей expected путям в actual.
+
+    Returns:
+        CollectionDiff: Отсутствующие, лишние, изменённые элементы и порядок.
+    """
+    result = CollectionDiff()
+    get_key = attrgetter(key)
+
+    actual_index: dict[Any, int] = {}
+    for index, item in enumerate(actual):
+        item_key = get_key(item)
+        if item_key in actual_index:
+            result.duplicates.append(item_key)
+        else:
+            actual_index[item_key] = index
+
+    expected_keys = []
+    for expected_item in expected:
+        item_key = get_key(expected_item)
+        index = actual_index.get(item_key)
+        if index is None:
+            result.missing.append(item_key)
+            continue
+
+        expected_keys.append(item_key)
+        _diff_model(
+            actual[index],
+            expected_item,
+            f"/{index}",
+            result.changed,
+            fields,
+            exclude,
+            mapping or {},
+        )
+
+    expected_key_set = set(expected_keys)
+    result.extra = [
+        item_key for item_key in actual_index if item_key not in expected_key_set
+    ]
+
+    if not ignore_order:
+        actual_keys = [
+            item_key for item_key in actual_index if item_key in expected_key_set
+        ]
+        for position, (actual_key, expected_key) in enumerate(
+            zip(actual_keys, expected_keys)
+        ):
+            if actual_key != expected_key:
+                result.order = Mismatch(
+                    f"/{position} (order)", expected=expected_key, actual=actual_key
+                )
+                break
+
+    return result
+
+
+@step("Проверяем, что коллекция {name} соответствует ожидаемой")
+def assert_collections_equal(
+    actual: Sequence[BaseModel],
+    expected: Sequence[BaseModel],
+    name: str,
+    key: str = "id",
+    ignore_order: bool = False,
+    fields: Collection[str] | None = None,
+    exclude: Collection[str] = (),
+    mapping: Mapping[str, str] | None = None,
+) -> None:
+    """
+    Проверяет коллекции одним сравнением по ключу и сообщает об отсутствующих,
+    лишних и изменённых элементах отдельно.
+
+    Args:
+        actual (Sequence[BaseModel]): Текущие элементы.
+        expected (Sequence[BaseModel]): Ожидаемые элементы.
+        name (str): Название коллекции для вывода в сообщении об ошибке.
+        key (str): Путь к атрибуту-ключу элемента.
+        ignore_order (bool): Не проверять порядок общих элементов.
+        fields (Collection[str] | None): Сравниваемые поля элементов. По умолчанию все.
+        exclude (Collection[str]): Поля элементов, которые не сравниваются.
+        mapping (Mapping[str, str] | None): Соответствие полей expected путям в actual.
+
+    Raises:
+        AssertionError: Если коллекции расходятся.
+    """
+    result = diff_collections(
+        actual, expected, key, ignore_order, fields, exclude, mapping
+    )
+
+    reported = result.report()
+    if not record_check(name, reported, [], not result):
+        logger.info(f"Проверяем, что коллекция {name} соответствует ожидаемой")
+
+    assert not result, (
+        f"Incorrect '{name}' ({len(actual)} actual, {len(expected)} expected)\n"
+        + "\n".join(reported)
+    )
+
+
+@step("Проверяем, что {name} соответствует ожидаемому значению")
+def assert_models_equal(
+    actual: BaseModel,
+    expected: BaseModel,
+    name: str,
+    fields: Collection[str] | None = None,
+    exclude: Collection[str] = (),
+    mapping: Mapping[str, str] | None = None,
+) -> None:
+    """
+    Проверяет модели одним сравнением и сообщает обо всех расхождениях сразу.
+
+    Args:
+        actual (BaseModel): Текущая модель.
+        expected (BaseModel): Ожидаемая модель или схема запроса.
+        name (str): Название проверяемого объекта для вывода в сообщении об ошибке.
+        fields (Collection[str] | None): Сравниваемые поля expected. По умолчанию все.
+        exclude (Collection[str]): Поля expected, которые не сравниваются.
+        mapping (Mapping[str, str] | None): Соответствие полей expected путям в actual.
+
+    Raises:
+        AssertionError: Если модели расходятся хотя бы в одном поле.
+    """
+    mismatches = diff_models(actual, expected, fields, exclude, mapping)
+
+    reported = [str(mismatch) for mismatch in mismatches]
+    if not record_check(name, reported, [], not mismatches):
+        logger.info(f"Проверяем, что {name} соответствует ожидаемому значению")
+
+    assert (
+        not mismatches
+    ), f"Incorrect '{name}': {len(mismatches)} mismatch(es)\n" + "\n".join(reported)
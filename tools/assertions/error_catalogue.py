@@ -0,0 +1,144 @@
+import sys
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from clients.courses import constants as courses_constants
+from clients.errors_schema import ValidationErrorResponseSchema, ValidationErrorSchema
+from clients.exercises import constants as exercises_constants
+from clients.users import constants as users_constants
+from tools.assertions.api_error_constants import ErrorContext
+
+CatalogueKey = tuple[ErrorContext, tuple[str, ...], tuple[tuple[str, Any], ...]]
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType(
+            {sys.intern(key): _freeze(item) for key, item in value.items()}
+        )
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class ExpectedError:
+    """
+    Неизменяемая ожидаемая ошибка валидации без входного значения.
+
+    Attrs:
+        type (str): Тип ошибки.
+        message (str): Сообщение об ошибке.
+        context (Mapping[str, Any]): Контекст ошибки (только для чтения).
+        location (tuple[str, ...]): Путь к полю с ошибкой.
+    """
+
+    type: str
+    message: str
+    context: Mapping[str, Any]
+    location: tuple[str, ...]
+
+    def with_input(self, value: Any) -> ValidationErrorResponseSchema:
+        """
+        Возвращает ожидаемый ответ сервера с ошибкой для переданного входного значения.
+
+        Шаблоны ErrorContext при этом повторно не форматируются.
+
+        Args:
+            value (Any): Значение, отправленное в запросе.
+
+        Returns:
+            ValidationErrorResponseSchema: Ожидаемый ответ с одной ошибкой.
+        """
+        return ValidationErrorResponseSchema(
+            details=[
+                ValidationErrorSchema(
+                    type=self.type,
+                    input=value,
+                    context=_thaw(self.context),
+                    message=self.message,
+                    location=list(self.location),
+                )
+            ]
+        )
+
+
+class ErrorCatalogue:
+    """
+    Каталог ожидаемых ошибок валидации по ключу (ErrorContext, путь, параметры).
+
+    Каждая ошибка форматируется из шаблона ErrorContext один раз: при
+    предзагрузке или при первом обращении. Записи неизменяемы, а их строки
+    интернированы, поэтому одна запись безопасно переиспользуется всеми тестами.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[CatalogueKey, ExpectedError] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self, context: ErrorContext, location: tuple[str, ...], **params: Any
+    ) -> ExpectedError:
+        """
+        Возвращает ожидаемую ошибку, форматируя её только при первом обращении.
+
+        Args:
+            context (ErrorContext): Тип ошибки.
+            location (tuple[str, ...]): Путь к полю с ошибкой (например, ("body", "title")).
+            **params: Параметры шаблона (max_length, min_length, ge, length и т.д.).
+
+        Returns:
+            ExpectedError: Неизменяемая ожидаемая ошибка.
+        """
+        key = (context, tuple(location), tuple(sorted(params.items())))
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+
+        error_type, error_context, message = context.format_error(**params)
+        entry = ExpectedError(
+            type=sys.intern(error_type),
+            message=sys.intern(message),
+            context=_freeze(error_context),
+            location=tuple(sys.intern(part) for part in location),
+        )
+        with self._lock:
+            return self._entries.setdefault(key, entry)
+
+    def preload(self) -> None:
+        """
+        Заранее форматирует ошибки для всех полей из MAX_LENGTH_FIELDS и
+        FIELD_NAME_MAPPING курсов, упражнений и пользователей.
+        """
+        for constants in (courses_constants, exercises_constants, users_constants):
+            aliases = constants.FIELD_NAME_MAPPING
+            for field, max_length in constants.MAX_LENGTH_FIELDS.items():
+                self.get(
+                    ErrorContext.STRING_TOO_LONG,
+                    ("body", aliases[field]),
+                    max_length=max_length,
+                )
+
+            for alias in aliases.values():
+                self.get(ErrorContext.STRING_TOO_SHORT, ("body", alias), min_length=1)
+                if alias.endswith("Id"):
+                    self.get(
+                        ErrorContext.INVALID_UUID_LENGTH, ("body", alias), length=0
+                    )
+
+        self.get(ErrorContext.INVALID_EMAIL, ("body", "email"), reason="@-sign")
+
+
+error_catalogue = ErrorCatalogue()
+error_catalogue.preload()
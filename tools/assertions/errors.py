@@ -1,19 +1,18 @@
 from typing import Any
 
-import allure
 
 from clients.errors_schema import ValidationErrorSchema, ValidationErrorResponseSchema
+from tools.allure.steps import step
 from tools.assertions.api_error_constants import ErrorContext
 from tools.assertions.base import assert_equal, assert_length
-from tools.assertions.error_builder import ValidationErrorBuilder
+from tools.assertions.error_catalogue import error_catalogue
 from tools.logger import get_logger
 
 
 logger = get_logger("ERRORS_ASSSERTIONS")
-err_builder = ValidationErrorBuilder()
 
 
-@allure.step("Проверяем данные ожидаемой валидационной ошибки")
+@step("Проверяем данные ожидаемой валидационной ошибки")
 def assert_validation_error(
     actual: ValidationErrorSchema, expected: ValidationErrorSchema
 ) -> None:
@@ -36,7 +35,7 @@ def assert_validation_error(
     assert_equal(actual.context, expected.context, "context")
 
 
-@allure.step("Проверяем ответ сервера с ожидаемой валидационной ошибкой")
+@step("Проверяем ответ сервера с ожидаемой валидационной ошибкой")
 def assert_validation_error_response(
     actual: ValidationErrorResponseSchema, expected: ValidationErrorResponseSchema
 ) -> None:
@@ -59,7 +58,7 @@ def assert_validation_error_response(
         assert_validation_error(actual_detail, expected_detail)
 
 
-@allure.step("Проверяем ответ сервера с ожидаемой внутренней ошибкой")
+@step("Проверяем ответ сервера с ожидаемой внутренней ошибкой")
 def assert_internal_error_response(actual: Any, expected: Any) -> None:
     """
     Проверяет соответствие данных ошибки.
@@ -76,7 +75,7 @@ def assert_internal_error_response(actual: Any, expected: Any) -> None:
     assert_equal(actual.details, expected.details, "details"),
 
 
-@allure.step(
+@step(
     "Проверяем ответ сервера с ожидаемой валидационной ошибкой с некорректным id"
 )
 def assert_validation_error_for_invalid_id(
@@ -95,17 +94,14 @@ def assert_validation_error_for_invalid_id(
     Raises:
         AssertionError: Если данные в ответе не совпадают с ожидаемыми.
     """
-    expected = (
-        err_builder.with_input(input_value)
-        .with_error(ErrorContext.INVALID_UUID_CHAR, char="i", position=1)
-        .at_location(*location)
-        .build()
-    )
+    expected = error_catalogue.get(
+        ErrorContext.INVALID_UUID_CHAR, tuple(location), char="i", position=1
+    ).with_input(input_value)
     logger.info(f"Проверяем ошибку валидации для некорректного ID в '{location}'")
     assert_validation_error_response(actual=actual, expected=expected)
 
 
-@allure.step(
+@step(
     f"Проверяем ответ сервера с ожидаемой валидационной ошибкой"
     f" для некорректного значения в поле 'email'"
 )
@@ -113,13 +109,9 @@ def assert_validation_error_for_invalid_email(
     actual: ValidationErrorResponseSchema,
     input_value: str = "",
 ) -> None:
-    err_params = {"err_context": ErrorContext.INVALID_EMAIL, "reason": "@-sign"}
-    expected = (
-        err_builder.with_input(input_value)
-        .with_error(**err_params)
-        .at_location("body", "email")
-        .build()
-    )
+    expected = error_catalogue.get(
+        ErrorContext.INVALID_EMAIL, ("body", "email"), reason="@-sign"
+    ).with_input(input_value)
     logger.info(
         f"Проверяем ответ сервера с ожидаемой валидационной ошибкой"
         f" для некорректного значения в поле 'email'"
@@ -127,7 +119,7 @@ def assert_validation_error_for_invalid_email(
     assert_validation_error_response(actual=actual, expected=expected)
 
 
-@allure.step(
+@step(
     f"Проверяем ответ сервера с ожидаемой валидационной ошибкой"
     f" на пустое обязательное поле c id {{field_name}} в теле запроса"
 )
@@ -135,20 +127,16 @@ def assert_validation_error_for_empty_id_field(
     actual: ValidationErrorResponseSchema,
     field_name: str,
 ) -> None:
-    err_params = {"err_context": ErrorContext.INVALID_UUID_LENGTH, "length": 0}
-    expected = (
-        err_builder.with_input("")
-        .with_error(**err_params)
-        .at_location("body", field_name)
-        .build()
-    )
+    expected = error_catalogue.get(
+        ErrorContext.INVALID_UUID_LENGTH, ("body", field_name), length=0
+    ).with_input("")
     logger.info(
         f"Проверям ошибку валидации для отсутствующего значения в поле '{field_name}'"
     )
     assert_validation_error_response(actual=actual, expected=expected)
 
 
-@allure.step(
+@step(
     f"Проверяем ответ сервера с ожидаемой валидационной ошибкой"
     f" на пустое обязательное стоковое поле {{field_name}} в теле запроса"
 )
@@ -156,21 +144,16 @@ def assert_validation_error_for_empty_string_field(
     actual: ValidationErrorResponseSchema,
     field_name: str,
 ) -> None:
-    err_params = {"err_context": ErrorContext.STRING_TOO_SHORT, "min_length": 1}
-
-    expected = (
-        err_builder.with_input("")
-        .with_error(**err_params)
-        .at_location("body", field_name)
-        .build()
-    )
+    expected = error_catalogue.get(
+        ErrorContext.STRING_TOO_SHORT, ("body", field_name), min_length=1
+    ).with_input("")
     logger.info(
         f"Проверям ошибку валидации для отсутствующего значения в поле '{field_name}'"
     )
     assert_validation_error_response(actual=actual, expected=expected)
 
 
-@allure.step(
+@step(
     f"Проверяем ответ сервера с ожидаемой валидационной ошибкой"
     f" для значения, превышающего максимальную длину поля {{location}} в теле запроса"
 )
@@ -180,17 +163,9 @@ def assert_validation_error_for_too_long_field(
     input_value: str,
     max_length: int,
 ) -> None:
-    error_params = {
-        "err_context": ErrorContext.STRING_TOO_LONG,
-        "max_length": max_length,
-    }
-
-    expected = (
-        err_builder.with_input(input_value)
-        .with_error(**error_params)
-        .at_location("body", location)
-        .build()
-    )
+    expected = error_catalogue.get(
+        ErrorContext.STRING_TOO_LONG, ("body", location), max_length=max_length
+    ).with_input(input_value)
     logger.info(
         f"Проверям ошибку валидации для значения,"
         f" превышающего максимальную длину поля '{location}'"
@@ -1,5 +1,3 @@
-import allure
-
 from clients.errors_schema import (
     InternalErrorResponseSchema,
     ValidationErrorResponseSchema,
@@ -14,9 +12,12 @@ from clients.exercises.exercises_schema import (
 )
 from clients.exercises.constants import FIELD_NAME_MAPPING, MAX_LENGTH_FIELDS
 from fixtures.exercises import ExercisesListFixture
+from config import settings
+from tools.allure.steps import step
 from tools.assertions.base import assert_equal, assert_length
+from tools.assertions.diff import assert_collections_equal, assert_models_equal
 from tools.assertions.api_error_constants import ErrorContext
-from tools.assertions.error_builder import ValidationErrorBuilder
+from tools.assertions.error_catalogue import error_catalogue
 from tools.assertions.errors import (
     assert_internal_error_response,
     assert_validation_error_for_empty_id_field,
@@ -28,11 +29,10 @@ from tools.assertions.errors import (
 from tools.logger import get_logger
 
 
-err_builder = ValidationErrorBuilder()
 logger = get_logger("EXERCISES_ASSERTIONS")
 
 
-@allure.step("Проверяем соответсвие данных упражнения")
+@step("Проверяем соответсвие данных упражнения")
 def assert_exercise(actual: ExerciseSchema, expected: ExerciseSchema):
     """
     Проверка соответствия данных упражнения.
@@ -45,17 +45,10 @@ def assert_exercise(actual: ExerciseSchema, expected: ExerciseSchema):
         AssertionError: Если данные не совпадают.
     """
     logger.info("Проверяем соответсвие данных упражнения")
-    assert_equal(actual.id, expected.id, "id")
-    assert_equal(actual.title, expected.title, "title")
-    assert_equal(actual.course_id, expected.course_id, "course_id")
-    assert_equal(actual.max_score, expected.max_score, "max_score")
-    assert_equal(actual.min_score, expected.min_score, "min_score")
-    assert_equal(actual.order_index, expected.order_index, "order_index")
-    assert_equal(actual.description, expected.description, "description")
-    assert_equal(actual.estimated_time, expected.estimated_time, "estimated_time")
+    assert_models_equal(actual, expected, "exercise")
 
 
-@allure.step("Проверяем ответ сервера на запрос создания упражнения")
+@step("Проверяем ответ сервера на запрос создания упражнения")
 def assert_create_exercise_response(
     response: ExerciseResponseSchema,
     request: CreateExerciseRequestSchema,
@@ -71,15 +64,10 @@ def assert_create_exercise_response(
         AssertionError: Если данные не совпадают.
     """
     logger.info("Проверяем ответ сервера на запрос создания упражнения")
-    for field_name in request.model_dump().keys():
-        assert_equal(
-            getattr(response.exercise, field_name),
-            getattr(request, field_name),
-            field_name,
-        )
+    assert_models_equal(response.exercise, request, "exercise")
 
 
-@allure.step("Проверяем ответ сервера на запрос получения упражнения")
+@step("Проверяем ответ сервера на запрос получения упражнения")
 def assert_get_exercise_response(
     expected_response: ExerciseResponseSchema,
     response: ExerciseResponseSchema,
@@ -98,7 +86,7 @@ def assert_get_exercise_response(
     assert_exercise(response.exercise, expected_response.exercise)
 
 
-@allure.step("Проверяем ответ сервера на запрос обновления упражнения")
+@step("Проверяем ответ сервера на запрос обновления упражнения")
 def assert_update_exercise_response(
     request: UpdateExerciseRequestSchema,
     response: ExerciseResponseSchema,
@@ -117,16 +105,10 @@ def assert_update_exercise_response(
     """
     logger.info("Проверяем ответ сервера на запрос обновления упражнения")
     assert_equal(response.exercise.id, exercise_id, "id")
-
-    for field_name in request.model_dump().keys():
-        assert_equal(
-            getattr(response.exercise, field_name),
-            getattr(request, field_name),
-            field_name,
-        )
+    assert_models_equal(response.exercise, request, "exercise")
 
 
-@allure.step("Проверяем ответ сервера на запрос несуществующего упражнения")
+@step("Проверяем ответ сервера на запрос несуществующего упражнения")
 def assert_not_found_exercise_response(actual: InternalErrorResponseSchema):
     """
     Проверяет, что при запросе несуществующего упражнения сервер возвращает ошибку.
@@ -143,7 +125,7 @@ def assert_not_found_exercise_response(actual: InternalErrorResponseSchema):
     assert_internal_error_response(actual=actual, expected=expected)
 
 
-@allure.step("Проверяем ответ сервера на запрос списка упражнений")
+@step("Проверяем ответ сервера на запрос списка упражнений")
 def assert_get_exercises_response(
     request: GetExercisesQuerySchema,
     expected_response: ExercisesListFixture,
@@ -162,12 +144,17 @@ def assert_get_exercises_response(
     """
     logger.info("Проверяем ответ сервера на запрос списка упражнений")
     assert_equal(expected_response.request.course_id, request.course_id, "course_id")
-    assert_length(response.exercises, expected_response.response.exercises, "exercises")
-    for index, exercise in enumerate(expected_response.response.exercises):
-        assert_exercise(actual=response.exercises[index], expected=exercise)
+    # Порядок списка совпадает с порядком создания упражнений, который
+    # предсказуем только при последовательной подготовке данных.
+    assert_collections_equal(
+        response.exercises,
+        expected_response.response.exercises,
+        "exercises",
+        ignore_order=settings.FIXTURE_SETUP.is_concurrent,
+    )
 
 
-@allure.step(
+@step(
     "Проверяем ответ сервера на запрос списка упражнений с некорректным id курса"
 )
 def assert_get_exercises_with_incorrect_course_id_response(
@@ -191,7 +178,7 @@ def assert_get_exercises_with_incorrect_course_id_response(
     )
 
 
-@allure.step(
+@step(
     "Проверяем ответ сервера на запрос списка упражнений с несуществующим id курса"
 )
 def assert_get_exercises_with_non_existent_course_id_response(
@@ -213,7 +200,7 @@ def assert_get_exercises_with_non_existent_course_id_response(
     assert_length(actual.exercises, [], "exercises")
 
 
-@allure.step(
+@step(
     "Проверяем ответ сервера на запрос создания упражнения с некорректным id курса"
 )
 def assert_create_exercise_with_invalid_course_id_response(
@@ -236,7 +223,7 @@ def assert_create_exercise_with_invalid_course_id_response(
     assert_validation_error_for_invalid_id(actual=actual, location=["body", "courseId"])
 
 
-@allure.step(
+@step(
     "Проверям ответ сервера после запроса на создание или обновление упражнения с пустым обязательным параметром"
 )
 def assert_create_or_update_exercise_with_empty_required_string_field_response(
@@ -268,7 +255,7 @@ def assert_create_or_update_exercise_with_empty_required_string_field_response(
         )
 
 
-@allure.step(
+@step(
     "Проверям ответ сервера после запроса на создание или обновление упражнения с слишком длинным строковым параметром"
 )
 def assert_create_or_update_exercise_with_too_long_string_field_response(
@@ -298,7 +285,7 @@ def assert_create_or_update_exercise_with_too_long_string_field_response(
     )
 
 
-@allure.step(
+@step(
     "Проверям ответ сервера после запроса на создание или обновление упражнения с некорректным score"
 )
 def assert_create_or_update_exercise_with_incorrect_score_response(
@@ -318,19 +305,13 @@ def assert_create_or_update_exercise_with_incorrect_score_response(
     """
 
     if request.min_score > request.max_score:
-        expected = (
-            err_builder.with_input(request.model_dump(by_alias=True))
-            .with_error(ErrorContext.SCORE_VALIDATION)
-            .at_location("body")
-            .build()
-        )
+        expected = error_catalogue.get(
+            ErrorContext.SCORE_VALIDATION, ("body",)
+        ).with_input(request.model_dump(by_alias=True))
     else:
-        expected = (
-            err_builder.with_input(request.min_score)
-            .with_error(ErrorContext.NON_NEGATIVE_NUMBER, ge=0)
-            .at_location("body", "minScore")
-            .build()
-        )
+        expected = error_catalogue.get(
+            ErrorContext.NON_NEGATIVE_NUMBER, ("body", "minScore"), ge=0
+        ).with_input(request.min_score)
 
     logger.info(
         "Проверям ответ сервера после запроса на создание или обновление упражнения с некорректным score"
@@ -338,7 +319,7 @@ def assert_create_or_update_exercise_with_incorrect_score_response(
     assert_validation_error_response(actual=actual, expected=expected)
 
 
-@allure.step("Проверяем ответ сервера на запрос упражнения с некорректным id")
+@step("Проверяем ответ сервера на запрос упражнения с некорректным id")
 def assert_get_exercise_with_incorrect_exercise_id_response(
     actual: ValidationErrorResponseSchema,
 ):
@@ -357,7 +338,7 @@ def assert_get_exercise_with_incorrect_exercise_id_response(
     )
 
 
-@allure.step("Проверяем ответ сервера на запрос удаления упражнения с некорректным id")
+@step("Проверяем ответ сервера на запрос удаления упражнения с некорректным id")
 def assert_delete_exercise_with_incorrect_exercise_id_response(
     actual: ValidationErrorResponseSchema,
 ):
@@ -1,5 +1,3 @@
-import allure
-
 from clients.errors_schema import (
     InternalErrorResponseSchema,
     ValidationErrorResponseSchema,
@@ -11,7 +9,9 @@ from clients.files.files_schema import (
 )
 from clients.files.files_client import FilesClient
 from config import settings
+from tools.allure.steps import step
 from tools.assertions.base import assert_equal, assert_status_code
+from tools.assertions.diff import assert_models_equal
 from tools.assertions.errors import (
     assert_internal_error_response,
     assert_validation_error_for_empty_string_field,
@@ -23,7 +23,7 @@ from tools.logger import get_logger
 logger = get_logger("FILES_ASSERTIONS")
 
 
-@allure.step("Проверяем ответ сервера после загрузки файла")
+@step("Проверяем ответ сервера после загрузки файла")
 def assert_upload_file_response(
     request: UploadFileRequestSchema, response: UploadFileResponseSchema
 ):
@@ -42,12 +42,13 @@ def assert_upload_file_response(
         f"{settings.HTTP_CLIENT.URL}static/{request.directory}/{request.filename}"
     )
     logger.info("Проверяем ответ сервера после загрузки файла")
-    assert_equal(response.file.filename, request.filename, "filename")
-    assert_equal(response.file.directory, request.directory, "directory")
+    assert_models_equal(
+        response.file, request, "file", fields={"filename", "directory"}
+    )
     assert_equal(str(response.file.url), expected_url, "url")
 
 
-@allure.step("Проверяем доступность файла по id")
+@step("Проверяем доступность файла по id")
 def assert_file_is_accessible(
     client: FilesClient, file_id: str, expected_status_code: int
 ):
@@ -67,7 +68,7 @@ def assert_file_is_accessible(
     assert_status_code(response.status_code, expected_status_code)
 
 
-@allure.step("Проверяем соответствие данных файла")
+@step("Проверяем соответствие данных файла")
 def assert_file(actual: FileSchema, expected: FileSchema):
     """
     Проверяет соответствие данных файла.
@@ -80,13 +81,10 @@ def assert_file(actual: FileSchema, expected: FileSchema):
         AssertionError: Если данные не совпадают.
     """
     logger.info("Проверяем соответствие данных файла")
-    assert_equal(actual.id, expected.id, "id")
-    assert_equal(actual.filename, expected.filename, "filename")
-    assert_equal(actual.directory, expected.directory, "directory")
-    assert_equal(actual.url, expected.url, "url")
+    assert_models_equal(actual, expected, "file")
 
 
-@allure.step("Проверяем ответ сервера на запрос файла")
+@step("Проверяем ответ сервера на запрос файла")
 def assert_get_file_response(
     get_file_response: UploadFileResponseSchema,
     create_file_response: UploadFileResponseSchema,
@@ -106,7 +104,7 @@ def assert_get_file_response(
     assert_file(get_file_response.file, create_file_response.file)
 
 
-@allure.step("Проверяем ответ сервера на запрос создания файла с пустым полем")
+@step("Проверяем ответ сервера на запрос создания файла с пустым полем")
 def assert_create_file_with_empty_field_response(
     actual: ValidationErrorResponseSchema, field_name: str
 ):
@@ -122,7 +120,7 @@ def assert_create_file_with_empty_field_response(
     assert_validation_error_for_empty_string_field(actual=actual, field_name=field_name)
 
 
-@allure.step("Проверяем ответ сервера на запрос несуществующего файла")
+@step("Проверяем ответ сервера на запрос несуществующего файла")
 def assert_file_not_found_response(actual: InternalErrorResponseSchema):
     """
     Проверяет, что при запросе несуществующего файла сервер возвращает ошибку.
@@ -138,7 +136,7 @@ def assert_file_not_found_response(actual: InternalErrorResponseSchema):
     assert_internal_error_response(actual, expected)
 
 
-@allure.step("Проверяем ответ сервера на запрос файла с некорректным id")
+@step("Проверяем ответ сервера на запрос файла с некорректным id")
 def assert_get_file_with_incorrect_file_id_response(
     actual: ValidationErrorResponseSchema,
 ):
@@ -156,7 +154,7 @@ def assert_get_file_with_incorrect_file_id_response(
     assert_validation_error_for_invalid_id(actual=actual, location=["path", "file_id"])
 
 
-@allure.step("Проверяем ответ сервера на запрос удаления файла с некорректным id")
+@step("Проверяем ответ сервера на запрос удаления файла с некорректным id")
 def assert_delete_file_with_incorrect_file_id_response(
     actual: ValidationErrorResponseSchema,
 ):
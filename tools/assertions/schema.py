@@ -1,34 +1,94 @@
+from functools import lru_cache
 from typing import Any
 
-import allure
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 from jsonschema.validators import Draft202012Validator
+from pydantic import BaseModel
 
+from tools.allure.steps import step
 from tools.logger import get_logger
+from tools.schema_registry import schema_registry
+
 
 logger = get_logger("SCHEMA_ASSERTIONS")
 
 
-@allure.step("Проверяем, соответствует ли ответ сервера JSON-схеме")
-def validate_json_schema(instance: Any, schema: Any) -> None:
+@lru_cache(maxsize=None)
+def get_schema_validator(model_class: type[BaseModel]) -> Draft202012Validator:
+    """
+    Функция возвращает скомпилированный валидатор JSON-схемы класса модели.
+
+    Схема берётся из schema_registry (с диска, если её уже сгенерировал другой
+    процесс) и проверяется один раз за процесс, а валидатор переиспользуется
+    для всех последующих проверок.
+
+    Args:
+        model_class (type[BaseModel]): Класс pydantic-модели.
+
+    Returns:
+        Draft202012Validator: Валидатор с проверкой форматов.
+    """
+    schema = schema_registry.get_schema(model_class)
+    Draft202012Validator.check_schema(schema)
+
+    return Draft202012Validator(
+        schema, format_checker=Draft202012Validator.FORMAT_CHECKER
+    )
+
+
+def get_schema_errors(
+    instance: Any, schema: type[BaseModel] | dict[str, Any]
+) -> list[str]:
+    """
+    Функция проверяет объект по JSON-схеме и возвращает все ошибки за один проход.
+
+    В отличие от validate_json_schema не открывает шаг Allure и не выбрасывает
+    исключение, поэтому может выполняться вне потока теста.
+
+    Args:
+        instance (Any): Объект, который должен соответствовать схеме.
+        schema (type[BaseModel] | dict[str, Any]): Класс модели, валидатор которого
+            берётся из кеша, или схема в формате JSON.
+
+    Returns:
+        list[str]: Ошибки в виде "JSON-путь: сообщение", отсортированные по пути.
+    """
+    if isinstance(schema, dict):
+        Draft202012Validator.check_schema(schema)
+        validator = Draft202012Validator(
+            schema, format_checker=Draft202012Validator.FORMAT_CHECKER
+        )
+    else:
+        validator = get_schema_validator(schema)
+
+    errors = sorted(validator.iter_errors(instance), key=lambda error: error.json_path)
+    return [f"{error.json_path}: {error.message}" for error in errors]
+
+
+@step("Проверяем, соответствует ли ответ сервера JSON-схеме")
+def validate_json_schema(
+    instance: Any, schema: type[BaseModel] | dict[str, Any]
+) -> None:
     """
     Функция для валидации JSON-схемы.
 
+    Все ошибки валидации собираются за один проход и выводятся одним исключением.
+
     Args:
         instance (Any): Объект, который должен соответствовать схеме.
-        schema (Any): Схема в формате JSON.
+        schema (type[BaseModel] | dict[str, Any]): Класс модели, валидатор которого
+            берётся из кеша, или схема в формате JSON.
 
     Raises:
         ValidationError: Если объект не соответствует схеме.
     """
-    try:
-        logger.info("Проверяем, соответствует ли ответ сервера JSON-схеме")
+    logger.info("Проверяем, соответствует ли ответ сервера JSON-схеме")
 
-        validate(
-            schema=schema,
-            instance=instance,
-            format_checker=Draft202012Validator.FORMAT_CHECKER,
-        )
-    except ValidationError as e:
-        print(f"Ошибка валидации: {e}")
+    errors = get_schema_errors(instance, schema)
+    if not errors:
+        return
+
+    details = "\n".join(errors)
+    raise ValidationError(
+        f"Ответ не соответствует JSON-схеме, ошибок: {len(errors)}\n{details}"
+    )
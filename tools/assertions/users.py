@@ -1,5 +1,3 @@
-import allure
-
 from clients.errors_schema import (
     InternalErrorResponseSchema,
     ValidationErrorResponseSchema,
@@ -11,7 +9,9 @@ from clients.users.users_schema import (
     UserResponseSchema,
     UserSchema,
 )
+from tools.allure.steps import step
 from tools.assertions.base import assert_equal
+from tools.assertions.diff import assert_models_equal
 from tools.assertions.errors import (
     assert_internal_error_response,
     assert_validation_error_for_empty_string_field,
@@ -24,7 +24,7 @@ from tools.logger import get_logger
 logger = get_logger("USERS_ASSERTIONS")
 
 
-@allure.step("Проверяем ответ на запрос создания пользователя")
+@step("Проверяем ответ на запрос создания пользователя")
 def assert_create_user_response(
     request: CreateUserRequestSchema, response: UserResponseSchema
 ) -> None:
@@ -39,13 +39,10 @@ def assert_create_user_response(
         AssertionError: Если данные в ответе не совпадают с ожидаемыми.
     """
     logger.info("Проверяем ответ на запрос создания пользователя")
-    assert_equal(request.email, response.user.email, "email")
-    assert_equal(request.first_name, response.user.first_name, "first_name")
-    assert_equal(request.last_name, response.user.last_name, "last_name")
-    assert_equal(request.middle_name, response.user.middle_name, "middle_name")
+    assert_models_equal(response.user, request, "user", exclude={"password"})
 
 
-@allure.step("Проверяем ответ на запрос обновления данных пользователя")
+@step("Проверяем ответ на запрос обновления данных пользователя")
 def assert_update_user_response(
     actual: UserResponseSchema,
     expected: UpdateUserRequestSchema,
@@ -63,13 +60,10 @@ def assert_update_user_response(
     """
     logger.info("Проверяем ответ на запрос обновления данных пользователя")
     assert_equal(user_id, actual.user.id, "id")
-    assert_equal(expected.email, actual.user.email, "email")
-    assert_equal(expected.first_name, actual.user.first_name, "first_name")
-    assert_equal(expected.last_name, actual.user.last_name, "last_name")
-    assert_equal(expected.middle_name, actual.user.middle_name, "middle_name")
+    assert_models_equal(actual.user, expected, "user")
 
 
-@allure.step("Проверяем соответствие данных пользователя")
+@step("Проверяем соответствие данных пользователя")
 def assert_user(actual: UserSchema, expected: UserSchema) -> None:
     """
     Проверка соответствия данных пользователя.
@@ -82,14 +76,10 @@ def assert_user(actual: UserSchema, expected: UserSchema) -> None:
         AssertionError: Если данные не совпадают.
     """
     logger.info("Проверяем соответствие данных пользователя")
-    assert_equal(actual.id, expected.id, "id")
-    assert_equal(actual.email, expected.email, "email")
-    assert_equal(actual.first_name, expected.first_name, "first_name")
-    assert_equal(actual.last_name, expected.last_name, "last_name")
-    assert_equal(actual.middle_name, expected.middle_name, "middle_name")
+    assert_models_equal(actual, expected, "user")
 
 
-@allure.step("Проверяем ответ сервера на запрос пользователя")
+@step("Проверяем ответ сервера на запрос пользователя")
 def assert_get_user_response(
     get_user_response: UserResponseSchema, create_user_response: UserResponseSchema
 ) -> None:
@@ -106,7 +96,7 @@ def assert_get_user_response(
     assert_user(get_user_response, create_user_response)
 
 
-@allure.step(
+@step(
     f"Проверям ответ сервера после запроса на создание "
     f"или обновление пользователя с пустым обязательным параметром."
 )
@@ -137,7 +127,7 @@ def assert_create_or_update_user_with_empty_required_field_response(
         )
 
 
-@allure.step(
+@step(
     f"Проверям ответ сервера после запроса на создание "
     f"или обновление пользователя со значением, превышающим максимальную длину поля."
 )
@@ -176,7 +166,7 @@ def assert_create_or_update_user_with_too_long_field_response(
         )
 
 
-@allure.step(
+@step(
     "Проверяем ответ сервера на запрос удаления пользователя с некорректным id"
 )
 def assert_delete_user_with_incorrect_user_id_response(
@@ -214,7 +204,7 @@ def assert_get_user_with_incorrect_user_id_response(
     assert_validation_error_for_invalid_id(actual=actual, location=["path", "user_id"])
 
 
-@allure.step("Проверяем ответ сервера на запрос несуществующего пользователя")
+@step("Проверяем ответ сервера на запрос несуществующего пользователя")
 def assert_not_found_user_response(actual: InternalErrorResponseSchema):
     """
     Проверяет, что при запросе несуществующего пользователя сервер возвращает ошибку.
@@ -0,0 +1,258 @@
+"""
+Сравнение пропускной способности HTTP/1.1 и HTTP/2 на конкурентном создании курсов.
+
+Тестовый сервер курса отвечает только по HTTP/1.1, поэтому замер выполняется
+против локального сервера-заглушки, который понимает и HTTP/1.1 (keep-alive),
+и HTTP/2 с prior knowledge (h2c). Каждый ответ задерживается на delay секунд,
+имитируя обработку запроса на стороне API.
+
+Запуск:
+    python -m tools.benchmarks.http2 --requests 500 --concurrency 50 --delay 0.02
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import h2.config
+import h2.connection
+import h2.events
+from httpx import AsyncClient, Limits
+
+from clients.api_client import AsyncApiClient
+from clients.courses.courses_schema import CreateCourseRequestSchema
+from tools.console_output_formatter import print_dict
+from tools.routes.api_routes import APIRoutes
+
+H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+
+@dataclass
+class StubServerStats:
+    """
+    Счётчики сервера-заглушки.
+
+    Attrs:
+        connections (dict[str, int]): Количество принятых соединений по протоколу.
+        requests (int): Количество обработанных запросов.
+    """
+
+    connections: dict[str, int] = field(
+        default_factory=lambda: {"HTTP/1.1": 0, "HTTP/2": 0}
+    )
+    requests: int = 0
+
+
+class StubCoursesServer:
+    """
+    Сервер-заглушка, отвечающий на любой запрос телом созданного курса.
+
+    Протокол определяется по первым байтам соединения: преамбула HTTP/2
+    обрабатывается через h2, всё остальное считается HTTP/1.1.
+    """
+
+    def __init__(self, delay: float):
+        """
+        Args:
+            delay (float): Задержка ответа в секундах.
+        """
+        self.delay = delay
+        self.stats = StubServerStats()
+        self._server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            head = await reader.readexactly(len(H2_PREFACE))
+            if head == H2_PREFACE:
+                self.stats.connections["HTTP/2"] += 1
+                await self._serve_http2(head, reader, writer)
+            else:
+                self.stats.connections["HTTP/1.1"] += 1
+                await self._serve_http1(head, reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _make_body(self, payload: bytes) -> bytes:
+        self.stats.requests += 1
+        course = json.loads(payload or b"{}")
+        course["id"] = str(self.stats.requests)
+        return json.dumps({"course": course}).encode()
+
+    async def _serve_http1(
+        self, head: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        buffer = head
+        while True:
+            while b"\r\n\r\n" not in buffer:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    return
+                buffer += chunk
+
+            raw_headers, buffer = buffer.split(b"\r\n\r\n", 1)
+            content_length = 0
+            for line in raw_headers.split(b"\r\n")[1:]:
+                name, _, value = line.partition(b":")
+                if name.strip().lower() == b"content-length":
+                    content_length = int(value)
+
+            while len(buffer) < content_length:
+                buffer += await reader.readexactly(content_length - len(buffer))
+            payload, buffer = buffer[:content_length], buffer[content_length:]
+
+            await asyncio.sleep(self.delay)
+            body = self._make_body(payload)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: application/json\r\n"
+                b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+            )
+            await writer.drain()
+
+    async def _serve_http2(
+        self, head: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        connection = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False)
+        )
+        connection.initiate_connection()
+        payloads: dict[int, bytes] = {}
+        responses: set[asyncio.Task] = set()
+
+        async def respond(stream_id: int, payload: bytes) -> None:
+            await asyncio.sleep(self.delay)
+            body = self._make_body(payload)
+            connection.send_headers(
+                stream_id,
+                [
+                    (":status", "200"),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(body))),
+                ],
+            )
+            connection.send_data(stream_id, body, end_stream=True)
+            writer.write(connection.data_to_send())
+
+        data = head
+        while data:
+            for event in connection.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    payloads[event.stream_id] = b""
+                elif isinstance(event, h2.events.DataReceived):
+                    payloads[event.stream_id] += event.data
+                    connection.acknowledge_received_data(
+                        event.flow_controlled_length, event.stream_id
+                    )
+                elif isinstance(event, h2.events.StreamEnded):
+                    task = asyncio.create_task(
+                        respond(event.stream_id, payloads.pop(event.stream_id))
+                    )
+                    responses.add(task)
+                    task.add_done_callback(responses.discard)
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+
+            writer.write(connection.data_to_send())
+            await writer.drain()
+            data = await reader.read(65536)
+
+
+async def run_scenario(
+    base_url: str, http2: bool, requests: int, concurrency: int
+) -> dict[str, Any]:
+    """
+    Отправляет запросы на создание курсов с ограничением конкурентности.
+
+    Args:
+        base_url (str): Адрес сервера-заглушки.
+        http2 (bool): Использовать HTTP/2 (h2c) вместо HTTP/1.1.
+        requests (int): Общее количество запросов.
+        concurrency (int): Количество одновременно выполняемых запросов.
+
+    Returns:
+        dict[str, Any]: Время выполнения, пропускная способность и задержки.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    payloads = [
+        CreateCourseRequestSchema().model_dump(by_alias=True) for _ in range(requests)
+    ]
+    latencies: list[float] = []
+
+    client = AsyncClient(
+        base_url=base_url,
+        http1=not http2,
+        http2=http2,
+        limits=Limits(max_connections=concurrency),
+    )
+    async with AsyncApiClient(client) as api_client:
+
+        async def create_course(payload: dict[str, Any]) -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                response = await api_client.post(
+                    APIRoutes.COURSES.base_url, json=payload
+                )
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(create_course(payload) for payload in payloads))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "elapsed_s": round(elapsed, 3),
+        "requests_per_s": round(requests / elapsed, 1),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 2),
+    }
+
+
+async def main(requests: int, concurrency: int, delay: float) -> None:
+    server = StubCoursesServer(delay=delay)
+    await server.start()
+
+    try:
+        for protocol, http2 in (("HTTP/1.1", False), ("HTTP/2", True)):
+            opened_before = server.stats.connections[protocol]
+            result = await run_scenario(server.url, http2, requests, concurrency)
+            result["connections_opened"] = (
+                server.stats.connections[protocol] - opened_before
+            )
+            print_dict(
+                result,
+                title=protocol,
+                message=f"{requests} запросов, конкурентность {concurrency}, "
+                f"задержка сервера {delay * 1000:.0f} мс",
+            )
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--delay", type=float, default=0.02)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests, args.concurrency, args.delay))
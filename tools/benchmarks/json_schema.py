@@ -0,0 +1,122 @@
+"""
+Стоимость одной проверки JSON-схемы до и после кеширования валидаторов.
+
+Сценарий "before" повторяет прежний вызов из тестов: model_json_schema()
+и jsonschema.validate на каждую проверку. Сценарий "after" использует
+валидатор из get_schema_validator. Проверяется ответ на запрос списка
+курсов (GetCoursesResponseSchema) с заданным количеством курсов.
+
+Запуск:
+    python -m tools.benchmarks.json_schema --validations 500 --courses 1
+"""
+
+import argparse
+import time
+from typing import Any, Callable
+
+from jsonschema import validate
+from jsonschema.validators import Draft202012Validator
+
+from clients.courses.courses_schema import GetCoursesResponseSchema
+from tools.assertions.schema import get_schema_validator
+from tools.console_output_formatter import print_dict
+from tools.fakers import fake
+
+
+def build_payload(courses: int) -> dict[str, Any]:
+    """
+    Формирует ответ на запрос списка курсов в том виде, в каком его возвращает сервер.
+    """
+    return {
+        "courses": [
+            {
+                "id": fake.uuid4(),
+                "title": fake.sentence(),
+                "maxScore": fake.max_score(),
+                "minScore": fake.min_score(),
+                "description": fake.text(),
+                "estimatedTime": fake.estimated_time(),
+                "previewFile": {
+                    "id": fake.uuid4(),
+                    "url": f"http://localhost:8001/static/tests/{fake.uuid4()}.jpg",
+                    "filename": f"{fake.uuid4()}.jpg",
+                    "directory": "tests",
+                },
+                "createdByUser": {
+                    "id": fake.uuid4(),
+                    "email": fake.email(),
+                    "lastName": fake.last_name(),
+                    "firstName": fake.first_name(),
+                    "middleName": fake.middle_name(),
+                },
+            }
+            for _ in range(courses)
+        ]
+    }
+
+
+def validate_before(instance: Any) -> None:
+    validate(
+        schema=GetCoursesResponseSchema.model_json_schema(),
+        instance=instance,
+        format_checker=Draft202012Validator.FORMAT_CHECKER,
+    )
+
+
+def validate_after(instance: Any) -> None:
+    for error in get_schema_validator(GetCoursesResponseSchema).iter_errors(instance):
+        raise error
+
+
+def run_scenario(
+    validations: int, instance: Any, check: Callable[[Any], None]
+) -> dict[str, float]:
+    """
+    Выполняет проверку validations раз и возвращает общее время и время одной проверки.
+    """
+    started = time.perf_counter()
+    for _ in range(validations):
+        check(instance)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "total_ms": round(elapsed * 1000, 1),
+        "per_validation_us": round(elapsed / validations * 1_000_000, 2),
+    }
+
+
+def main(validations: int, courses: int) -> None:
+    instance = build_payload(courses)
+    # Прогрев: первая проверка "after" включает построение валидатора.
+    validate_after(instance)
+
+    results = {
+        "before": run_scenario(validations, instance, validate_before),
+        "after": run_scenario(validations, instance, validate_after),
+    }
+    for scenario, result in results.items():
+        print_dict(
+            result,
+            title=scenario,
+            message=f"{validations} проверок, курсов в ответе: {courses}",
+        )
+
+    print_dict(
+        {
+            "speedup": round(
+                results["before"]["per_validation_us"]
+                / results["after"]["per_validation_us"],
+                1,
+            )
+        },
+        title="before / after",
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--validations", type=int, default=500)
+    parser.add_argument("--courses", type=int, default=1)
+    args = parser.parse_args()
+
+    main(args.validations, args.courses)
@@ -0,0 +1,129 @@
+"""
+Сравнение синхронного логирования и очереди логов tools.logger.
+
+Каждая итерация цикла имитирует один запрос теста: две записи логгера
+HTTP_CLIENT (запрос и ответ) и три записи логгера проверок. Замеряется
+время самого цикла (то, что платит код теста) и полное время до записи
+всех строк в файл.
+
+Запуск:
+    python -m tools.benchmarks.logger_pipeline --requests 10000
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from tools.console_output_formatter import print_dict
+from tools.logger import LOG_FORMAT, LoggingPipeline
+
+
+def create_sync_loggers(
+    scenario: str, stream: Any
+) -> tuple[logging.Logger, logging.Logger, Callable[[], None]]:
+    """
+    Создаёт логгеры так же, как их создавал прежний get_logger:
+    StreamHandler форматирует и пишет запись в потоке вызова.
+    """
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    loggers = []
+    for name in ("HTTP_CLIENT", "COURSES_ASSERTIONS"):
+        logger = logging.getLogger(f"BENCHMARK_{scenario}_{name}")
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        logger.addHandler(handler)
+        loggers.append(logger)
+
+    return loggers[0], loggers[1], handler.flush
+
+
+def create_pipeline_loggers(
+    scenario: str, stream: Any, sampling: int | None
+) -> tuple[logging.Logger, logging.Logger, Callable[[], None]]:
+    """
+    Создаёт логгеры, подключённые к отдельной очереди LoggingPipeline.
+    Для HTTP_CLIENT применяется шаг выборки sampling.
+    """
+    pipeline = LoggingPipeline(stream=stream)
+
+    loggers = []
+    for name in ("HTTP_CLIENT", "COURSES_ASSERTIONS"):
+        logger = logging.getLogger(f"BENCHMARK_{scenario}_{name}")
+        logger.propagate = False
+        pipeline.attach(
+            logger,
+            level=logging.DEBUG,
+            sampling=sampling if name == "HTTP_CLIENT" else None,
+        )
+        loggers.append(logger)
+
+    return loggers[0], loggers[1], pipeline.stop
+
+
+def run_scenario(
+    requests: int,
+    http_logger: logging.Logger,
+    assertions_logger: logging.Logger,
+    flush: Callable[[], None],
+) -> dict[str, float]:
+    """
+    Выполняет цикл запросов и возвращает время цикла и время до сброса логов.
+    """
+    started = time.perf_counter()
+    for index in range(requests):
+        http_logger.info(f"Отправляем запрос: POST на /api/v1/courses/{index}")
+        http_logger.info(f"Получаем ответ: 200 OK от /api/v1/courses/{index}")
+        for field in ("id", "title", "max_score"):
+            assertions_logger.info(f'Проверяем, что "{field}" равно {index}')
+    loop_elapsed = time.perf_counter() - started
+
+    flush()
+    total_elapsed = time.perf_counter() - started
+
+    return {
+        "loop_ms": round(loop_elapsed * 1000, 1),
+        "per_request_us": round(loop_elapsed / requests * 1_000_000, 2),
+        "total_ms": round(total_elapsed * 1000, 1),
+    }
+
+
+def main(requests: int) -> None:
+    scenarios = {
+        "sync_stream_handler": lambda name, stream: create_sync_loggers(name, stream),
+        "queue_pipeline": lambda name, stream: create_pipeline_loggers(
+            name, stream, None
+        ),
+        "queue_pipeline_http_sampled_1_in_10": lambda name, stream: (
+            create_pipeline_loggers(name, stream, 10)
+        ),
+        "queue_pipeline_http_off": lambda name, stream: create_pipeline_loggers(
+            name, stream, 0
+        ),
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        for scenario, create_loggers in scenarios.items():
+            log_path = Path(directory, f"{scenario}.log")
+            with log_path.open("w", encoding="utf-8") as stream:
+                http_logger, assertions_logger, flush = create_loggers(
+                    scenario, stream
+                )
+                result = run_scenario(requests, http_logger, assertions_logger, flush)
+
+            with log_path.open(encoding="utf-8") as stream:
+                result["lines_written"] = sum(1 for _ in stream)
+
+            print_dict(result, title=scenario, message=f"{requests} запросов")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=10_000)
+    args = parser.parse_args()
+
+    main(args.requests)
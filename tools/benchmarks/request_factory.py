@@ -0,0 +1,93 @@
+"""
+Сравнение способов создания запросов на создание сущностей.
+
+Для каждой схемы замеряется время создания count запросов:
+  - default_factory: конструктор схемы без аргументов, Faker на каждое поле;
+  - batch_validated: build_requests(validate=True), пулы значений и model_validate;
+  - batch_construct: пулы значений и BaseModel.model_construct;
+  - batch_unchecked: build_requests(), пулы значений без валидации.
+
+Время default_factory замеряется на части запросов и пересчитывается на count.
+
+Запуск:
+    python -m tools.benchmarks.request_factory --count 100000
+"""
+
+import argparse
+import time
+from typing import Callable
+
+from pydantic import BaseModel
+
+from clients.courses.courses_schema import CreateCourseRequestSchema
+from clients.exercises.exercises_schema import CreateExerciseRequestSchema
+from clients.users.users_schema import CreateUserRequestSchema
+from tools.console_output_formatter import print_dict
+from tools.request_factory import COLUMNS, build_requests, column_pools
+
+SCHEMAS = {
+    "users": CreateUserRequestSchema,
+    "courses": CreateCourseRequestSchema,
+    "exercises": CreateExerciseRequestSchema,
+}
+
+# Максимум запросов для default_factory: 100 000 заняли бы десятки секунд.
+DEFAULT_FACTORY_LIMIT = 5000
+
+
+def build_constructed(schema: type[BaseModel], count: int) -> list[BaseModel]:
+    columns = {
+        name: generate(column_pools, count)
+        for name, generate in COLUMNS[schema].items()
+    }
+    names = list(columns)
+    return [
+        schema.model_construct(**dict(zip(names, row)))
+        for row in zip(*columns.values())
+    ]
+
+
+def measure(build: Callable[[int], list], count: int) -> float:
+    """
+    Возвращает время создания count запросов в секундах.
+    """
+    started = time.perf_counter()
+    build(count)
+    return round(time.perf_counter() - started, 3)
+
+
+def main(count: int) -> None:
+    # Пулы заполняются один раз на процесс, их заполнение замеряется отдельно.
+    started = time.perf_counter()
+    for schema in SCHEMAS.values():
+        build_requests(schema, 1)
+    pools_time = round(time.perf_counter() - started, 3)
+
+    for resource, schema in SCHEMAS.items():
+        sample = min(count, DEFAULT_FACTORY_LIMIT)
+        default_factory = measure(lambda size: [schema() for _ in range(size)], sample)
+        result = {
+            "default_factory": round(default_factory * count / sample, 3),
+            "batch_validated": measure(
+                lambda size: build_requests(schema, size, validate=True), count
+            ),
+            "batch_construct": measure(
+                lambda size: build_constructed(schema, size), count
+            ),
+            "batch_unchecked": measure(
+                lambda size: build_requests(schema, size), count
+            ),
+        }
+        print_dict(
+            result,
+            title=f"{resource}: {count} запросов",
+            message=f"секунд на пачку, заполнение пулов {pools_time} с",
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    main(args.count)
@@ -0,0 +1,147 @@
+"""
+Сравнение способов разбора ответов списка курсов и упражнений в модели.
+
+Для каждого размера списка замеряется время одного разбора:
+  - lax_validate_json_text: прежний путь, model_validate_json(response.text);
+  - lax_json_loads: json.loads(response.content) и model_validate (ApiResponse);
+  - strict_validate_json: model_validate_json(response.content, strict=True);
+  - strict_new_adapter: TypeAdapter, создаваемый на каждый разбор;
+  - strict_cached_adapter: закешированный TypeAdapter (PARSING.STRICT=true);
+  - strict_list_adapter: адаптер списка элементов, без обёртки ответа.
+
+Запуск:
+    python -m tools.benchmarks.response_parsing --sizes 10 100 1000 10000
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable
+
+from pydantic import BaseModel, TypeAdapter
+
+from clients.courses.courses_schema import CourseSchema, GetCoursesResponseSchema
+from clients.exercises.exercises_schema import (
+    ExerciseSchema,
+    GetExercisesResponseSchema,
+)
+from tools.benchmarks.json_schema import build_payload
+from tools.console_output_formatter import print_dict
+from tools.fakers import fake
+from tools.type_adapters import get_type_adapter, validate_json
+
+# Количество уникальных сгенерированных элементов: остальные копируются
+# с новым id, чтобы генерация 10 000 элементов не занимала минуты.
+UNIQUE_ITEMS = 100
+
+
+def build_exercise(course_id: str) -> dict[str, Any]:
+    return {
+        "id": fake.uuid4(),
+        "title": fake.sentence(),
+        "courseId": course_id,
+        "maxScore": fake.max_score(),
+        "minScore": fake.min_score(),
+        "orderIndex": fake.integer(0, 100),
+        "description": fake.text(),
+        "estimatedTime": fake.estimated_time(),
+    }
+
+
+def build_items(resource: str, size: int) -> list[dict[str, Any]]:
+    """
+    Формирует список из size элементов ответа в том виде, в каком его
+    возвращает сервер.
+    """
+    if resource == "courses":
+        unique = build_payload(min(size, UNIQUE_ITEMS))["courses"]
+    else:
+        course_id = fake.uuid4()
+        unique = [build_exercise(course_id) for _ in range(min(size, UNIQUE_ITEMS))]
+
+    return [
+        {**unique[index % len(unique)], "id": fake.uuid4()} for index in range(size)
+    ]
+
+
+def get_scenarios(
+    model_class: type[BaseModel], list_adapter: TypeAdapter
+) -> dict[str, Callable[[bytes, bytes], Any]]:
+    return {
+        "lax_validate_json_text": lambda content, _: model_class.model_validate_json(
+            content.decode()
+        ),
+        "lax_json_loads": lambda content, _: model_class.model_validate(
+            json.loads(content)
+        ),
+        "strict_validate_json": lambda content, _: model_class.model_validate_json(
+            content, strict=True
+        ),
+        "strict_new_adapter": lambda content, _: TypeAdapter(model_class).validate_json(
+            content, strict=True
+        ),
+        "strict_cached_adapter": lambda content, _: validate_json(
+            content, model_class, strict=True
+        ),
+        "strict_list_adapter": lambda _, items: list_adapter.validate_json(
+            items, strict=True
+        ),
+    }
+
+
+def run_scenario(
+    parse: Callable[[bytes, bytes], Any], content: bytes, items: bytes, repeats: int
+) -> float:
+    """
+    Выполняет разбор repeats раз и возвращает время одного разбора в микросекундах.
+    """
+    parse(content, items)
+    started = time.perf_counter()
+    for _ in range(repeats):
+        parse(content, items)
+
+    return round((time.perf_counter() - started) / repeats * 1_000_000, 1)
+
+
+def main(resource: str, sizes: list[int], budget: int) -> None:
+    model_class, list_adapter = {
+        "courses": (GetCoursesResponseSchema, get_type_adapter(list[CourseSchema])),
+        "exercises": (
+            GetExercisesResponseSchema,
+            get_type_adapter(list[ExerciseSchema]),
+        ),
+    }[resource]
+    scenarios = get_scenarios(model_class, list_adapter)
+
+    for size in sizes:
+        items = build_items(resource, size)
+        content = json.dumps({resource: items}).encode()
+        items_content = json.dumps(items).encode()
+        repeats = max(3, budget // size)
+
+        result = {
+            scenario: run_scenario(parse, content, items_content, repeats)
+            for scenario, parse in scenarios.items()
+        }
+        print_dict(
+            result,
+            title=f"{resource}: {size} элементов",
+            message=f"мкс на разбор, {repeats} повторов, {len(content)} байт",
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--resource", choices=("courses", "exercises"), default="courses"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=20_000,
+        help="Количество разбираемых элементов на сценарий и размер",
+    )
+    args = parser.parse_args()
+
+    main(args.resource, args.sizes, args.budget)
@@ -0,0 +1,142 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class ClosingLRUCache(Generic[K, V]):
+    """
+    Ограниченный LRU-кеш с TTL, закрывающий вытесненные значения.
+
+    TTL отсчитывается от последнего обращения к записи, поэтому значение,
+    которым активно пользуются, не вытесняется посреди теста. При вытеснении
+    (по размеру, по TTL или при очистке) для значения вызывается on_evict.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float | None,
+        on_evict: Callable[[V], Any],
+    ):
+        """
+        Args:
+            max_size (int): Максимальное количество записей в кеше.
+            ttl (float | None): Время жизни записи без обращений, в секундах.
+                None отключает вытеснение по времени.
+            on_evict (Callable[[V], Any]): Функция освобождения вытесненного значения.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.on_evict = on_evict
+
+        self._lock = threading.Lock()
+        self._items: OrderedDict[K, tuple[V, float]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get_or_create(self, key: K, factory: Callable[[], V]) -> V:
+        """
+        Возвращает значение из кеша или создаёт его с помощью factory.
+
+        Args:
+            key (K): Ключ записи.
+            factory (Callable[[], V]): Функция создания значения при промахе.
+
+        Returns:
+            V: Закешированное или только что созданное значение.
+        """
+        with self._lock:
+            evicted = self._pop_expired(time.monotonic())
+            value = self._touch(key)
+            if value is None:
+                self.misses += 1
+        self._release(evicted)
+
+        if value is not None:
+            return value
+
+        created = factory()
+
+        with self._lock:
+            value = self._touch(key)
+            if value is None:
+                self._items[key] = (created, time.monotonic())
+                evicted = self._pop_overflow()
+            else:
+                evicted = [created]
+        self._release(evicted)
+
+        return created if value is None else value
+
+    def clear(self) -> int:
+        """
+        Закрывает и удаляет все значения кеша.
+
+        Returns:
+            int: Количество закрытых значений.
+        """
+        with self._lock:
+            evicted = [value for value, _ in self._items.values()]
+            self._items.clear()
+        self._release(evicted)
+        return len(evicted)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Возвращает счётчики попаданий, промахов и вытеснений.
+        """
+        return {
+            "size": len(self._items),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _touch(self, key: K) -> V | None:
+        if key not in self._items:
+            return None
+
+        value, _ = self._items[key]
+        self._items[key] = (value, time.monotonic())
+        self._items.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def _pop_expired(self, now: float) -> list[V]:
+        evicted = []
+        if self.ttl is None:
+            return evicted
+
+        while self._items:
+            key, (value, last_access) = next(iter(self._items.items()))
+            if now - last_access < self.ttl:
+                break
+            del self._items[key]
+            evicted.append(value)
+
+        self.evictions += len(evicted)
+        return evicted
+
+    def _pop_overflow(self) -> list[V]:
+        evicted = []
+        while len(self._items) > self.max_size:
+            _, (value, _) = self._items.popitem(last=False)
+            evicted.append(value)
+
+        self.evictions += len(evicted)
+        return evicted
+
+    def _release(self, values: list[V]) -> None:
+        for value in values:
+            self.on_evict(value)
@@ -0,0 +1,263 @@
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from http import HTTPStatus
+from typing import Any, Callable, Iterator, Literal
+
+from httpx import TransportError
+
+from config import settings
+from tools.fan_out import fan_out
+from tools.logger import get_logger
+
+
+logger = get_logger("CLEANUP")
+
+# Порядок удаления: сначала зависимые сущности, затем те, от которых они зависят.
+DELETION_ORDER = ("exercises", "courses", "files", "users")
+
+# Статусы, при которых сущность считается удалённой. 404 — сущность уже
+# удалена тестом или вместе с родительской сущностью.
+DELETED_STATUSES = {HTTPStatus.OK, HTTPStatus.NO_CONTENT}
+MISSING_STATUSES = {HTTPStatus.NOT_FOUND}
+
+# Пользователь удаляется от своего имени: если войти под ним нельзя,
+# он уже удалён или его данные для входа изменены вне ApiClient.
+USER_MISSING_STATUSES = {HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN}
+
+_keep_until_session_end: ContextVar[bool] = ContextVar(
+    "keep_until_session_end", default=False
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CreatedEntity:
+    """
+    Сущность, созданная POST-запросом доменного клиента.
+
+    Attrs:
+        kind (str): Тип сущности ("users", "files", "courses", "exercises").
+        entity_id (str): Идентификатор сущности.
+        owner (Any): Данные пользователя, от имени которого сущность удаляется.
+    """
+
+    kind: str
+    entity_id: str
+    owner: Any
+
+
+class CleanupRegistry:
+    """
+    Реестр созданных тестовых данных с пакетным удалением.
+
+    Сущности удаляются по типам в порядке DELETION_ORDER, внутри типа —
+    параллельно в ограниченном пуле потоков. Запрос повторяется только при
+    ошибках соединения и ответах 5xx.
+    Сущности, созданные внутри keep_until_session_end (например, пулами
+    сущностей), при очистке после теста не удаляются.
+    """
+
+    def __init__(self, enabled: bool, workers: int, retries: int, retry_delay: float):
+        """
+        Args:
+            enabled (bool): Записывать ли созданные сущности.
+            workers (int): Количество потоков удаления.
+            retries (int): Количество повторов удаления одной сущности.
+            retry_delay (float): Базовая пауза между повторами, в секундах.
+        """
+        self.enabled = enabled
+        self.workers = workers
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self._lock = threading.Lock()
+        self._deleters: dict[str, Callable[[Any, str], Any]] = {}
+        self._entities: dict[str, list[CreatedEntity]] = {"test": [], "session": []}
+
+    def __len__(self) -> int:
+        return sum(len(entities) for entities in self._entities.values())
+
+    def register_deleter(self, kind: str, deleter: Callable[[Any, str], Any]) -> None:
+        """
+        Регистрирует функцию удаления сущностей типа kind.
+
+        Args:
+            kind (str): Тип сущности.
+            deleter (Callable[[Any, str], Any]): Функция (owner, entity_id),
+                выполняющая DELETE-запрос и возвращающая ответ со status_code.
+        """
+        self._deleters[kind] = deleter
+
+    def register(self, kind: str, entity_id: str, owner: Any) -> None:
+        """
+        Записывает созданную сущность.
+
+        Args:
+            kind (str): Тип сущности.
+            entity_id (str): Идентификатор сущности.
+            owner (Any): Данные пользователя, от имени которого сущность удаляется.
+        """
+        if not self.enabled:
+            return
+
+        scope = "session" if _keep_until_session_end.get() else "test"
+        with self._lock:
+            self._entities[scope].append(CreatedEntity(kind, entity_id, owner))
+
+    def unregister(self, kind: str, entity_id: str) -> None:
+        """
+        Исключает сущность из удаления, например после её удаления тестом.
+
+        Args:
+            kind (str): Тип сущности.
+            entity_id (str): Идентификатор сущности.
+        """
+        with self._lock:
+            for scope, entities in self._entities.items():
+                self._entities[scope] = [
+                    entity
+                    for entity in entities
+                    if entity.kind != kind or entity.entity_id != entity_id
+                ]
+
+    def get_owner(self, kind: str, entity_id: str) -> Any | None:
+        """
+        Возвращает данные пользователя, от имени которого удаляется сущность.
+
+        Args:
+            kind (str): Тип сущности.
+            entity_id (str): Идентификатор сущности.
+
+        Returns:
+            Any | None: Данные пользователя или None, если сущность не записана.
+        """
+        with self._lock:
+            for entities in self._entities.values():
+                for entity in entities:
+                    if entity.kind == kind and entity.entity_id == entity_id:
+                        return entity.owner
+        return None
+
+    def replace_owner(self, owner: Any, new_owner: Any) -> None:
+        """
+        Заменяет данные пользователя у всех записанных сущностей, например
+        после изменения email пользователя.
+
+        Args:
+            owner (Any): Прежние данные пользователя.
+            new_owner (Any): Новые данные пользователя.
+        """
+        with self._lock:
+            for scope, entities in self._entities.items():
+                self._entities[scope] = [
+                    (
+                        replace(entity, owner=new_owner)
+                        if entity.owner == owner
+                        else entity
+                    )
+                    for entity in entities
+                ]
+
+    @contextmanager
+    def keep_until_session_end(self) -> Iterator[None]:
+        """
+        Сущности, созданные внутри блока, удаляются только в конце сессии.
+        """
+        token = _keep_until_session_end.set(True)
+        try:
+            yield
+        finally:
+            _keep_until_session_end.reset(token)
+
+    def cleanup(self, scope: Literal["test", "session"]) -> dict[str, Any]:
+        """
+        Удаляет записанные сущности в порядке зависимостей.
+
+        Args:
+            scope (Literal["test", "session"]): test — сущности, созданные
+                в тесте; session — все записанные сущности.
+
+        Returns:
+            dict[str, Any]: Отчёт: количество удалённых, уже отсутствующих и
+                неудалённых сущностей по типам, скорость удаления и оставшиеся
+                сущности с последней ошибкой.
+        """
+        with self._lock:
+            entities = self._entities["test"]
+            self._entities["test"] = []
+            if scope == "session":
+                entities += self._entities["session"]
+                self._entities["session"] = []
+
+        kinds = {
+            kind: {"deleted": 0, "missing": 0, "failed": 0} for kind in DELETION_ORDER
+        }
+        leftovers = []
+        started = time.perf_counter()
+        for kind in DELETION_ORDER:
+            batch = [entity for entity in entities if entity.kind == kind]
+            for entity, (outcome, error) in zip(
+                batch, fan_out(self._delete, batch, self.workers)
+            ):
+                kinds[kind][outcome] += 1
+                if outcome == "failed":
+                    leftovers.append(
+                        {"kind": kind, "id": entity.entity_id, "error": error}
+                    )
+
+        duration = time.perf_counter() - started
+        removed = sum(
+            counters["deleted"] + counters["missing"] for counters in kinds.values()
+        )
+        return {
+            "scope": scope,
+            "entities": len(entities),
+            "duration": round(duration, 3),
+            "deletions_per_second": round(removed / duration, 1) if duration else 0,
+            "kinds": {
+                kind: counters
+                for kind, counters in kinds.items()
+                if any(counters.values())
+            },
+            "leftovers": leftovers,
+        }
+
+    def _delete(self, entity: CreatedEntity) -> tuple[str, str | None]:
+        deleter = self._deleters.get(entity.kind)
+        if deleter is None:
+            return "failed", f"Не зарегистрирована функция удаления {entity.kind}"
+
+        error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.retry_delay * attempt)
+            try:
+                status = deleter(entity.owner, entity.entity_id).status_code
+            except TransportError as exception:
+                error = repr(exception)
+                continue
+            except Exception as exception:
+                error = repr(exception)
+                break
+
+            if status in DELETED_STATUSES:
+                return "deleted", None
+            if status in MISSING_STATUSES or (
+                entity.kind == "users" and status in USER_MISSING_STATUSES
+            ):
+                return "missing", None
+            error = f"HTTP {status}"
+            if status < HTTPStatus.INTERNAL_SERVER_ERROR:
+                break
+
+        logger.warning(f"Не удалось удалить {entity.kind} {entity.entity_id}: {error}")
+        return "failed", error
+
+
+cleanup_registry = CleanupRegistry(
+    enabled=settings.CLEANUP.ENABLED,
+    workers=settings.CLEANUP.WORKERS,
+    retries=settings.CLEANUP.RETRIES,
+    retry_delay=settings.CLEANUP.RETRY_DELAY,
+)
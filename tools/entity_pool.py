@@ -0,0 +1,222 @@
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Generic, Iterator, TypeVar
+
+from tools.logger import get_logger
+from tools.recording import not_recorded
+
+
+logger = get_logger("ENTITY_POOL")
+
+T = TypeVar("T")
+
+
+class EntityPool(Generic[T]):
+    """
+    Пул тестовых сущностей одного типа, выдаваемых тестам во временное пользование.
+
+    Пул создаётся один раз на процесс (xdist-воркер) и хранит:
+      - общую сущность: создаётся один раз и выдаётся всем тестам, которые её
+        не изменяют, а также используется как родитель сущностей других пулов;
+      - до size свободных сущностей для монопольной выдачи тестам, которые
+        изменяют или удаляют сущность.
+
+    После теста монопольная сущность перечитывается функцией refresh и
+    возвращается в пул. Если refresh не задан или вернул None (например,
+    сущность удалена тестом), сущность в пул не возвращается. При refill
+    недостающие до size свободные сущности после этого создаются в фоновом
+    потоке, пока выполняются следующие тесты, вне записи запросов теста
+    (tools.recording.not_recorded).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[], T],
+        size: int,
+        refill: bool,
+        shareable: bool,
+        refresh: Callable[[T], T | None] | None = None,
+    ):
+        """
+        Args:
+            name (str): Название пула для логов и сводки.
+            factory (Callable[[], T]): Функция создания новой сущности.
+            size (int): Количество свободных сущностей для монопольной выдачи.
+            refill (bool): Досоздавать ли свободные сущности в фоне после возврата.
+            shareable (bool): Выдавать ли тестам без изменений общую сущность.
+                False — каждый тест получает сущность монопольно.
+            refresh (Callable[[T], T | None] | None): Функция, перечитывающая
+                сущность после монопольного использования. None — сущность
+                после теста не переиспользуется.
+        """
+        self.name = name
+        self.factory = factory
+        self.size = size
+        self.refill = refill
+        self.shareable = shareable
+        self.refresh = refresh
+
+        self._lock = threading.Lock()
+        self._shared_lock = threading.Lock()
+        self._shared: T | None = None
+        self._free: deque[T] = deque()
+        self._pending = 0
+        self._executor: ThreadPoolExecutor | None = None
+
+        self.created = 0
+        self.shared_leases = 0
+        self.exclusive_leases = 0
+        self.returned = 0
+        self.discarded = 0
+
+    def get_shared(self) -> T:
+        """
+        Возвращает общую сущность пула, создавая её при первом обращении.
+
+        Общая сущность доступна независимо от shareable: её используют
+        фабрики других пулов как родителя (например, автора курса).
+
+        Returns:
+            T: Общая сущность.
+        """
+        if self._shared is None:
+            with self._shared_lock:
+                if self._shared is None:
+                    self._shared = self._create()
+
+        return self._shared
+
+    @contextmanager
+    def lease(self, exclusive: bool = False) -> Iterator[T]:
+        """
+        Выдаёт сущность на время блока with.
+
+        Args:
+            exclusive (bool): Нужна ли сущность монопольно (тест её изменяет
+                или удаляет). Для пулов без shareable выдача всегда монопольная.
+
+        Yields:
+            T: Общая или монопольная сущность.
+        """
+        if not exclusive and self.shareable:
+            with self._lock:
+                self.shared_leases += 1
+            yield self.get_shared()
+            return
+
+        with self._lock:
+            entity = self._free.popleft() if self._free else None
+            self.exclusive_leases += 1
+        if entity is None:
+            entity = self._create()
+
+        try:
+            yield entity
+        finally:
+            self._return(entity)
+
+    def fill(self) -> None:
+        """
+        Создаёт общую сущность и недостающие свободные сущности параллельно.
+        Используется для заполнения пула в начале сессии.
+        """
+        self.get_shared()
+
+        with self._lock:
+            missing = max(self.size - len(self._free) - self._pending, 0)
+        if not missing:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=missing, thread_name_prefix=f"{self.name}-fill"
+        ) as executor:
+            entities = list(executor.map(lambda _: self._create(), range(missing)))
+
+        with self._lock:
+            self._free.extend(entities)
+
+    def close(self) -> None:
+        """
+        Дожидается фонового досоздания сущностей и останавливает поток пула.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Возвращает счётчики созданных, выданных, возвращённых и отброшенных сущностей.
+        """
+        return {
+            "free": len(self._free),
+            "size": self.size,
+            "created": self.created,
+            "shared_leases": self.shared_leases,
+            "exclusive_leases": self.exclusive_leases,
+            "returned": self.returned,
+            "discarded": self.discarded,
+        }
+
+    def _create(self) -> T:
+        entity = self.factory()
+        with self._lock:
+            self.created += 1
+        return entity
+
+    def _return(self, entity: T) -> None:
+        refreshed = None
+        if self.refresh is not None:
+            try:
+                refreshed = self.refresh(entity)
+            except Exception as error:
+                logger.warning(
+                    f"Не удалось перечитать сущность пула {self.name}: {error}"
+                )
+
+        with self._lock:
+            if refreshed is not None and len(self._free) < self.size:
+                self._free.append(refreshed)
+                self.returned += 1
+            else:
+                self.discarded += 1
+
+        self._schedule_refill()
+
+    def _schedule_refill(self) -> None:
+        if not self.refill:
+            return
+
+        with self._lock:
+            missing = max(self.size - len(self._free) - self._pending, 0)
+            if not missing:
+                return
+
+            self._pending += missing
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix=f"{self.name}-refill"
+                )
+            executor = self._executor
+
+        for _ in range(missing):
+            executor.submit(self._refill_one)
+
+    def _refill_one(self) -> None:
+        # Досоздание идёт параллельно с тестами и не относится ни к одному
+        # из них: его запросы не попадают в отчёт и статистику теста.
+        try:
+            with not_recorded():
+                entity = self._create()
+        except Exception as error:
+            logger.warning(f"Не удалось досоздать сущность пула {self.name}: {error}")
+            with self._lock:
+                self._pending -= 1
+            return
+
+        with self._lock:
+            self._pending -= 1
+            self._free.append(entity)
@@ -0,0 +1,115 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Iterable, Literal, TypeVar
+
+from config import settings
+
+A = TypeVar("A")
+R = TypeVar("R")
+
+
+def fan_out(func: Callable[[A], R], items: Iterable[A], workers: int) -> list[R]:
+    """
+    Функция вызывает func для каждого элемента в пуле потоков.
+
+    Подходит для синхронных клиентов: httpx.Client потокобезопасен, а все
+    клиенты воркера используют общий пул соединений. Порядок результатов
+    совпадает с порядком items; первое исключение пробрасывается вызывающему.
+
+    Args:
+        func (Callable[[A], R]): Функция, выполняемая для каждого элемента.
+        items (Iterable[A]): Элементы (например, запросы на создание сущностей).
+        workers (int): Количество потоков. При workers <= 1 вызовы выполняются
+            последовательно в текущем потоке.
+
+    Returns:
+        list[R]: Результаты в порядке items.
+    """
+    items = list(items)
+    if workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(
+        max_workers=min(workers, len(items)), thread_name_prefix="fan-out"
+    ) as executor:
+        return list(executor.map(func, items))
+
+
+def run_concurrently(*steps: Callable[[], Any], workers: int) -> tuple[Any, ...]:
+    """
+    Функция выполняет независимые шаги подготовки данных параллельно.
+
+    Args:
+        *steps (Callable[[], Any]): Шаги без аргументов (например, создание
+            пользователя и загрузка файла).
+        workers (int): Максимальное количество потоков.
+
+    Returns:
+        tuple[Any, ...]: Результаты шагов в порядке передачи.
+    """
+    return tuple(fan_out(lambda step: step(), steps, workers))
+
+
+async def async_fan_out(
+    func: Callable[[A], Awaitable[R]], items: Iterable[A], concurrency: int
+) -> list[R]:
+    """
+    Функция выполняет корутины func для каждого элемента с ограничением
+    количества одновременных вызовов.
+
+    Args:
+        func (Callable[[A], Awaitable[R]]): Асинхронная функция для элемента.
+        items (Iterable[A]): Элементы.
+        concurrency (int): Максимальное количество одновременных вызовов.
+
+    Returns:
+        list[R]: Результаты в порядке items.
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def call(item: A) -> R:
+        async with semaphore:
+            return await func(item)
+
+    return list(await asyncio.gather(*(call(item) for item in items)))
+
+
+def create_entities(
+    client: Any,
+    get_async_client: Callable[[], Awaitable[Any]],
+    method: str,
+    requests: Iterable[A],
+    mode: Literal["threads", "async"] | None = None,
+    workers: int | None = None,
+) -> list[Any]:
+    """
+    Функция создаёт сущности параллельно методом клиента с именем method.
+
+    В режиме threads метод синхронного клиента вызывается в пуле потоков.
+    В режиме async создаётся асинхронный клиент, запросы выполняются в новом
+    event loop, после чего клиент закрывается.
+
+    Args:
+        client (Any): Синхронный клиент (например, CoursesClient).
+        get_async_client (Callable[[], Awaitable[Any]]): Фабрика асинхронного
+            клиента с методом того же имени (например, get_async_courses_client).
+        method (str): Имя метода создания (например, "create_course").
+        requests (Iterable[A]): Запросы на создание.
+        mode (Literal["threads", "async"] | None): Режим. По умолчанию
+            settings.FIXTURE_SETUP.MODE.
+        workers (int | None): Количество потоков или одновременных запросов.
+            По умолчанию settings.FIXTURE_SETUP.WORKERS.
+
+    Returns:
+        list[Any]: Ответы метода в порядке requests.
+    """
+    mode = mode or settings.FIXTURE_SETUP.MODE
+    workers = workers or settings.FIXTURE_SETUP.WORKERS
+    if mode == "threads":
+        return fan_out(getattr(client, method), requests, workers)
+
+    async def create_all() -> list[Any]:
+        async with await get_async_client() as async_client:
+            return await async_fan_out(getattr(async_client, method), requests, workers)
+
+    return asyncio.run(create_all())
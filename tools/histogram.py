@@ -0,0 +1,144 @@
+import math
+from typing import Any, Self
+
+
+class LatencyHistogram:
+    """
+    Компактная гистограмма задержек с логарифмическими корзинами.
+
+    Значение v попадает в корзину ceil(log(v) / log(gamma)), где
+    gamma = (1 + accuracy) / (1 - accuracy), поэтому любой перцентиль
+    оценивается с относительной погрешностью не хуже accuracy. Хранятся
+    только непустые корзины, а две гистограммы с одинаковой точностью
+    объединяются сложением счётчиков, что позволяет сводить результаты
+    нескольких xdist-воркеров.
+
+    Attrs:
+        accuracy (float): Относительная погрешность оценки перцентилей.
+        count (int): Количество записанных значений.
+        total (float): Сумма записанных значений.
+        min (float | None): Минимальное записанное значение.
+        max (float | None): Максимальное записанное значение.
+        buckets (dict[int, int]): Количество значений в непустых корзинах.
+    """
+
+    MIN_VALUE = 1e-6
+
+    def __init__(self, accuracy: float = 0.01):
+        """
+        Args:
+            accuracy (float): Относительная погрешность оценки перцентилей.
+        """
+        self.accuracy = accuracy
+        self.count = 0
+        self.total = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+        self.buckets: dict[int, int] = {}
+
+        self._gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+    def record(self, value: float) -> None:
+        """
+        Записывает значение в гистограмму.
+
+        Args:
+            value (float): Значение задержки, в секундах.
+        """
+        index = math.ceil(math.log(max(value, self.MIN_VALUE)) / self._log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: Self) -> None:
+        """
+        Добавляет к гистограмме значения другой гистограммы.
+
+        Args:
+            other (LatencyHistogram): Гистограмма с той же точностью.
+
+        Raises:
+            ValueError: Если точность гистограмм отличается.
+        """
+        if other.accuracy != self.accuracy:
+            raise ValueError(
+                f"Нельзя объединить гистограммы с точностью {self.accuracy} "
+                f"и {other.accuracy}"
+            )
+
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def percentile(self, percent: float) -> float | None:
+        """
+        Оценивает перцентиль записанных значений.
+
+        Args:
+            percent (float): Перцентиль от 0 до 100.
+
+        Returns:
+            float | None: Оценка перцентиля или None, если значений нет.
+        """
+        if not self.count:
+            return None
+
+        rank = percent / 100 * (self.count - 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                value = 2 * self._gamma**index / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+
+        return self.max
+
+    @property
+    def mean(self) -> float | None:
+        """
+        Среднее записанных значений.
+        """
+        return self.total / self.count if self.count else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Возвращает гистограмму в виде словаря для сохранения в JSON.
+        """
+        return {
+            "accuracy": self.accuracy,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "buckets": {str(index): count for index, count in self.buckets.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """
+        Восстанавливает гистограмму из словаря, полученного через to_dict.
+
+        Args:
+            data (dict[str, Any]): Сохранённая гистограмма.
+
+        Returns:
+            LatencyHistogram: Восстановленная гистограмма.
+        """
+        histogram = cls(accuracy=data["accuracy"])
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.min = data["min"]
+        histogram.max = data["max"]
+        histogram.buckets = {
+            int(index): count for index, count in data["buckets"].items()
+        }
+        return histogram
@@ -0,0 +1,106 @@
+import threading
+from collections import deque
+
+import allure
+from httpx import Request, Response, ResponseNotRead
+
+from config import settings
+from tools.http.curl import make_curl_request
+
+
+class HTTPExchange:
+    """
+    Пара запрос/ответ, сохранённая для отложенного формирования вложений.
+
+    Attrs:
+        request (Request): Отправленный запрос.
+        response (Response | None): Ответ сервера, если он был получен.
+    """
+
+    __slots__ = ("request", "response")
+
+    def __init__(self, request: Request):
+        self.request = request
+        self.response: Response | None = None
+
+
+class HTTPExchangeBuffer:
+    """
+    Кольцевой буфер последних HTTP-обменов текущего теста.
+
+    Запросы и ответы сохраняются как есть, а cURL-команды и тексты ответов
+    формируются только при вызове attach, то есть для упавших тестов.
+    """
+
+    def __init__(self, max_size: int):
+        """
+        Args:
+            max_size (int): Количество последних обменов, которые хранит буфер.
+        """
+        self._lock = threading.Lock()
+        self._exchanges: deque[HTTPExchange] = deque(maxlen=max_size)
+
+    def add_request(self, request: Request) -> None:
+        with self._lock:
+            self._exchanges.append(HTTPExchange(request))
+
+    def add_response(self, response: Response) -> None:
+        with self._lock:
+            for exchange in reversed(self._exchanges):
+                if exchange.request is response.request:
+                    exchange.response = response
+                    return
+
+    def clear(self) -> None:
+        with self._lock:
+            self._exchanges.clear()
+
+    def attach(self) -> int:
+        """
+        Прикладывает к отчёту Allure cURL-команды и ответы из буфера и очищает его.
+
+        Returns:
+            int: Количество приложенных обменов.
+        """
+        with self._lock:
+            exchanges = list(self._exchanges)
+            self._exchanges.clear()
+
+        for exchange in exchanges:
+            allure.attach(
+                make_curl_request(exchange.request),
+                "cURL command",
+                allure.attachment_type.TEXT,
+            )
+            if exchange.response is not None:
+                allure.attach(
+                    make_response_text(exchange.response),
+                    "HTTP response",
+                    allure.attachment_type.TEXT,
+                )
+
+        return len(exchanges)
+
+
+def make_response_text(response: Response) -> str:
+    """
+    Функция преобразует httpx.Response в текст: строка статуса, заголовки и тело.
+
+    Args:
+        response (Response): Объект httpx.Response.
+
+    Returns:
+        str: Текстовое представление ответа.
+    """
+    items = [f"{response.http_version} {response.status_code} {response.reason_phrase}"]
+    items.extend(f"{header}: {value}" for header, value in response.headers.items())
+
+    try:
+        body = response.text
+    except ResponseNotRead:
+        body = "<тело ответа не прочитано>"
+
+    return "\n".join(items) + f"\n\n{body}"
+
+
+http_exchanges = HTTPExchangeBuffer(max_size=settings.REPORTING.CURL_BUFFER_SIZE)
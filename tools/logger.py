@@ -1,10 +1,162 @@
+import atexit
+import itertools
+import json
 import logging
+import os
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import IO
+
+from config import settings
+
+LOG_FORMAT = "%(asctime)s | %(name)s | %(levelname)s | %(message)s"
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Форматтер, записывающий каждую запись лога одной JSON-строкой.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": self.formatTime(record),
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+            "worker": os.environ.get("PYTEST_XDIST_WORKER", "master"),
+        }
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(data, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Фильтр, пропускающий только каждую every-ю запись логгера.
+    """
+
+    def __init__(self, every: int):
+        """
+        Args:
+            every (int): Шаг выборки: 10 означает, что записывается каждая 10-я запись.
+        """
+        super().__init__()
+        self.every = every
+        self._counter = itertools.count()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return next(self._counter) % self.every == 0
+
+
+class LogQueueHandler(QueueHandler):
+    """
+    QueueHandler без копирования записи в потоке вызова.
+
+    Стандартный prepare форматирует запись и копирует её; здесь в потоке
+    вызова только подставляются аргументы сообщения, а форматирование
+    выполняет фоновый поток.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+class LoggingPipeline:
+    """
+    Неблокирующий вывод логов через QueueHandler/QueueListener.
+
+    Логгеры только помещают записи в очередь, а форматирование и запись в
+    консоль и JSON-файл выполняются одним фоновым потоком на процесс.
+    """
+
+    def __init__(self, stream: IO[str] | None = None, json_file: Path | None = None):
+        """
+        Args:
+            stream (IO[str] | None): Поток для текстового вывода. По умолчанию sys.stderr.
+            json_file (Path | None): Файл для структурированных логов в формате JSON Lines.
+        """
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self.handler = LogQueueHandler(self._queue)
+
+        stream_handler = logging.StreamHandler(stream or sys.stderr)
+        stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        handlers: list[logging.Handler] = [stream_handler]
+
+        if json_file is not None:
+            json_file.parent.mkdir(parents=True, exist_ok=True)
+            file_handler = logging.FileHandler(json_file, encoding="utf-8")
+            file_handler.setFormatter(JSONFormatter())
+            handlers.append(file_handler)
+
+        self._listener = QueueListener(self._queue, *handlers)
+        self._started = False
+
+    def attach(
+        self, logger: logging.Logger, level: int | str, sampling: int | None = None
+    ) -> None:
+        """
+        Подключает логгер к очереди. Повторный вызов для того же логгера ничего не делает.
+
+        Args:
+            logger (logging.Logger): Логгер для подключения.
+            level (int | str): Уровень логгера.
+            sampling (int | None): Шаг выборки записей. 0 отключает логгер,
+                None или 1 оставляет все записи.
+        """
+        with self._lock:
+            if self.handler in logger.handlers:
+                return
+
+            logger.setLevel(level)
+            if sampling == 0:
+                logger.disabled = True
+            elif sampling is not None and sampling > 1:
+                logger.addFilter(SamplingFilter(sampling))
+            logger.addHandler(self.handler)
+
+            if not self._started:
+                self._listener.start()
+                self._started = True
+
+    def stop(self) -> None:
+        """
+        Дописывает все записи из очереди и останавливает фоновый поток.
+        """
+        with self._lock:
+            if self._started:
+                self._listener.stop()
+                self._started = False
+
+
+def _create_pipeline() -> LoggingPipeline:
+    json_file = None
+    if settings.LOGGING.JSON_LOGS:
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+        json_file = settings.LOGGING.JSON_LOGS_DIR / f"{worker}.jsonl"
+
+    return LoggingPipeline(json_file=json_file)
+
+
+_pipeline = _create_pipeline()
+atexit.register(_pipeline.stop)
 
 
 def get_logger(name: str) -> logging.Logger:
     """
-    Функция для получения логгера с заданным именем и
-      настройками StreamHeandler, logging.DEBUG.
+    Функция для получения логгера с заданным именем, подключённого
+      к общей очереди логов процесса.
+
+    Уровень задаётся settings.LOGGING.LEVEL, а для логгеров из
+    settings.LOGGING.SAMPLING пишется только каждая N-я запись
+    (0 отключает логгер).
 
     Args:
         name (str): Имя логгера.
@@ -13,13 +165,10 @@ def get_logger(name: str) -> logging.Logger:
         logging.Logger: настроенный логгер.
     """
     logger = logging.getLogger(name)
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter(
-        "%(asctime)s | %(name)s | %(levelname)s | %(message)s"
+    _pipeline.attach(
+        logger,
+        level=settings.LOGGING.LEVEL,
+        sampling=settings.LOGGING.SAMPLING.get(name),
     )
-    handler.setLevel(logging.DEBUG)
-    handler.setFormatter(formatter)
-    logger.setLevel(logging.DEBUG)
-    logger.addHandler(handler)
 
     return logger
@@ -0,0 +1,33 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+_recorded: ContextVar[bool] = ContextVar("recorded", default=True)
+
+
+@contextmanager
+def not_recorded() -> Iterator[None]:
+    """
+    Контекстный менеджер для запросов, которые не относятся к текущему тесту.
+
+    Внутри блока (например, при фоновом досоздании сущностей пула) запросы
+    не попадают в буфер HTTP-обменов теста и вложения cURL, не открывают
+    шаги Allure и не учитываются в статистике пула соединений за тест.
+    Общие для процесса счётчики, задержки эндпоинтов и проверка по
+    JSON-схеме работают как обычно.
+    """
+    token = _recorded.set(False)
+    try:
+        yield
+    finally:
+        _recorded.reset(token)
+
+
+def is_recorded() -> bool:
+    """
+    Функция возвращает, относятся ли запросы текущего контекста к тесту.
+
+    Returns:
+        bool: False внутри not_recorded, иначе True.
+    """
+    return _recorded.get()
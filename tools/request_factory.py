@@ -0,0 +1,210 @@
+import os
+import random
+import threading
+from typing import Any, Callable, Sequence, TypeVar
+
+from pydantic import BaseModel
+
+from clients.courses.courses_schema import CreateCourseRequestSchema
+from clients.exercises.exercises_schema import CreateExerciseRequestSchema
+from clients.users.users_schema import CreateUserRequestSchema
+from tools.fakers import Fake, fake
+
+T = TypeVar("T", bound=BaseModel)
+
+# Размер пула значений одного поля. Генерация пулов всех полей занимает
+# доли секунды, а повторы текстов и имён в нагрузочных данных не мешают.
+POOL_SIZE = 1000
+
+
+class ColumnPools:
+    """
+    Пулы заранее сгенерированных значений полей.
+
+    Пул метода Fake создаётся при первом обращении, после чего значения
+    для пачки запросов выбираются из него случайным образом. Поля, которые
+    должны быть уникальными (идентификаторы, email), генерируются отдельно.
+    """
+
+    def __init__(self, fake: Fake, size: int = POOL_SIZE, seed: int | None = None):
+        """
+        Args:
+            fake (Fake): Генератор значений, из которого заполняются пулы.
+            size (int): Количество значений в пуле одного поля.
+            seed (int | None): Зерно выбора значений из пулов.
+        """
+        self.fake = fake
+        self.size = size
+        self.random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._pools: dict[str, list[Any]] = {}
+
+    def sample(self, name: str, count: int) -> list[Any]:
+        """
+        Возвращает count значений из пула метода Fake с именем name.
+
+        Args:
+            name (str): Имя метода Fake (например, "sentence" или "text").
+            count (int): Количество значений.
+
+        Returns:
+            list[Any]: Значения, выбранные из пула.
+        """
+        pool = self._pools.get(name)
+        if pool is None:
+            with self._lock:
+                pool = self._pools.get(name)
+                if pool is None:
+                    generate = getattr(self.fake, name)
+                    pool = self._pools[name] = [generate() for _ in range(self.size)]
+
+        return self.random.choices(pool, k=count)
+
+    def uuids(self, count: int) -> list[str]:
+        """
+        Возвращает count уникальных UUID4 в строковом виде.
+
+        Случайные байты всех UUID читаются одним вызовом os.urandom:
+        uuid.uuid4() читает их на каждый UUID и в несколько раз медленнее.
+        """
+        digits = os.urandom(16 * count).hex()
+        uuids = []
+        for start in range(0, 32 * count, 32):
+            value = digits[start : start + 32]
+            variant = "89ab"[int(value[16], 16) & 3]
+            uuids.append(
+                f"{value[:8]}-{value[8:12]}-4{value[13:16]}-"
+                f"{variant}{value[17:20]}-{value[20:]}"
+            )
+        return uuids
+
+    def emails(self, count: int) -> list[str]:
+        """
+        Возвращает count уникальных email: случайный префикс и адрес из пула.
+        """
+        digits = os.urandom(6 * count).hex()
+        return [
+            f"{digits[index * 12 : index * 12 + 12]}.{email}"
+            for index, email in enumerate(self.sample("email", count))
+        ]
+
+
+# Генераторы столбцов для каждой схемы: имя поля -> функция (pools, count).
+COLUMNS: dict[type[BaseModel], dict[str, Callable[[ColumnPools, int], list[Any]]]] = {
+    CreateUserRequestSchema: {
+        "email": ColumnPools.emails,
+        "password": lambda pools, count: pools.sample("password", count),
+        "last_name": lambda pools, count: pools.sample("last_name", count),
+        "first_name": lambda pools, count: pools.sample("first_name", count),
+        "middle_name": lambda pools, count: pools.sample("middle_name", count),
+    },
+    CreateCourseRequestSchema: {
+        "title": lambda pools, count: pools.sample("sentence", count),
+        "min_score": lambda pools, count: pools.sample("min_score", count),
+        "max_score": lambda pools, count: pools.sample("max_score", count),
+        "description": lambda pools, count: pools.sample("text", count),
+        "estimated_time": lambda pools, count: pools.sample("estimated_time", count),
+        "preview_file_id": ColumnPools.uuids,
+        "created_by_user_id": ColumnPools.uuids,
+    },
+    CreateExerciseRequestSchema: {
+        "title": lambda pools, count: pools.sample("sentence", count),
+        "course_id": ColumnPools.uuids,
+        "max_score": lambda pools, count: pools.sample("max_score", count),
+        "min_score": lambda pools, count: pools.sample("min_score", count),
+        "order_index": lambda pools, count: pools.sample("integer", count),
+        "description": lambda pools, count: pools.sample("text", count),
+        "estimated_time": lambda pools, count: pools.sample("estimated_time", count),
+    },
+}
+
+
+def construct_unchecked(schema: type[T], values: dict[str, Any]) -> T:
+    """
+    Создаёт модель из значений всех её полей без валидации.
+
+    Устанавливает те же атрибуты, что и BaseModel.model_construct, но без
+    обработки алиасов и значений по умолчанию, поэтому в несколько раз
+    быстрее и model_construct, и обычного конструктора. Подходит только для
+    моделей без extra-полей и приватных атрибутов и значений, заведомо
+    соответствующих типам полей.
+
+    Args:
+        schema (type[T]): Класс модели.
+        values (dict[str, Any]): Значения всех полей по их именам.
+
+    Returns:
+        T: Экземпляр модели.
+    """
+    model = schema.__new__(schema)
+    object.__setattr__(model, "__dict__", values)
+    object.__setattr__(model, "__pydantic_fields_set__", set(values))
+    object.__setattr__(model, "__pydantic_extra__", None)
+    object.__setattr__(model, "__pydantic_private__", None)
+    return model
+
+
+def build_requests(
+    schema: type[T],
+    count: int,
+    validate: bool = False,
+    pools: ColumnPools | None = None,
+    **overrides: Any,
+) -> list[T]:
+    """
+    Создаёт count запросов на создание сущностей одним вызовом.
+
+    Значения полей выбираются из пулов по столбцам, а не генерируются Faker
+    для каждого поля каждого запроса, как default_factory схем. 100 000
+    запросов создаются за секунды.
+
+    Args:
+        schema (type[T]): Схема запроса: CreateUserRequestSchema,
+            CreateCourseRequestSchema или CreateExerciseRequestSchema.
+        count (int): Количество запросов.
+        validate (bool): Проверять значения через model_validate. По умолчанию
+            модели создаются без валидации (construct_unchecked).
+        pools (ColumnPools | None): Пулы значений. По умолчанию общие пулы
+            column_pools.
+        **overrides: Значения полей по их именам: одно значение для всех
+            запросов или последовательность из count значений
+            (например, course_id=course_id или course_id=course_ids).
+
+    Returns:
+        list[T]: Запросы в порядке генерации.
+
+    Raises:
+        KeyError: Если для схемы не описаны генераторы столбцов.
+        ValueError: Если в overrides передано неизвестное поле или
+            последовательность не из count значений.
+    """
+    pools = pools or column_pools
+    generators = COLUMNS[schema]
+    if unknown := set(overrides) - set(generators):
+        raise ValueError(f"У схемы {schema.__name__} нет полей {sorted(unknown)}")
+
+    columns: dict[str, Sequence[Any]] = {}
+    for name, generate in generators.items():
+        if name not in overrides:
+            columns[name] = generate(pools, count)
+            continue
+
+        value = overrides[name]
+        if isinstance(value, Sequence) and not isinstance(value, str):
+            if len(value) != count:
+                raise ValueError(
+                    f"Для поля {name} передано {len(value)} значений вместо {count}"
+                )
+            columns[name] = value
+        else:
+            columns[name] = [value] * count
+
+    names = list(columns)
+    rows = (dict(zip(names, row)) for row in zip(*columns.values()))
+    if validate:
+        return [schema.model_validate(values) for values in rows]
+
+    return [construct_unchecked(schema, values) for values in rows]
+
+
+column_pools = ColumnPools(fake)
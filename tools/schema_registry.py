@@ -0,0 +1,195 @@
+import hashlib
+import inspect
+import json
+import os
+import threading
+import typing
+from pathlib import Path
+from typing import Any, Iterable
+
+import pydantic
+from pydantic import BaseModel
+
+from config import settings
+from tools.logger import get_logger
+
+
+logger = get_logger("SCHEMA_REGISTRY")
+
+
+def get_model_dependencies(model_class: type[BaseModel]) -> list[type[BaseModel]]:
+    """
+    Функция возвращает класс модели, его базовые модели и все вложенные модели полей.
+
+    Args:
+        model_class (type[BaseModel]): Класс pydantic-модели.
+
+    Returns:
+        list[type[BaseModel]]: Модели в порядке обхода, без повторов.
+    """
+    dependencies: dict[type[BaseModel], None] = {}
+    pending: list[Any] = [model_class]
+    while pending:
+        annotation = pending.pop()
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            if annotation is BaseModel or annotation in dependencies:
+                continue
+
+            dependencies[annotation] = None
+            pending.extend(annotation.__bases__)
+            pending.extend(
+                field.annotation for field in annotation.model_fields.values()
+            )
+        else:
+            pending.extend(typing.get_args(annotation))
+
+    return list(dependencies)
+
+
+def get_model_hash(model_class: type[BaseModel]) -> str | None:
+    """
+    Функция вычисляет хеш исходного кода модели и всех моделей, от которых она зависит.
+
+    Любое изменение полей, алиасов или конфигурации моделей (как и обновление
+    pydantic) меняет хеш, поэтому устаревшая схема с диска не используется.
+
+    Args:
+        model_class (type[BaseModel]): Класс pydantic-модели.
+
+    Returns:
+        str | None: SHA-256 исходного кода или None, если код модели недоступен
+            (например, для классов, созданных динамически).
+    """
+    digest = hashlib.sha256(pydantic.VERSION.encode())
+    for dependency in get_model_dependencies(model_class):
+        try:
+            source = inspect.getsource(dependency)
+        except (OSError, TypeError):
+            return None
+
+        digest.update(f"{dependency.__module__}.{dependency.__qualname__}".encode())
+        digest.update(source.encode())
+
+    return digest.hexdigest()
+
+
+class SchemaRegistry:
+    """
+    Реестр JSON-схем моделей ответов с кешем на диске.
+
+    Схема модели генерируется один раз и сохраняется в каталог кеша под
+    хешем исходного кода модели. Остальные процессы (например, xdist-воркеры)
+    читают готовую схему из файла, а не генерируют её заново.
+
+    Кроме того, реестр хранит соответствие (метод, шаблон маршрута, статус)
+    модели ответа, по которому схема ответа находится автоматически.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """
+        Args:
+            cache_dir (Path): Каталог для JSON-схем, общий для всех воркеров.
+        """
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._schemas: dict[type[BaseModel], dict[str, Any]] = {}
+        self._responses: dict[tuple[str, str, int], type[BaseModel]] = {}
+
+    def register_response(
+        self, method: str, route: str, status: int, model_class: type[BaseModel]
+    ) -> None:
+        """
+        Регистрирует модель ответа эндпоинта для заданного статуса.
+
+        Args:
+            method (str): HTTP-метод (например, "GET").
+            route (str): Шаблон маршрута (например, "/api/v1/courses/{course_id}").
+            status (int): Код статуса ответа.
+            model_class (type[BaseModel]): Модель тела ответа.
+        """
+        self._responses[(method.upper(), route, int(status))] = model_class
+
+    def get_response_model(
+        self, method: str, route: str, status: int
+    ) -> type[BaseModel] | None:
+        """
+        Возвращает модель ответа эндпоинта для заданного статуса.
+
+        Args:
+            method (str): HTTP-метод.
+            route (str): Шаблон маршрута.
+            status (int): Код статуса ответа.
+
+        Returns:
+            type[BaseModel] | None: Модель ответа или None, если она не зарегистрирована.
+        """
+        return self._responses.get((method.upper(), route, int(status)))
+
+    def get_schema(self, model_class: type[BaseModel]) -> dict[str, Any]:
+        """
+        Возвращает JSON-схему модели из памяти, с диска или генерирует её.
+
+        Args:
+            model_class (type[BaseModel]): Класс pydantic-модели.
+
+        Returns:
+            dict[str, Any]: JSON-схема модели.
+        """
+        with self._lock:
+            schema = self._schemas.get(model_class)
+        if schema is not None:
+            return schema
+
+        model_hash = get_model_hash(model_class)
+        path = self._get_path(model_class, model_hash) if model_hash else None
+        schema = self._read(path) if path else None
+        if schema is None:
+            schema = model_class.model_json_schema()
+            if path:
+                self._write(path, schema)
+
+        with self._lock:
+            return self._schemas.setdefault(model_class, schema)
+
+    def build(self, models: Iterable[type[BaseModel]] | None = None) -> int:
+        """
+        Генерирует и сохраняет на диск схемы моделей, которых ещё нет в кеше.
+
+        Args:
+            models (Iterable[type[BaseModel]] | None): Модели для сборки.
+                По умолчанию все зарегистрированные модели ответов.
+
+        Returns:
+            int: Количество схем в реестре после сборки.
+        """
+        models = set(self._responses.values() if models is None else models)
+        for model_class in models:
+            self.get_schema(model_class)
+
+        return len(models)
+
+    def _get_path(self, model_class: type[BaseModel], model_hash: str) -> Path:
+        name = f"{model_class.__module__}.{model_class.__qualname__}"
+        return self.cache_dir / f"{name}-{model_hash[:16]}.json"
+
+    @staticmethod
+    def _read(path: Path) -> dict[str, Any] | None:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    @staticmethod
+    def _write(path: Path, schema: dict[str, Any]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Имя уникально для процесса и потока: потоки одного воркера могут
+        # одновременно сохранять схему одной модели.
+        temp_path = path.with_suffix(
+            f"{path.suffix}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        temp_path.write_text(json.dumps(schema), encoding="utf-8")
+        os.replace(temp_path, path)
+        logger.debug(f"JSON-схема сохранена в {path}")
+
+
+schema_registry = SchemaRegistry(cache_dir=settings.SCHEMA_VALIDATION.CACHE_DIR)
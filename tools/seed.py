@@ -0,0 +1,512 @@
+"""
+Наполнение сервера тестовыми данными для нагрузочных прогонов.
+
+Пользователи, файлы, курсы и упражнения создаются методами *_api доменных
+клиентов (create_user_api, upload_file_api, create_course_api,
+create_exercise_api) в пуле потоков с ограничением общей скорости запросов.
+Методы create_* не подходят: они проверяют ответ по схеме до возврата
+модели, и сущность, уже созданная на сервере, но не прошедшая проверку,
+не попала бы в манифест и создавалась бы повторно. Поэтому идентификатор
+читается из ответа и сразу дописывается в манифест (JSON Lines), и только
+затем ответ проверяется по схеме (--validate-schemas). Манифест служит
+и контрольной точкой: при повторном запуске с тем же манифестом создаются
+только недостающие сущности.
+
+Курс i создаётся от имени пользователя i % users с файлом превью i % files,
+упражнение j — в курсе j % courses. Все авторизованные запросы выполняются
+от имени первого пользователя манифеста.
+
+Запуск:
+    python -m tools.seed --users 10000 --files 100 --courses 50000 \\
+        --exercises 500000 --workers 32 --rate 500
+"""
+
+import argparse
+import json
+import threading
+import time
+from http import HTTPStatus
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from pydantic import BaseModel
+
+from clients.api_coverage import tracker
+from clients.api_response import ApiResponse
+from clients.authentication.authentication_schema import AuthenticationUserSchema
+from clients.courses.courses_client import get_courses_client
+from clients.courses.courses_schema import (
+    CourseResponseSchema,
+    CreateCourseRequestSchema,
+)
+from clients.exercises.exercises_client import get_exercises_client
+from clients.exercises.exercises_schema import (
+    CreateExerciseRequestSchema,
+    ExerciseResponseSchema,
+)
+from clients.files.files_client import get_files_client
+from clients.files.files_schema import UploadFileRequestSchema, UploadFileResponseSchema
+from clients.users.public_users_client import get_public_users_client
+from clients.users.users_schema import CreateUserRequestSchema, UserResponseSchema
+from config import settings
+from tools.assertions.schema import validate_json_schema
+from tools.cleanup_registry import cleanup_registry
+from tools.console_output_formatter import print_dict
+from tools.fan_out import fan_out
+from tools.logger import get_logger
+
+
+logger = get_logger("SEED")
+
+KINDS = ("users", "files", "courses", "exercises")
+
+# Сущности, которые должны быть в манифесте до создания сущностей типа:
+# файлы, курсы и упражнения создаются от имени первого пользователя.
+PREREQUISITES = {
+    "users": (),
+    "files": ("users",),
+    "courses": ("users", "files"),
+    "exercises": ("users", "courses"),
+}
+
+# Модель ответа и ключ объекта сущности в теле ответа на создание.
+RESPONSES: dict[str, tuple[type[BaseModel], str]] = {
+    "users": (UserResponseSchema, "user"),
+    "files": (UploadFileResponseSchema, "file"),
+    "courses": (CourseResponseSchema, "course"),
+    "exercises": (ExerciseResponseSchema, "exercise"),
+}
+
+
+class SeedManifest:
+    """
+    Манифест созданных сущностей в формате JSON Lines.
+
+    Каждая строка — одна сущность: {"kind": ..., "index": ..., "id": ..., ...}.
+    Для пользователей сохраняются email и password, для курсов — user_id и
+    file_id, для упражнений — course_id. Строки дописываются сразу после
+    создания сущности, поэтому манифест прерванного запуска остаётся
+    корректной контрольной точкой (неполная последняя строка пропускается).
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path (Path): Путь к файлу манифеста.
+        """
+        self.path = path
+        self.records: dict[str, dict[int, dict[str, Any]]] = {
+            kind: {} for kind in KINDS
+        }
+        self._lock = threading.Lock()
+        self._file = None
+
+    @classmethod
+    def load(cls, path: Path) -> "SeedManifest":
+        """
+        Читает манифест с диска. Отсутствующий файл — пустой манифест.
+
+        Args:
+            path (Path): Путь к файлу манифеста.
+
+        Returns:
+            SeedManifest: Манифест с прочитанными записями.
+        """
+        manifest = cls(path)
+        if not path.exists():
+            return manifest
+
+        with path.open(encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                manifest.records[record["kind"]][record["index"]] = record
+
+        return manifest
+
+    def ids(self, kind: str) -> list[str]:
+        """
+        Возвращает идентификаторы сущностей типа kind в порядке индексов.
+
+        Args:
+            kind (str): Тип сущности ("users", "files", "courses", "exercises").
+
+        Returns:
+            list[str]: Идентификаторы сущностей.
+        """
+        records = self.records[kind]
+        return [records[index]["id"] for index in sorted(records)]
+
+    def users(self) -> list[AuthenticationUserSchema]:
+        """
+        Возвращает данные для входа созданных пользователей в порядке индексов.
+        """
+        records = self.records["users"]
+        return [
+            AuthenticationUserSchema(
+                email=records[index]["email"], password=records[index]["password"]
+            )
+            for index in sorted(records)
+        ]
+
+    def missing(self, kind: str, count: int) -> list[int]:
+        """
+        Возвращает индексы сущностей типа kind, которых ещё нет в манифесте.
+
+        Args:
+            kind (str): Тип сущности.
+            count (int): Требуемое количество сущностей.
+
+        Returns:
+            list[int]: Индексы несозданных сущностей.
+        """
+        return [index for index in range(count) if index not in self.records[kind]]
+
+    def add(self, kind: str, index: int, entity_id: str, **fields: Any) -> None:
+        """
+        Добавляет сущность в манифест и сразу дописывает её на диск.
+
+        Args:
+            kind (str): Тип сущности.
+            index (int): Порядковый номер сущности.
+            entity_id (str): Идентификатор сущности.
+            **fields: Дополнительные поля записи.
+        """
+        record = {"kind": kind, "index": index, "id": entity_id, **fields}
+        line = json.dumps(record, separators=(",", ":"), ensure_ascii=False)
+        with self._lock:
+            self.records[kind][index] = record
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a", encoding="utf-8")
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        """
+        Закрывает файл манифеста.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class RateLimiter:
+    """
+    Ограничение общей скорости запросов всех потоков.
+
+    Каждый вызов wait() занимает следующий свободный интервал 1 / rate
+    и при необходимости ждёт его начала.
+    """
+
+    def __init__(self, rate: float):
+        """
+        Args:
+            rate (float): Запросов в секунду. 0 отключает ограничение.
+        """
+        self.interval = 1 / rate if rate > 0 else 0
+        self._lock = threading.Lock()
+        self._next = time.monotonic()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next, now)
+            self._next = slot + self.interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def record_created(
+    manifest: SeedManifest,
+    kind: str,
+    index: int,
+    response: ApiResponse,
+    validate_schemas: bool,
+    **fields: Any,
+) -> None:
+    """
+    Дописывает созданную сущность в манифест и при необходимости проверяет
+    ответ по JSON-схеме.
+
+    Идентификатор берётся из тела ответа без валидации модели и записывается
+    до проверки схемы: сущность с несоответствующим схеме ответом уже создана
+    на сервере и при повторном запуске не должна создаваться заново.
+
+    Args:
+        manifest (SeedManifest): Манифест.
+        kind (str): Тип сущности.
+        index (int): Порядковый номер сущности.
+        response (ApiResponse): Ответ на запрос создания.
+        validate_schemas (bool): Проверять ли ответ по JSON-схеме.
+        **fields: Дополнительные поля записи манифеста.
+
+    Raises:
+        RuntimeError: Если сервер не создал сущность.
+        ValidationError: Если ответ не соответствует схеме.
+    """
+    if response.status_code != HTTPStatus.OK:
+        raise RuntimeError(f"HTTP {response.status_code}: {response.text[:200]}")
+
+    model_class, key = RESPONSES[kind]
+    manifest.add(kind, index, response.json()[key]["id"], **fields)
+    if validate_schemas:
+        validate_json_schema(response.json(), model_class)
+
+
+def batched(items: Iterable[int], size: int) -> Iterator[list[int]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def seed_kind(
+    kind: str,
+    indexes: list[int],
+    create: Callable[[int], None],
+    workers: int,
+    limiter: RateLimiter,
+) -> dict[str, Any]:
+    """
+    Создаёт сущности одного типа порциями в пуле потоков.
+
+    Ошибка создания одной сущности не прерывает наполнение: сущность
+    не попадает в манифест и будет создана при следующем запуске.
+
+    Args:
+        kind (str): Тип сущности.
+        indexes (list[int]): Индексы несозданных сущностей.
+        create (Callable[[int], None]): Функция создания сущности по индексу,
+            дописывающая её в манифест.
+        workers (int): Количество потоков.
+        limiter (RateLimiter): Общее ограничение скорости запросов.
+
+    Returns:
+        dict[str, Any]: Количество созданных сущностей и ошибок, время и скорость.
+    """
+
+    def create_one(index: int) -> bool:
+        limiter.wait()
+        try:
+            create(index)
+            return True
+        except Exception as error:
+            logger.warning(
+                f"Не удалось создать {kind}[{index}]: {str(error).splitlines()[0]}"
+            )
+            return False
+
+    created = 0
+    started = time.perf_counter()
+    for batch in batched(indexes, max(workers, 1) * 50):
+        created += sum(fan_out(create_one, batch, workers))
+        logger.info(f"{kind}: создано {created} из {len(indexes)}")
+
+    duration = time.perf_counter() - started
+    return {
+        "created": created,
+        "errors": len(indexes) - created,
+        "duration": round(duration, 1),
+        "per_second": round(created / duration, 1) if duration else 0,
+    }
+
+
+def main(
+    counts: dict[str, int],
+    manifest_path: Path,
+    workers: int,
+    rate: float,
+    validate_schemas: bool,
+) -> None:
+    # Сущности наполнения не удаляются в конце процесса. Ответы проверяются
+    # по схеме только после записи в манифест (record_created), а не
+    # автоматически в ApiClient. Покрытие swagger не сохраняется: каждый
+    # запрос записал бы файл в coverage-results.
+    cleanup_registry.enabled = False
+    settings.SCHEMA_VALIDATION.AUTO = False
+    tracker.enabled = False
+
+    manifest = SeedManifest.load(manifest_path)
+    limiter = RateLimiter(rate)
+    public_users_client = get_public_users_client()
+
+    def create_user(index: int) -> None:
+        request = CreateUserRequestSchema()
+        response = public_users_client.create_user_api(request)
+        record_created(
+            manifest,
+            "users",
+            index,
+            response,
+            validate_schemas,
+            email=request.email,
+            password=request.password,
+        )
+
+    result = {}
+    skipped = {}
+    error = None
+    try:
+        for kind in KINDS:
+            indexes = manifest.missing(kind, counts[kind])
+            skipped[kind] = counts[kind] - len(indexes)
+            if not indexes:
+                continue
+
+            if absent := [
+                required
+                for required in PREREQUISITES[kind]
+                if not manifest.records[required]
+            ]:
+                error = (
+                    f"Наполнение остановлено: для создания {kind} в манифесте "
+                    f"нет ни одной сущности типа {', '.join(absent)}"
+                )
+                logger.error(error)
+                break
+
+            if kind == "users":
+                create = create_user
+            else:
+                create = get_creator(kind, manifest, validate_schemas)
+            result[kind] = seed_kind(kind, indexes, create, workers, limiter)
+    finally:
+        manifest.close()
+
+    print_dict(
+        {"created": result, "already_in_manifest": skipped},
+        title="Наполнение тестовыми данными",
+        message=f"Манифест: {manifest_path.resolve()}",
+    )
+    if error:
+        raise SystemExit(error)
+
+
+def get_creator(
+    kind: str, manifest: SeedManifest, validate_schemas: bool
+) -> Callable[[int], None]:
+    """
+    Возвращает функцию создания сущности типа kind по индексу.
+
+    Файлы, курсы и упражнения создаются клиентами первого пользователя
+    манифеста, поэтому сущности из PREREQUISITES[kind] к этому моменту
+    должны быть в манифесте.
+
+    Args:
+        kind (str): Тип сущности ("files", "courses" или "exercises").
+        manifest (SeedManifest): Манифест с уже созданными сущностями.
+        validate_schemas (bool): Проверять ли ответы по JSON-схемам.
+
+    Returns:
+        Callable[[int], None]: Функция создания сущности.
+    """
+    operator = manifest.users()[0]
+
+    if kind == "files":
+        files_client = get_files_client(operator)
+
+        def create_file(index: int) -> None:
+            request = UploadFileRequestSchema(
+                upload_file=settings.TEST_DATA.IMAGE_JPEG_FILE
+            )
+            response = files_client.upload_file_api(request)
+            record_created(manifest, "files", index, response, validate_schemas)
+
+        return create_file
+
+    if kind == "courses":
+        courses_client = get_courses_client(operator)
+        user_ids = manifest.ids("users")
+        file_ids = manifest.ids("files")
+
+        def create_course(index: int) -> None:
+            request = CreateCourseRequestSchema(
+                preview_file_id=file_ids[index % len(file_ids)],
+                created_by_user_id=user_ids[index % len(user_ids)],
+            )
+            response = courses_client.create_course_api(request)
+            record_created(
+                manifest,
+                "courses",
+                index,
+                response,
+                validate_schemas,
+                user_id=request.created_by_user_id,
+                file_id=request.preview_file_id,
+            )
+
+        return create_course
+
+    exercises_client = get_exercises_client(operator)
+    course_ids = manifest.ids("courses")
+
+    def create_exercise(index: int) -> None:
+        request = CreateExerciseRequestSchema(
+            course_id=course_ids[index % len(course_ids)]
+        )
+        response = exercises_client.create_exercise_api(request)
+        record_created(
+            manifest,
+            "exercises",
+            index,
+            response,
+            validate_schemas,
+            course_id=request.course_id,
+        )
+
+    return create_exercise
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--files", type=int, default=10)
+    parser.add_argument("--courses", type=int, default=500)
+    parser.add_argument("--exercises", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=0,
+        help="Максимум запросов в секунду для всех потоков, 0 — без ограничения",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        default=Path("./seed-manifest.jsonl"),
+        help="Манифест созданных сущностей, он же контрольная точка",
+    )
+    parser.add_argument(
+        "--validate-schemas",
+        action="store_true",
+        help="Проверять ответы на создание по JSON-схемам",
+    )
+    args = parser.parse_args()
+
+    if args.users < 1 or (args.courses and not args.files):
+        parser.error(
+            "нужен хотя бы один пользователь, а для курсов — хотя бы один файл"
+        )
+    if args.exercises and not args.courses:
+        parser.error("для упражнений нужен хотя бы один курс")
+
+    main(
+        counts={
+            "users": args.users,
+            "files": args.files,
+            "courses": args.courses,
+            "exercises": args.exercises,
+        },
+        manifest_path=args.manifest,
+        workers=args.workers,
+        rate=args.rate,
+        validate_schemas=args.validate_schemas,
+    )
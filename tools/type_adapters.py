@@ -0,0 +1,47 @@
+from functools import lru_cache
+from typing import TypeVar
+
+from pydantic import TypeAdapter
+
+from config import settings
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(annotation: type[T]) -> TypeAdapter[T]:
+    """
+    Функция возвращает TypeAdapter для типа, создавая его один раз за процесс.
+
+    Args:
+        annotation (type[T]): Тип для валидации: модель или, например,
+            list[CourseSchema].
+
+    Returns:
+        TypeAdapter[T]: Закешированный адаптер типа.
+    """
+    return TypeAdapter(annotation)
+
+
+def validate_json(
+    content: str | bytes, annotation: type[T], strict: bool | None = None
+) -> T:
+    """
+    Функция валидирует JSON напрямую из байтов через закешированный TypeAdapter.
+
+    Args:
+        content (str | bytes): Тело ответа.
+        annotation (type[T]): Ожидаемый тип.
+        strict (bool | None): Строгий режим валидации без приведения типов.
+            По умолчанию берётся из settings.PARSING.STRICT.
+
+    Returns:
+        T: Провалидированное значение.
+
+    Raises:
+        ValidationError: Если JSON не соответствует типу.
+    """
+    if strict is None:
+        strict = settings.PARSING.STRICT
+
+    return get_type_adapter(annotation).validate_json(content, strict=strict)